@@ -12,15 +12,163 @@ Fecha: Julio 2025
 
 import os
 import json
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Union
 
 # Importar funciones comunes
 from utils_common import get_season_name_from_url, get_torneo_id, sanitize_dir_name
 
 
+# Valores por defecto compartidos (solo lectura) para evitar crear {} / [] por partido
+_EMPTY: Dict = {}
+_EMPTY_LIST: List = []
+
+_DATE_FORMATS = ('%Y-%m-%d', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S')
+
+
+@lru_cache(maxsize=4096)
+def _process_date(fecha_raw: str) -> Optional[str]:
+    """
+    Procesa y normaliza fechas.
+    
+    Los partidos de una temporada comparten pocas fechas distintas, por lo que
+    el resultado se memoiza para no volver a parsear la misma cadena.
+    
+    Args:
+        fecha_raw (str): Fecha en formato raw desde JSON
+        
+    Returns:
+        Optional[str]: Fecha procesada en formato YYYY-MM-DD o None
+    """
+    if not fecha_raw:
+        return None
+        
+    try:
+        # Manejar formato ISO con Z
+        if fecha_raw.endswith('Z'):
+            fecha_dt = datetime.fromisoformat(fecha_raw.replace("Z", ""))
+            return fecha_dt.date().isoformat()
+        
+        # Manejar otros formatos comunes
+        for fmt in _DATE_FORMATS:
+            try:
+                fecha_dt = datetime.strptime(fecha_raw, fmt)
+                return fecha_dt.date().isoformat()
+            except ValueError:
+                continue
+        
+        # Si no se puede parsear, devolver como string
+        return str(fecha_raw)
+        
+    except Exception as e:
+        print(f"⚠️  Error procesando fecha {fecha_raw}: {e}")
+        return str(fecha_raw) if fecha_raw else None
+
+
+def _extract_match_data(partido: Dict, season_meta: Dict, url_prefix: str) -> Optional[Dict]:
+    """
+    Extrae datos de un partido individual.
+    
+    Función de módulo (sin despacho de métodos) porque se llama una vez por
+    partido; los datos de la temporada llegan ya resueltos en ``season_meta``.
+    
+    Args:
+        partido (Dict): Datos del partido desde el JSON
+        season_meta (Dict): Campos de la temporada ya extraídos
+        url_prefix (str): Prefijo de URL de la temporada
+        
+    Returns:
+        Optional[Dict]: Diccionario con datos del partido o None si hay error
+    """
+    match_info = partido.get('matchInfo')
+    if not match_info:
+        return None
+
+    get = match_info.get
+    contestants = get('contestant') or _EMPTY_LIST
+    if len(contestants) < 2:
+        return None
+
+    partido_id = get('id')
+    fecha_raw = get('date')
+    
+    # Información de equipos (la guarda anterior asegura al menos dos)
+    local, visitante = contestants[0], contestants[1]
+    equipo_local = local.get('name') if local else None
+    equipo_visitante = visitante.get('name') if visitante else None
+    
+    # Información del estadio
+    venue_info = get('venue') or _EMPTY
+    weather = get('weather') or _EMPTY
+    
+    return {
+        'Fecha': _process_date(fecha_raw),
+        'Fecha_Raw': fecha_raw,
+        'Hora': get('time'),
+        'Equipo_Local': equipo_local,
+        'Equipo_Visitante': equipo_visitante,
+        'Estadio': venue_info.get('shortName') or venue_info.get('longName'),
+        'Partido_ID': partido_id,
+        **season_meta,
+        'URL_Partido': f"{url_prefix}{partido_id}/player-stats" if url_prefix else "",
+        'Estado_Partido': get('matchStatus'),
+        'Nivel_Cobertura': get('coverageLevel'),
+        'Ultima_Actualizacion': get('lastUpdated'),
+        'Asistencia': get('attendance'),
+        'Clima_Temperatura': weather.get('temperature'),
+        'Clima_Condiciones': weather.get('conditions')
+    }
+
+
+# Columnas con pocos valores distintos repetidos en muchas filas
+_CATEGORICAL_COLUMNS = [
+    'Continente', 'Pais', 'Competicion', 'ID_Competicion', 'Torneo_ID',
+    'Temporada', 'Estado_Partido', 'Nivel_Cobertura', 'Clima_Condiciones'
+]
+
+
+def _to_categorical(df_partidos: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convierte las columnas de texto repetitivas a dtype ``category``.
+    
+    Reduce memoria y tamaño del Parquet (columnas codificadas por diccionario).
+    
+    Args:
+        df_partidos (pd.DataFrame): DataFrame de partidos
+        
+    Returns:
+        pd.DataFrame: El mismo DataFrame con las columnas convertidas
+    """
+    columns = [col for col in _CATEGORICAL_COLUMNS if col in df_partidos.columns]
+    if columns:
+        df_partidos[columns] = df_partidos[columns].astype('category')
+    return df_partidos
+
+
+def _count_unique_teams(df_partidos: pd.DataFrame) -> int:
+    """
+    Cuenta los equipos distintos entre local y visitante.
+    
+    Concatena los arrays subyacentes en lugar de usar pd.concat, evitando
+    construir una Series intermedia con índice de 2N filas.
+    
+    Args:
+        df_partidos (pd.DataFrame): DataFrame de partidos
+        
+    Returns:
+        int: Número de equipos únicos (sin contar nulos)
+    """
+    equipos = np.concatenate([
+        df_partidos['Equipo_Local'].to_numpy(dtype=object),
+        df_partidos['Equipo_Visitante'].to_numpy(dtype=object)
+    ])
+    return pd.unique(equipos[pd.notna(equipos)]).size
+
+
 class FixtureProcessor:
     """
     Clase para procesar archivos JSON de fixtures y convertirlos en DataFrames estructurados.
@@ -67,12 +215,14 @@ class FixtureProcessor:
 
         datos_partidos = []
         
-        # Extraer información base de la temporada
+        # Extraer información base de la temporada (una sola vez por archivo)
         torneo_id = self._extract_torneo_id_from_path(json_path)
+        season_meta = self._build_season_metadata(season_row, torneo_id)
+        url_prefix = self._build_match_url_prefix(season_row, torneo_id)
         
         for partido in partidos:
             try:
-                partido_data = self._extract_match_data(partido, season_row, torneo_id)
+                partido_data = self._extract_match_data(partido, season_meta, url_prefix)
                 if partido_data:
                     datos_partidos.append(partido_data)
             except Exception as e:
@@ -100,77 +250,43 @@ class FixtureProcessor:
             print(f"⚠️  No se pudo extraer torneo_id de {json_path}: {e}")
             return None
     
-    def _extract_match_data(self, partido: Dict, season_row: pd.Series, torneo_id: str) -> Optional[Dict]:
+    def _build_season_metadata(self, season_row: pd.Series, torneo_id: str) -> Dict:
         """
-        Extrae datos de un partido individual.
+        Extrae los campos de la temporada que se repiten en cada partido.
+        
+        Se calcula una vez por fixture para evitar accesos a la Series
+        por cada partido procesado.
         
         Args:
-            partido (Dict): Datos del partido desde el JSON
             season_row (pd.Series): Información de la temporada
             torneo_id (str): ID del torneo
             
         Returns:
-            Optional[Dict]: Diccionario con datos del partido o None si hay error
+            Dict: Campos de temporada con los nombres de columna finales
         """
-        match_info = partido.get('matchInfo', {})
-        if not match_info:
-            return None
-
-        contestants = match_info.get('contestant', [])
-        if len(contestants) < 2:
-            return None
-
-        # Extraer información básica
-        partido_id = match_info.get('id')
-        fecha_raw = match_info.get('date')
-        hora = match_info.get('time')
-        
-        # Procesar fecha
-        fecha_procesada = self._process_date(fecha_raw)
-        
-        # Información de equipos
-        equipo_local = contestants[0].get('name') if contestants[0] else None
-        equipo_visitante = contestants[1].get('name') if len(contestants) > 1 else None
-        
-        # Información del estadio
-        venue_info = match_info.get('venue', {})
-        estadio = venue_info.get('shortName') or venue_info.get('longName')
-        
-        # Construir URL del partido
-        url_partido = self._build_match_url(season_row, torneo_id, partido_id)
-        
-        # Información de estado del partido
-        match_status = match_info.get('matchStatus')
-        coverage_level = match_info.get('coverageLevel')
-        last_updated = match_info.get('lastUpdated')
-        
-        # Información adicional si está disponible
-        attendance = match_info.get('attendance')
-        weather = match_info.get('weather', {})
-        
         return {
-            'Fecha': fecha_procesada,
-            'Fecha_Raw': fecha_raw,
-            'Hora': hora,
-            'Equipo_Local': equipo_local,
-            'Equipo_Visitante': equipo_visitante,
-            'Estadio': estadio,
-            'Partido_ID': partido_id,
             'Continente': season_row.get('continente'),
             'Pais': season_row.get('pais'),
             'Competicion': season_row.get('competicion'),
             'ID_Competicion': season_row.get('id_competicion'),
             'Torneo_ID': torneo_id,
             'Temporada': season_row.get('temporada'),
-            'URL_Partido': url_partido,
-            'Estado_Partido': match_status,
-            'Nivel_Cobertura': coverage_level,
-            'Ultima_Actualizacion': last_updated,
-            'Asistencia': attendance,
-            'Clima_Temperatura': weather.get('temperature'),
-            'Clima_Condiciones': weather.get('conditions')
         }
     
+    def _extract_match_data(self, partido: Dict, season_meta: Dict, url_prefix: str) -> Optional[Dict]:
+        """
+        Extrae datos de un partido individual.
+        
+        Args:
+            partido (Dict): Datos del partido desde el JSON
+            season_meta (Dict): Campos de la temporada (ver _build_season_metadata)
+            url_prefix (str): Prefijo de URL de la temporada (ver _build_match_url_prefix)
+            
+        Returns:
+            Optional[Dict]: Diccionario con datos del partido o None si hay error
+        """
+        return _extract_match_data(partido, season_meta, url_prefix)
+    
     def _process_date(self, fecha_raw: str) -> Optional[str]:
         """
         Procesa y normaliza fechas.
@@ -181,29 +297,25 @@ class FixtureProcessor:
         Returns:
             Optional[str]: Fecha procesada en formato YYYY-MM-DD o None
         """
-        if not fecha_raw:
-            return None
+        return _process_date(fecha_raw)
+    
+    def _build_match_url_prefix(self, season_row: pd.Series, torneo_id: str) -> str:
+        """
+        Construye la parte fija de la URL de los partidos de una temporada.
+        
+        Args:
+            season_row (pd.Series): Información de la temporada
+            torneo_id (str): ID del torneo
             
+        Returns:
+            str: URL hasta 'match/view/' (sin el ID del partido)
+        """
         try:
-            # Manejar formato ISO con Z
-            if fecha_raw.endswith('Z'):
-                fecha_dt = datetime.fromisoformat(fecha_raw.replace("Z", ""))
-                return fecha_dt.date().isoformat()
-            
-            # Manejar otros formatos comunes
-            for fmt in ['%Y-%m-%d', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S']:
-                try:
-                    fecha_dt = datetime.strptime(fecha_raw, fmt)
-                    return fecha_dt.date().isoformat()
-                except ValueError:
-                    continue
-            
-            # Si no se puede parsear, devolver como string
-            return str(fecha_raw)
-            
+            competicion_clean = str(season_row.get('competicion', '')).lower().replace(' ', '-')
+            return f"{self.base_url}/en_GB/soccer/{competicion_clean}/{torneo_id}/match/view/"
         except Exception as e:
-            print(f"⚠️  Error procesando fecha {fecha_raw}: {e}")
-            return str(fecha_raw) if fecha_raw else None
+            print(f"⚠️  Error construyendo URL: {e}")
+            return ""
     
     def _build_match_url(self, season_row: pd.Series, torneo_id: str, partido_id: str) -> str:
         """
@@ -217,16 +329,8 @@ class FixtureProcessor:
         Returns:
             str: URL completa del partido
         """
-        try:
-            competicion_clean = str(season_row.get('competicion', '')).lower().replace(' ', '-')
-            url = (
-                f"{self.base_url}/en_GB/soccer/{competicion_clean}/"
-                f"{torneo_id}/match/view/{partido_id}/player-stats"
-            )
-            return url
-        except Exception as e:
-            print(f"⚠️  Error construyendo URL: {e}")
-            return ""
+        url_prefix = self._build_match_url_prefix(season_row, torneo_id)
+        return f"{url_prefix}{partido_id}/player-stats" if url_prefix else ""
     
     def _get_fixture_path(self, season_row: pd.Series) -> str:
         """
@@ -265,6 +369,36 @@ class FixtureProcessor:
             print(f"❌ Error construyendo ruta para {season_row.get('competicion', 'N/A')}: {e}")
             return ""
     
+    def _scan_existing_fixtures(self) -> set:
+        """
+        Recorre el árbol de datos y devuelve las rutas de los fixture.json existentes.
+        
+        El recorrido se limita a continente/pais/competicion/temporada, que es
+        donde _get_fixture_path ubica los fixtures, sin descender a los
+        subdirectorios de partidos.
+        
+        Returns:
+            set: Rutas (con el mismo formato que _get_fixture_path) de fixture.json existentes
+        """
+        fixture_depth = 4
+        existing = set()
+        
+        def _gather(path: str, depth: int) -> None:
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if depth == fixture_depth:
+                            if entry.name == 'fixture.json' and entry.is_file():
+                                existing.add(entry.path)
+                        elif entry.is_dir():
+                            _gather(entry.path, depth + 1)
+            except OSError as e:
+                print(f"⚠️  No se pudo listar {path}: {e}")
+        
+        if os.path.isdir(self.data_dir):
+            _gather(self.data_dir, 0)
+        return existing
+    
     def crear_dataframe_partidos(self, 
                                 df_seasons: pd.DataFrame,
                                 filters: Optional[Dict] = None,
@@ -300,7 +434,13 @@ class FixtureProcessor:
             print(f"   - Temporadas después de filtros: {len(df_filtered)}")
         print(f"   - Temporadas a procesar: {len(df_filtered)}")
         
-        todos_los_partidos = []
+        # DataFrames por temporada: se construyen una vez y se reutilizan
+        # tanto para el guardado individual como para el consolidado
+        partidos_por_temporada = []
+        total_partidos = 0
+        
+        # Un único recorrido del árbol de datos en lugar de un stat() por temporada
+        existing_fixtures = self._scan_existing_fixtures()
         
         for idx, row in df_filtered.iterrows():
             try:
@@ -311,7 +451,7 @@ class FixtureProcessor:
                     self.skipped_files += 1
                     continue
                 
-                if not os.path.exists(json_path):
+                if json_path not in existing_fixtures:
                     print(f"⚠️  Archivo no encontrado: {json_path}")
                     self.skipped_files += 1
                     continue
@@ -319,15 +459,18 @@ class FixtureProcessor:
                 # Procesar fixture
                 print(f"📋 Procesando ({idx + 1}/{len(df_filtered)}): {row.get('competicion', 'N/A')} - {row.get('temporada', 'N/A')}")
                 partidos = self.procesar_fixture_json(json_path, row)
-                todos_los_partidos.extend(partidos)
-                
-                # Guardar archivo individual si se solicita
-                if save_results and save_individual and partidos:
-                    self._save_individual_results(partidos, json_path)
+                if partidos:
+                    df_temporada = _to_categorical(pd.DataFrame(partidos))
+                    partidos_por_temporada.append(df_temporada)
+                    total_partidos += len(df_temporada)
+                    
+                    # Guardar archivo individual si se solicita
+                    if save_results and save_individual:
+                        self._save_individual_results(df_temporada, json_path)
                 
                 # Mostrar progreso cada 10 archivos
                 if (idx + 1) % 10 == 0:
-                    self._print_progress(idx + 1, len(df_filtered), len(todos_los_partidos))
+                    self._print_progress(idx + 1, len(df_filtered), total_partidos)
                 
             except Exception as e:
                 print(f"❌ Error procesando temporada {idx}: {e}")
@@ -335,8 +478,8 @@ class FixtureProcessor:
                 continue
         
         # Crear DataFrame final
-        if todos_los_partidos:
-            df_partidos = pd.DataFrame(todos_los_partidos)
+        if partidos_por_temporada:
+            df_partidos = _to_categorical(pd.concat(partidos_por_temporada, ignore_index=True))
             
             # Ordenar por fecha si es posible
             if 'Fecha' in df_partidos.columns:
@@ -410,7 +553,7 @@ class FixtureProcessor:
             print(f"\n📈 Estadísticas de partidos:")
             print(f"   - Competiciones únicas: {df_partidos['Competicion'].nunique()}")
             print(f"   - Países únicos: {df_partidos['Pais'].nunique()}")
-            print(f"   - Equipos únicos: {pd.concat([df_partidos['Equipo_Local'], df_partidos['Equipo_Visitante']]).nunique()}")
+            print(f"   - Equipos únicos: {_count_unique_teams(df_partidos)}")
             
             if 'Fecha' in df_partidos.columns and df_partidos['Fecha'].notna().any():
                 try:
@@ -423,21 +566,19 @@ class FixtureProcessor:
         if filters:
             print(f"\n🔍 Filtros aplicados: {filters}")
     
-    def _save_individual_results(self, partidos: List[Dict], json_path: str) -> None:
+    def _save_individual_results(self, df_temp: pd.DataFrame, json_path: str) -> None:
         """
         Guarda los partidos de una temporada individual junto a su fixture.json.
         
         Args:
-            partidos (List[Dict]): Lista de partidos de esta temporada
+            df_temp (pd.DataFrame): DataFrame con los partidos de esta temporada
+                                    (ya con columnas categóricas)
             json_path (str): Ruta del archivo fixture.json
         """
         try:
-            if not partidos:
+            if df_temp.empty:
                 return
             
-            # Crear DataFrame temporal para esta temporada
-            df_temp = pd.DataFrame(partidos)
-            
             # Obtener directorio del fixture.json
             fixture_dir = os.path.dirname(json_path)
             
@@ -452,7 +593,7 @@ class FixtureProcessor:
             # Guardar Parquet
             df_temp.to_parquet(parquet_path, index=False)
             
-            print(f"💾 Guardado individual: {len(partidos)} partidos en {fixture_dir}")
+            print(f"💾 Guardado individual: {len(df_temp)} partidos en {fixture_dir}")
             
         except Exception as e:
             print(f"❌ Error guardando archivo individual en {json_path}: {e}")
@@ -611,7 +752,7 @@ def test_fixture_processor():
         
         if not df_partidos.empty:
             print(f"   - Competiciones: {df_partidos['Competicion'].nunique()}")
-            print(f"   - Equipos únicos: {pd.concat([df_partidos['Equipo_Local'], df_partidos['Equipo_Visitante']]).nunique()}")
+            print(f"   - Equipos únicos: {_count_unique_teams(df_partidos)}")
             print(f"\n🔝 Primeros 3 partidos:")
             print(df_partidos[['Fecha', 'Equipo_Local', 'Equipo_Visitante', 'Competicion']].head(3))
         
@@ -11,14 +11,31 @@ Fecha: Julio 2025
 """
 
 import os
+import re
 import json
 import requests
 import pandas as pd
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib3.util.retry import Retry
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Tuple
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
 # Importar funciones comunes
-from utils_common import sanitize_dir_name
+from utils_common import json_loads, sanitize_dir_name
+
+
+# Apertura de <script id="compData" type="application/json"> en la página de competiciones
+_COMPDATA_OPEN_RE = re.compile(rb'<script[^>]*\bid=["\']compData["\'][^>]*>')
+_MAX_TAG_LENGTH = 512
+
+# Tercer y cuarto segmento de /en_GB/soccer/SLUG/ID_HASH/results
+_COMP_URL_RE = re.compile(r'^/*[^/]+/[^/]+/(?P<slug>[^/]+)/(?P<id_hash>[^/]+)')
 
 
 class CompetitionScraper:
@@ -35,19 +52,13 @@ class CompetitionScraper:
         """
         self.base_url = base_url
         self.competitions_url = f"{base_url}/en_GB/soccer/competitions"
+        # Sin Cookie fija ni cabeceras de cliente del navegador: la sesión guarda
+        # en su CookieJar las cookies que el sitio realmente envía
         self.headers = {
             "Host": "www.scoresway.com",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-            "Accept-Encoding": "gzip, deflate, br, zstd",
             "Accept-Language": "es-ES,es;q=0.9,en;q=0.8",
-            "Cache-Control": "no-cache",
-            "Cookie": "_ga=GA1.1.666883386.1751465023; OptanonAlertBoxClosed=2025-09-19T18:35:29.983Z; eupubconsent-v2=CQX_8fgQX_8fgAcABBESB8FsAP_gAEPgACiQLmtR_G__bWlr-b73aftkeYxP9_hr7sQxBgbJk24FzLvW_JwXx2E5NAzatqIKmRIAu3TBIQNlHJDURVCgKIgVryDMaEyUoTNKJ6BkiFMRI2NYCFxvm4pjeQCY5vr99lc1mB-N7dr82dzyy6hHn3a5_2S1WJCdIYetDfv8ZBKT-9IEd_x8v4v4_F7pE2-eS1n_pGvp6D9-Yns_dBmx9_baffzPn__rl_e7X_vf_n37v943H77v____f_-7_-C5gAJhoVEEZZECIRKBhBAgAUFYQAUCAIAAEgaICAEwYFOQMAF1hMgBACgAGCAEAAIMAAQAACQAIRABQAQCAACAQKAAMACAICABgYAAwAWIgEAAIDoGKYEEAgWACRmVQaYEoACQQEtlQgkAwIK4QhFngEECImCgAABAAKAgAAeCwEJJASsSCALiCaAAAgAACiBAgRSNmAIKAzRaC8GT6MjTAMHzBMkpkGQBMEZGSbEJvwmHjkKIUEOQGxSzAAAA.f_wACHwAAAAA; OptanonConsent=isGpcEnabled=0&datestamp=Sat+Oct+04+2025+07%3A54%3A48+GMT-0300+(Argentina+Standard+Time)&version=202501.2.0&browserGpcFlag=0&isIABGlobal=false&hosts=&consentId=3aea9760-108d-4551-a221-5897ac42ce3e&interactionCount=2&isAnonUser=1&landingPath=NotLandingPage&groups=C0004%3A1%2CC0002%3A1%2CC0001%3A1%2CV2STACK42%3A1&intType=1&geolocation=AR%3BS&AwaitingReconsent=false; _ga_7T677PWWJ1=GS2.1.s1759575288$o13$g0$t1759575663$j60$l0$h0; _ga_SQ24F7Q7YW=GS2.1.s1759575288$o12$g0$t1759575663$j60$l0$h0; _ga_K2ECMCJBFQ=GS2.1.s1759575289$o12$g0$t1759575663$j60$l0$h0; ak_bmsc=2ECEC4E130BAC5B20F08F35A6089AD16~000000000000000000000000000000~YAAQ1fcSAj+I74CZAQAAs+Lhrh2YPxK77E7qLFZQQuUebu8S0QfESbLbXxUf+GBQYg1VDTAbYpqkpZDI8yGwzACCEALkrWskMm5uYnzHod+pAGWM63Wd809k9bgU465O9y1iGHBRyU6BYhpIDR58GC1IHZckBUKMfrOpX5vpxRhdZyxDbiNrqy8BQ7ZrpGZ2QRKsLZLEpg2ubVfna7Iq3j67+IQjyAD8niyPPvMGf1PEGrCLDyt0NW2D1Zpxxd2epGIhDmvYpYQScZmHTwWq8cQs5rzrfYV9GnYpmkDWxEJQBpO9qNcNd7fOy25RM/4ViEc6VfmL7jE4n4+5ojvrqfoOFTxAFNYimypmRem1BjLFWBy5Xeh8y1h9epVd+fUNt7knN3ZDMmZpouwku1fNUCjIgzbAilqHxc4ZfymZUpTu3Ls40cYHID9ZI797B0SuLaLlTyUErgXKBux+DRpL1ZD18Fw=",
-            "Pragma": "no-cache",
-            "Priority": "u=0, i",
             "Referer": "https://www.scoresway.com/en_GB/soccer/competitions",
-            "sec-ch-ua": "\"Chromium\";v=\"140\", \"Not=A?Brand\";v=\"24\", \"Google Chrome\";v=\"140\"",
-            "sec-ch-ua-mobile": "?1",
-            "sec-ch-ua-platform": "\"Android\"",
             "Sec-Fetch-Dest": "document",
             "Sec-Fetch-Mode": "navigate",
             "Sec-Fetch-Site": "same-origin",
@@ -56,6 +67,126 @@ class CompetitionScraper:
         }
 
         self.data_dir = 'data'
+        self.cache_path = os.path.join(self.data_dir, '.http_cache', 'index.json')
+        # ETag/Last-Modified de los últimos compData obtenidos (None si el servidor no los envía)
+        self.compdata_version = None
+        
+        # Sesión compartida: reutiliza conexiones TCP/TLS entre requests
+        self.timeout = (5, 30)
+        self.session = self._create_session_with_retries()
+    
+    def _create_session_with_retries(self) -> requests.Session:
+        """
+        Crea una sesión de requests con pool de conexiones y reintentos.
+        
+        Returns:
+            requests.Session: Sesión configurada
+        """
+        session = requests.Session()
+        # Accept-Encoding lo gestiona requests/urllib3: anuncia br/zstd solo
+        # si los decodificadores (brotli, zstandard) están instalados
+        session.headers.update(self.headers)
+        retry_strategy = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[500, 502, 503, 504, 429],
+            allowed_methods=["GET"]
+        )
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retry_strategy)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
+    def close(self) -> None:
+        """
+        Cierra la sesión HTTP y libera las conexiones del pool.
+        """
+        self.session.close()
+    
+    def __enter__(self) -> 'CompetitionScraper':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _load_http_cache(self) -> Dict:
+        """
+        Carga el índice de caché HTTP (ETag / Last-Modified por URL).
+        
+        Returns:
+            Dict: {url: {'etag', 'last_modified', 'body_path'}} o vacío si no existe
+        """
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+    
+    def _save_http_cache(self, cache: Dict, url: str, response: requests.Response,
+                         payload: bytes, body_filename: str) -> None:
+        """
+        Guarda el contenido extraído y los validadores de la respuesta para la próxima petición.
+        
+        Args:
+            cache (Dict): Índice de caché actual (se actualiza en el lugar)
+            url (str): URL solicitada
+            response (requests.Response): Respuesta 200 del servidor
+            payload (bytes): Contenido a reutilizar cuando el servidor responda 304
+            body_filename (str): Nombre del archivo donde guardar el contenido
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        
+        try:
+            cache_dir = os.path.dirname(self.cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            body_path = os.path.join(cache_dir, body_filename)
+            with open(body_path, 'wb') as f:
+                f.write(payload)
+            
+            cache[url] = {'etag': etag, 'last_modified': last_modified, 'body_path': body_path}
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=2)
+        except OSError as e:
+            print(f"⚠️  No se pudo guardar la caché HTTP: {e}")
+    
+    def _read_compdata_stream(self, response: requests.Response, chunk_size: int = 65536) -> Optional[bytes]:
+        """
+        Lee la respuesta por bloques y devuelve el contenido de <script id="compData">.
+        
+        La lectura se corta en cuanto aparece el </script> de cierre; al cerrar la
+        respuesta se descarta el resto de la página sin descargarlo.
+        
+        Args:
+            response (requests.Response): Respuesta abierta con stream=True
+            chunk_size (int): Tamaño de cada bloque leído
+            
+        Returns:
+            Optional[bytes]: JSON de compData o None si el script no aparece
+        """
+        buf = bytearray()
+        start = -1
+        scan_from = 0
+        
+        for chunk in response.iter_content(chunk_size):
+            buf += chunk
+            
+            if start < 0:
+                match = _COMPDATA_OPEN_RE.search(buf, scan_from)
+                if not match:
+                    # La etiqueta de apertura puede quedar partida entre dos bloques
+                    scan_from = max(0, len(buf) - _MAX_TAG_LENGTH)
+                    continue
+                start = scan_from = match.end()
+            
+            end = buf.find(b'</script>', scan_from)
+            if end >= 0:
+                return bytes(buf[start:end])
+            scan_from = max(start, len(buf) - len(b'</script>'))
+        
+        return None
     
     def fetch_competitions_data(self) -> Dict:
         """
@@ -70,20 +201,38 @@ class CompetitionScraper:
         try:
             print("Obteniendo datos de competiciones...")
             
-            # Realizar request a la página
-            response = requests.get(self.competitions_url, headers=self.headers)
-            response.raise_for_status()
-            
-            # Parsear HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Petición condicional: si la página no cambió el servidor responde 304
+            cache = self._load_http_cache()
+            cached = cache.get(self.competitions_url, {})
+            body_path = cached.get('body_path')
+            conditional_headers = {}
+            if body_path and os.path.exists(body_path):
+                if cached.get('etag'):
+                    conditional_headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    conditional_headers['If-Modified-Since'] = cached['last_modified']
             
-            # Buscar el script con el JSON de competiciones
-            script = soup.find('script', {'id': 'compData', 'type': 'application/json'})
-            if not script:
-                raise Exception("No se encontró el script con ID compData")
+            # Realizar request a la página en modo streaming: solo se descarga
+            # hasta el cierre del script compData
+            with self.session.get(self.competitions_url, headers=conditional_headers,
+                                  timeout=self.timeout, stream=True) as response:
+                
+                if response.status_code == 304 and conditional_headers:
+                    print("✅ Competiciones sin cambios (304), usando caché local")
+                    with open(body_path, 'rb') as f:
+                        payload = f.read()
+                    self.compdata_version = cached.get('etag') or cached.get('last_modified')
+                else:
+                    response.raise_for_status()
+                    
+                    payload = self._read_compdata_stream(response)
+                    if payload is None:
+                        raise Exception("No se encontró el script con ID compData")
+                    self._save_http_cache(cache, self.competitions_url, response, payload, 'compData.json')
+                    self.compdata_version = response.headers.get('ETag') or response.headers.get('Last-Modified')
             
-            # Parsear JSON
-            data = json.loads(script.string)
+            # Parsear JSON (orjson si está disponible; acepta los bytes directamente)
+            data = json_loads(payload)
             print(f"✅ Datos obtenidos exitosamente")
             return data
             
@@ -108,19 +257,16 @@ class CompetitionScraper:
             print(f"Obteniendo datos de: {competition_url}")
             
             # Realizar request a la página de la competición
-            response = requests.get(competition_url, headers=self.headers)
+            response = self.session.get(competition_url, timeout=self.timeout)
             response.raise_for_status()
             
-            # Parsear HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
             # Extraer información básica de la página
             competition_info = {}
             
             # Intentar obtener el nombre de la competición
-            title_tag = soup.find('h1') or soup.find('title')
-            if title_tag:
-                competition_info['competicion'] = title_tag.get_text(strip=True)
+            titulo = self._extract_page_title(response)
+            if titulo is not None:
+                competition_info['competicion'] = titulo
             
             # Extraer ID de la URL (generalmente está al final)
             url_parts = competition_url.rstrip('/').split('/')
@@ -142,6 +288,59 @@ class CompetitionScraper:
         except Exception as e:
             raise Exception(f"Error inesperado: {e}")
     
+    def _extract_page_title(self, response: requests.Response) -> Optional[str]:
+        """
+        Obtiene el texto del primer <h1> (o del <title>) de la página.
+        
+        Usa selectolax (lexbor) si está instalado, que solo materializa el nodo
+        buscado; si no, recurre a BeautifulSoup con lxml.
+        
+        Args:
+            response (requests.Response): Respuesta con el HTML de la página
+            
+        Returns:
+            Optional[str]: Texto del título o None si la página no tiene h1/title
+        """
+        if LexborHTMLParser is not None:
+            tree = LexborHTMLParser(response.content)
+            node = tree.css_first('h1') or tree.css_first('title')
+            return node.text(strip=True) if node else None
+        
+        soup = BeautifulSoup(response.content, 'lxml')
+        title_tag = soup.find('h1') or soup.find('title')
+        return title_tag.get_text(strip=True) if title_tag else None
+    
+    def fetch_many(self, urls: List[str], max_workers: int = 16) -> List[Dict]:
+        """
+        Obtiene datos de varias competiciones en paralelo.
+        
+        Las descargas comparten la sesión (y su pool de conexiones y reintentos);
+        los hilos solo solapan la espera de red.
+        
+        Args:
+            urls (List[str]): URLs completas de las competiciones
+            max_workers (int): Número máximo de descargas simultáneas
+            
+        Returns:
+            List[Dict]: Información de cada competición obtenida, en el orden de ``urls``.
+                        Las URLs que fallan se informan y se omiten.
+        """
+        results = [None] * len(urls)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.fetch_single_competition_from_url, url): i
+                for i, url in enumerate(urls)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    print(f"❌ Error en {urls[i]}: {e}")
+        
+        return [r for r in results if r is not None]
+    
     def parse_competition_data(self, data: Dict) -> pd.DataFrame:
         """
         Parsea los datos de competiciones y los convierte en DataFrame.
@@ -152,49 +351,102 @@ class CompetitionScraper:
         Returns:
             pd.DataFrame: DataFrame con información de competiciones
         """
-        competitions = []
-        
         try:
+            # Aplanar continente -> país -> competición directamente en columnas
+            # (una lista por campo), sin crear un dict intermedio por fila
+            continentes, paises = [], []
+            comp_fields = ('name', 'id', 'url', 'crest', 'top', 'ord')
+            comp_columns = {field: [] for field in comp_fields}
+            
             for continent in data.get('continents', []):
                 continent_name = continent.get('name')
                 
                 for country in continent.get('countries', []):
-                    country_name = country.get('name')
+                    comps = country.get('comps', [])
+                    continentes.extend([continent_name] * len(comps))
+                    paises.extend([country.get('name')] * len(comps))
                     
-                    for comp in country.get('comps', []):
-                        # Extraer slug e id_hash de la URL
-                        url = comp.get('url', '')
-                        slug = None
-                        id_hash = None
-                        
-                        if url:
-                            # URL formato: /en_GB/soccer/SLUG/ID_HASH/results
-                            parts = url.strip('/').split('/')
-                            if len(parts) >= 4:
-                                slug = parts[2]      # afc-asian-cup-2023-qatar
-                                id_hash = parts[3]   # dxgoo5g7fx8rp5vu8kkzhcxnu
-                        
-                        competition_info = {
-                            'continente': continent_name,
-                            'pais': country_name,
-                            'competicion': comp.get('name'),
-                            'id_competicion': comp.get('id'),
-                            'slug': slug,
-                            'id_hash': id_hash,
-                            'url': f"{self.base_url}{comp.get('url')}" if comp.get('url') else None,
-                            'crest': f"{self.base_url}{comp.get('crest')}" if comp.get('crest') else None,
-                            'top': comp.get('top'),
-                            'orden': comp.get('ord')
-                        }
-                        competitions.append(competition_info)
-            
-            df = pd.DataFrame(competitions)
-            print(f"✅ Parseados {len(competitions)} competiciones")
+                    for field in comp_fields:
+                        comp_columns[field].extend([comp.get(field) for comp in comps])
+            
+            df = pd.DataFrame(comp_columns, columns=comp_fields)
+            
+            # Extraer slug e id_hash de la URL con una sola expresión regular
+            # URL formato: /en_GB/soccer/SLUG/ID_HASH/results
+            url_parts = df['url'].astype(str).str.extract(_COMP_URL_RE)
+            
+            df = pd.DataFrame({
+                'continente': pd.Series(continentes),
+                'pais': pd.Series(paises),
+                'competicion': df['name'],
+                'id_competicion': df['id'],
+                'slug': url_parts['slug'],        # afc-asian-cup-2023-qatar
+                'id_hash': url_parts['id_hash'],  # dxgoo5g7fx8rp5vu8kkzhcxnu
+                'url': self._prefix_base_url(df['url']),
+                'crest': self._prefix_base_url(df['crest']),
+                'top': df['top'].fillna(False).astype(bool),
+                'orden': df['ord']
+            })
+            print(f"✅ Parseados {len(df)} competiciones")
             return df
             
         except Exception as e:
             raise Exception(f"Error al parsear datos de competiciones: {e}")
     
+    def parse_or_load(self, data: Dict) -> pd.DataFrame:
+        """
+        Devuelve el DataFrame de competiciones reutilizando el parseo anterior si
+        los datos no cambiaron desde la última ejecución.
+        
+        La validez se decide con el ETag/Last-Modified de fetch_competitions_data:
+        si coincide con el del DataFrame cacheado se lee el Parquet en lugar de
+        volver a ejecutar parse_competition_data.
+        
+        Args:
+            data (Dict): Datos JSON de competiciones (de fetch_competitions_data)
+            
+        Returns:
+            pd.DataFrame: DataFrame con información de competiciones
+        """
+        version = self.compdata_version
+        cache = self._load_http_cache()
+        parsed = cache.get(self.competitions_url, {}).get('parsed', {})
+        
+        if version and parsed.get('version') == version and os.path.exists(parsed.get('path', '')):
+            try:
+                df = pd.read_parquet(parsed['path'])
+                print(f"✅ Competiciones sin cambios, {len(df)} cargadas desde caché")
+                return df
+            except Exception as e:
+                print(f"⚠️  No se pudo leer la caché de competiciones: {e}")
+        
+        df = self.parse_competition_data(data)
+        
+        if version and self.competitions_url in cache:
+            try:
+                parsed_path = os.path.join(os.path.dirname(self.cache_path), 'competiciones.parquet')
+                df.to_parquet(parsed_path, index=False)
+                cache[self.competitions_url]['parsed'] = {'version': version, 'path': parsed_path}
+                with open(self.cache_path, 'w', encoding='utf-8') as f:
+                    json.dump(cache, f, indent=2)
+            except Exception as e:
+                print(f"⚠️  No se pudo guardar la caché de competiciones: {e}")
+        
+        return df
+    
+    def _prefix_base_url(self, paths: pd.Series) -> pd.Series:
+        """
+        Antepone la URL base a rutas relativas, dejando None donde no hay ruta.
+        
+        Args:
+            paths (pd.Series): Rutas relativas (pueden ser nulas o vacías)
+            
+        Returns:
+            pd.Series: URLs absolutas o None
+        """
+        has_path = paths.notna() & (paths.astype(str) != '')
+        return (self.base_url + paths.astype(str)).where(has_path, None)
+    
     def save_competitions_csv(self, df: pd.DataFrame, filename: str = 'competiciones.csv') -> str:
         """
         Guarda el DataFrame de competiciones en CSV.
@@ -219,26 +471,55 @@ class CompetitionScraper:
         except Exception as e:
             raise Exception(f"Error al guardar CSV: {e}")
     
+    def save_competitions_parquet(self, df: pd.DataFrame, filename: str = 'competiciones.parquet') -> str:
+        """
+        Guarda el DataFrame de competiciones en Parquet (conserva los tipos de columna).
+        
+        Args:
+            df (pd.DataFrame): DataFrame con competiciones
+            filename (str): Nombre del archivo Parquet
+            
+        Returns:
+            str: Ruta del archivo guardado
+        """
+        try:
+            # Crear directorio si no existe
+            os.makedirs(self.data_dir, exist_ok=True)
+            
+            filepath = os.path.join(self.data_dir, filename)
+            df.to_parquet(filepath, index=False, engine='pyarrow', compression='zstd')
+            
+            print(f"✅ Competiciones guardadas en: {filepath}")
+            return filepath
+            
+        except Exception as e:
+            raise Exception(f"Error al guardar Parquet: {e}")
+    
     def load_competitions_csv(self, filename: str = 'competiciones.csv') -> pd.DataFrame:
         """
-        Carga el DataFrame de competiciones desde CSV.
+        Carga el DataFrame de competiciones desde CSV o Parquet.
+        
+        El formato se elige por la extensión del archivo (.parquet o .csv).
         
         Args:
-            filename (str): Nombre del archivo CSV
+            filename (str): Nombre del archivo CSV o Parquet
             
         Returns:
             pd.DataFrame: DataFrame con competiciones
         """
         try:
             filepath = os.path.join(self.data_dir, filename)
-            df = pd.read_csv(filepath)
+            if filename.endswith('.parquet'):
+                df = pd.read_parquet(filepath)
+            else:
+                df = pd.read_csv(filepath)
             print(f"✅ Competiciones cargadas desde: {filepath}")
             return df
             
         except FileNotFoundError:
             raise Exception(f"Archivo no encontrado: {filepath}")
         except Exception as e:
-            raise Exception(f"Error al cargar CSV: {e}")
+            raise Exception(f"Error al cargar competiciones: {e}")
     
     def create_directory_structure(self, df: pd.DataFrame) -> None:
         """
@@ -251,31 +532,28 @@ class CompetitionScraper:
             # Asegurar que el directorio base existe
             os.makedirs(self.data_dir, exist_ok=True)
             
-            created_dirs = 0
+            # Verificar que los datos necesarios están presentes
+            required_fields = ['continente', 'pais', 'competicion', 'id_competicion']
+            df_valid = df.loc[df[required_fields].notna().all(axis=1), required_fields]
             
-            for _, row in df.iterrows():
-                # Verificar que los datos necesarios están presentes
-                required_fields = ['continente', 'pais', 'competicion', 'id_competicion']
-                if not all(pd.notna(row[field]) for field in required_fields):
-                    continue
-                
-                # Crear nombres de directorio seguros
-                continente_dir = sanitize_dir_name(row['continente'])
-                pais_dir = sanitize_dir_name(row['pais'])
-                competicion_dir = f"{sanitize_dir_name(row['competicion'])}_{row['id_competicion']}"
-                
-                # Crear la ruta completa
-                ruta_competicion = os.path.join(
-                    self.data_dir, 
-                    continente_dir, 
-                    pais_dir, 
-                    competicion_dir
-                )
-                
-                # Crear directorios anidados si no existen
-                if not os.path.exists(ruta_competicion):
-                    os.makedirs(ruta_competicion, exist_ok=True)
+            # Construir las rutas completas con nombres de directorio seguros
+            rutas_competicion = (
+                self.data_dir + os.sep
+                + df_valid['continente'].map(sanitize_dir_name) + os.sep
+                + df_valid['pais'].map(sanitize_dir_name) + os.sep
+                + df_valid['competicion'].map(sanitize_dir_name) + '_'
+                + df_valid['id_competicion'].astype(str)
+            )
+            
+            # Crear cada directorio una sola vez; mkdir falla si ya existe,
+            # lo que evita un os.path.exists previo por competición
+            created_dirs = 0
+            for ruta_competicion in rutas_competicion.unique():
+                try:
+                    os.makedirs(ruta_competicion)
                     created_dirs += 1
+                except FileExistsError:
+                    pass
             
             print(f"✅ Estructura de directorios creada exitosamente")
             print(f"   - Directorios creados: {created_dirs}")
@@ -295,12 +573,18 @@ class CompetitionScraper:
             Dict: Resumen estadístico
         """
         try:
+            g = df.groupby('continente', sort=False)
+            por_continente = g.size().sort_values(ascending=False, kind='stable')
+            
             summary = {
                 'total_competiciones': len(df),
-                'total_continentes': df['continente'].nunique(),
+                'total_continentes': g.ngroups,
                 'total_paises': df['pais'].nunique(),
-                'competiciones_por_continente': df['continente'].value_counts().to_dict(),
-                'competiciones_top': df[df['top'] == True]['competicion'].tolist() if 'top' in df.columns else []
+                'competiciones_por_continente': por_continente.to_dict(),
+                'competiciones_top': (
+                    df.loc[df['top'].to_numpy(dtype=bool, na_value=False), 'competicion'].tolist()
+                    if 'top' in df.columns else []
+                )
             }
             
             return summary
@@ -332,67 +616,105 @@ def scrape_from_link(competition_url: str, filename: str = None) -> pd.DataFrame
         df = scrape_from_link(link)
         display(df)
     """
-    scraper = CompetitionScraper()
-    
     try:
-        # Obtener datos de esa competición específica
-        competition_data = scraper.fetch_single_competition_from_url(competition_url)
-        
-        # Convertir a DataFrame
-        df = pd.DataFrame([competition_data])
-        
-        # Generar nombre de archivo si no se proporciona
-        if filename is None:
-            comp_id = competition_data.get('id_competicion', 'competicion')
-            filename = f"competicion_{comp_id}.csv"
-        
-        # Guardar CSV
-        scraper.save_competitions_csv(df, filename)
+        with CompetitionScraper() as scraper:
+            # Obtener datos de esa competición específica
+            competition_data = scraper.fetch_single_competition_from_url(competition_url)
+            
+            # Convertir a DataFrame
+            df = pd.DataFrame([competition_data])
+            
+            # Generar nombre de archivo si no se proporciona
+            if filename is None:
+                comp_id = competition_data.get('id_competicion', 'competicion')
+                filename = f"competicion_{comp_id}.csv"
+            
+            # Guardar CSV
+            scraper.save_competitions_csv(df, filename)
+            
+            print(f"\n🎉 ¡Listo! CSV creado exitosamente")
+            print(f"📁 Archivo: data/{filename}")
+            
+            return df
+            
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        raise
+
+
+def scrape_from_links(competition_urls: List[str], filename: str = 'competiciones_links.csv',
+                      max_workers: int = 16) -> pd.DataFrame:
+    """
+    Crea un único CSV desde varios links de competición, descargándolos en paralelo.
+    
+    Args:
+        competition_urls (List[str]): Links de las competiciones
+        filename (str): Nombre del archivo CSV
+        max_workers (int): Número máximo de descargas simultáneas
         
-        print(f"\n🎉 ¡Listo! CSV creado exitosamente")
-        print(f"📁 Archivo: data/{filename}")
+    Returns:
+        pd.DataFrame: DataFrame con una fila por competición obtenida
         
-        return df
+    Ejemplo de uso en tu notebook:
+        from scraping_competitions import scrape_from_links
         
+        df = scrape_from_links([link_1, link_2, link_3])
+        display(df)
+    """
+    try:
+        with CompetitionScraper() as scraper:
+            records = scraper.fetch_many(competition_urls, max_workers=max_workers)
+            df = pd.DataFrame(records)
+            
+            scraper.save_competitions_csv(df, filename)
+            
+            print(f"\n🎉 ¡Listo! {len(df)}/{len(competition_urls)} competiciones guardadas")
+            print(f"📁 Archivo: data/{filename}")
+            
+            return df
+            
     except Exception as e:
         print(f"❌ Error: {e}")
         raise
 
 
 # Funciones originales (mantienen la funcionalidad anterior)
-def scrape_and_save_competitions(save_csv: bool = True, create_dirs: bool = True) -> Tuple[pd.DataFrame, Dict]:
+def scrape_and_save_competitions(save_csv: bool = False, create_dirs: bool = True,
+                                 save_parquet: bool = True) -> Tuple[pd.DataFrame, Dict]:
     """
     Función principal para hacer scraping completo de competiciones.
     
     Args:
-        save_csv (bool): Si guardar en CSV
+        save_csv (bool): Si guardar además una copia en CSV (para inspección)
         create_dirs (bool): Si crear estructura de directorios
+        save_parquet (bool): Si guardar en Parquet (formato por defecto)
         
     Returns:
         Tuple[pd.DataFrame, Dict]: DataFrame de competiciones y resumen
     """
-    scraper = CompetitionScraper()
-    
     try:
-        # Obtener datos
-        data = scraper.fetch_competitions_data()
-        
-        # Parsear datos
-        df = scraper.parse_competition_data(data)
-        
-        # Guardar CSV si se solicita
-        if save_csv:
-            scraper.save_competitions_csv(df)
-        
-        # Crear directorios si se solicita
-        if create_dirs:
-            scraper.create_directory_structure(df)
-        
-        # Generar resumen
-        summary = scraper.get_competition_summary(df)
-        
-        return df, summary
-        
+        with CompetitionScraper() as scraper:
+            # Obtener datos
+            data = scraper.fetch_competitions_data()
+            
+            # Parsear datos (o reutilizar el parseo previo si no cambiaron)
+            df = scraper.parse_or_load(data)
+            
+            # Guardar Parquet / CSV si se solicita
+            if save_parquet:
+                scraper.save_competitions_parquet(df)
+            if save_csv:
+                scraper.save_competitions_csv(df)
+            
+            # Crear directorios si se solicita
+            if create_dirs:
+                scraper.create_directory_structure(df)
+            
+            # Generar resumen
+            summary = scraper.get_competition_summary(df)
+            
+            return df, summary
+            
     except Exception as e:
         print(f"❌ Error en scraping: {e}")
         raise
@@ -400,13 +722,15 @@ def scrape_and_save_competitions(save_csv: bool = True, create_dirs: bool = True
 
 def load_existing_competitions() -> pd.DataFrame:
     """
-    Carga competiciones desde CSV existente.
+    Carga competiciones guardadas, prefiriendo el Parquet y recurriendo al CSV.
     
     Returns:
         pd.DataFrame: DataFrame con competiciones
     """
-    scraper = CompetitionScraper()
-    return scraper.load_competitions_csv()
+    with CompetitionScraper() as scraper:
+        if os.path.exists(os.path.join(scraper.data_dir, 'competiciones.parquet')):
+            return scraper.load_competitions_csv('competiciones.parquet')
+        return scraper.load_competitions_csv()
 
 
 # Función de testing
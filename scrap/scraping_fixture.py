@@ -13,17 +13,65 @@ Fecha: Julio 2025
 import os
 import re
 import json
+import logging
 import time
 import random
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import httpx
 import requests
+from aiolimiter import AsyncLimiter
+from tenacity import (AsyncRetrying, retry_if_exception, retry_if_exception_type,
+                      stop_after_attempt, wait_random_exponential)
+import numpy as np
 import pandas as pd
+from tqdm.auto import tqdm
 from urllib.parse import quote, urlparse, parse_qs
 from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Awaitable, Callable, Dict, List, Literal, Optional, Tuple, Union
 
 # Importar funciones comunes
-from utils_common import get_season_name_from_url, get_torneo_id, random_sleep_time
+from utils_common import (RateLimited, get_season_name_from_url, get_torneo_id, json_dumps_bytes,
+                          json_loads, parse_retry_after, random_sleep_time, retry_after_wait,
+                          run_async)
+
+
+# Resultado de guardar un fixture y contador de estadísticas que incrementa
+SaveOutcome = Literal['saved', 'skipped', 'error']
+_OUTCOME_STATS = {'saved': 'success', 'skipped': 'skipped', 'error': 'errors'}
+
+
+@lru_cache(maxsize=1024)
+def _quote_name(name: str) -> str:
+    """Codifica un nombre de competición para la URL (memorizado)."""
+    return quote(name)
+
+
+def _try_unlink(path: str) -> bool:
+    """Borra un archivo; devuelve False si no se pudo borrar."""
+    try:
+        os.unlink(path)
+        return True
+    except OSError:
+        return False
+
+
+def _is_server_error(exc: BaseException) -> bool:
+    """Indica si la excepción es una respuesta 5xx de httpx."""
+    return isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code >= 500
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """
+    Indica si un error de _call_with_retries puede resolverse volviendo a pedir.
+    
+    Solo los 429, los 5xx y los errores de conexión/timeout lo son; un 4xx o
+    un JSONP mal formado fallará igual en cada intento.
+    """
+    cause = exc.__cause__
+    return isinstance(cause, (RateLimited, httpx.TransportError)) or _is_server_error(cause)
 
 
 class FixtureScraper:
@@ -34,7 +82,12 @@ class FixtureScraper:
     def __init__(self, 
                  sdapi_outlet_key: str = 'ft1tiv1inq7v1sk3y9tv12yh5',
                  callback_id: str = 'W3e14cbc3e4b2577e854bf210e5a3c7028c7409678',
-                 base_url: str = "https://www.scoresway.com"):
+                 base_url: str = "https://www.scoresway.com",
+                 data_dir: str = 'data',
+                 max_concurrency: int = 20,
+                 max_rate: float = 10.0,
+                 time_period: float = 1.0,
+                 verbose: bool = False):
         """
         Inicializa el scraper de fixtures.
         
@@ -42,12 +95,31 @@ class FixtureScraper:
             sdapi_outlet_key (str): Clave del outlet para la API
             callback_id (str): ID del callback para JSONP
             base_url (str): URL base del sitio web
+            data_dir (str): Directorio base de datos
+            max_concurrency (int): Descargas simultáneas en process_seasons
+            max_rate (float): Peticiones permitidas por time_period entre todas
+                              las descargas concurrentes
+            time_period (float): Ventana del límite de peticiones en segundos
+            verbose (bool): Si mostrar el detalle de cada petición y archivo
+                            (por defecto solo la barra de progreso y los errores)
         """
         self.sdapi_outlet_key = sdapi_outlet_key
         self.callback_id = callback_id
         self.base_url = base_url
         self.api_base_url = "https://api.performfeeds.com/soccerdata/match"
-        self.data_dir = 'data'
+        self.data_dir = data_dir
+        
+        # Logger para el detalle por temporada; sin verbose solo salen
+        # advertencias y errores. El logger es del módulo, así que el nivel se
+        # fija en cada instancia para no heredar el de un scraper anterior
+        self.log = logging.getLogger(__name__)
+        self.log.setLevel(logging.DEBUG if verbose else logging.WARNING)
+        if verbose and not self.log.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            self.log.addHandler(handler)
+            # Evitar que el logger raíz vuelva a imprimir cada mensaje
+            self.log.propagate = False
         
         # Configurar headers
         self.headers = {
@@ -55,12 +127,26 @@ class FixtureScraper:
             'User-Agent': 'Mozilla/5.0 (Linux; Android 6.0; Nexus 5 Build/MRA58N) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Mobile Safari/537.36'
         }
         
+        # Plantillas de URL de la API y del referer
+        self._build_url_templates()
+        
         # Configurar sesión con reintentos
         self.session = self._create_session_with_retries()
         
-        # Configuración de delays
+        # Configuración de delays (descargas individuales)
         self.min_delay = 1.0
         self.max_delay = 2.0
+        
+        # Configuración de descargas concurrentes
+        self.max_concurrency = max_concurrency
+        self.max_retries = 4
+        self.max_requeues = 3
+        
+        # Límite global de peticiones (token bucket); se crea en cada lote
+        # porque queda ligado al event loop que lo usa
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self.limiter = None
     
     def _create_session_with_retries(self) -> requests.Session:
         """
@@ -80,6 +166,19 @@ class FixtureScraper:
         session.mount("https://", adapter)
         return session
     
+    def _build_url_templates(self) -> None:
+        """
+        Precalcula las plantillas de la URL de la API y del referer con las
+        partes fijas (outlet key, callback, URL base); por petición solo se
+        completa el torneo y la competición.
+        """
+        self._url_template = (
+            f"{self.api_base_url}/{self.sdapi_outlet_key}/"
+            f"?_rt=c&tmcl={{tid}}&live=yes&_pgSz=400&_lcl=en&_fmt=jsonp"
+            f"&sps=widgets&_clbk={self.callback_id}"
+        )
+        self._referer_template = f"{self.base_url}/en_GB/soccer/{{name}}/{{tid}}/fixtures"
+    
     def set_api_credentials(self, sdapi_outlet_key: str, callback_id: str) -> None:
         """
         Actualiza las credenciales de la API.
@@ -90,6 +189,7 @@ class FixtureScraper:
         """
         self.sdapi_outlet_key = sdapi_outlet_key
         self.callback_id = callback_id
+        self._build_url_templates()
         print(f"✅ Credenciales actualizadas")
     
     def set_delay_range(self, min_delay: float, max_delay: float) -> None:
@@ -103,6 +203,40 @@ class FixtureScraper:
         self.min_delay = min_delay
         self.max_delay = max_delay
     
+    def obtener_fixture_bytes(self, torneo_id: str, competicion_name: str, referer: str = None) -> memoryview:
+        """
+        Descarga el fixture y devuelve el JSON sin decodificar.
+        
+        Solo quita el callback JSONP; el parseo queda a cargo de quien
+        necesite acceder a los campos.
+        
+        Args:
+            torneo_id (str): ID del torneo
+            competicion_name (str): Nombre de la competición
+            referer (str): URL de referencia
+            
+        Returns:
+            memoryview: Bytes del JSON contenido en el callback
+            
+        Raises:
+            Exception: Si hay error en la petición o en el formato JSONP
+        """
+        try:
+            fixture_url, headers = self._build_fixture_request(torneo_id, competicion_name, referer)
+            
+            self.log.debug("🌐 API URL: %s", fixture_url)
+            
+            # Realizar petición
+            response = self.session.get(fixture_url, headers=headers)
+            response.raise_for_status()
+            
+            return self._jsonp_payload(response.content)
+            
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Error al realizar petición: {e}")
+        except Exception as e:
+            raise Exception(f"Error inesperado: {e}")
+    
     def obtener_fixture_json(self, torneo_id: str, competicion_name: str, referer: str = None) -> Dict:
         """
         Obtiene los datos de fixture desde la API.
@@ -118,130 +252,580 @@ class FixtureScraper:
         Raises:
             Exception: Si hay error en la petición o parsing
         """
+        payload = self.obtener_fixture_bytes(torneo_id, competicion_name, referer)
         try:
-            # Configurar referer
-            if not referer:
-                referer_base = f'{self.base_url}/en_GB/soccer/'
-                safe_competition_name = quote(competicion_name)
-                referer = f"{referer_base}{safe_competition_name}/{torneo_id}/fixtures"
+            return json_loads(payload)
+        except json.JSONDecodeError as e:
+            raise Exception(f"Error al parsear JSON: {e}")
+    
+    async def _call_with_retries(self, fetch: Callable[..., Awaitable], *args):
+        """
+        Ejecuta una petición a la API con reintentos y errores uniformes.
+        
+        Reintenta con backoff exponencial aleatorio ante 429, errores 5xx,
+        timeouts y errores de conexión. En los 429 espera al menos lo que
+        indique la cabecera Retry-After.
+        
+        Args:
+            fetch (Callable): Corrutina que realiza un único intento
+            *args: Argumentos para fetch
             
-            # Construir URL de la API
-            fixture_url = (
-                f"{self.api_base_url}/{self.sdapi_outlet_key}/"
-                f"?_rt=c&tmcl={torneo_id}&live=yes&_pgSz=400&_lcl=en&_fmt=jsonp"
-                f"&sps=widgets&_clbk={self.callback_id}"
-            )
+        Returns:
+            Any: Resultado de fetch
             
-            # Actualizar headers con referer
-            headers = self.headers.copy()
-            headers['Referer'] = referer
+        Raises:
+            Exception: Si la petición falla tras los reintentos
+        """
+        retrying = AsyncRetrying(
+            wait=retry_after_wait(wait_random_exponential(multiplier=1, max=30)),
+            stop=stop_after_attempt(self.max_retries + 1),
+            retry=(retry_if_exception_type((RateLimited, httpx.TransportError))
+                   | retry_if_exception(_is_server_error)),
+            reraise=True
+        )
+        try:
+            async for attempt in retrying:
+                with attempt:
+                    return await fetch(*args)
+        except RateLimited as e:
+            raise Exception(str(e)) from e
+        except httpx.TimeoutException as e:
+            raise Exception(f"Timeout al realizar petición") from e
+        except httpx.HTTPError as e:
+            raise Exception(f"Error al realizar petición: {e}") from e
+        except Exception as e:
+            raise Exception(f"Error inesperado: {e}") from e
+    
+    async def obtener_fixture_bytes_async(self, client: httpx.AsyncClient, torneo_id: str,
+                                          competicion_name: str, referer: str = None) -> memoryview:
+        """
+        Versión asíncrona de obtener_fixture_bytes sobre un cliente httpx compartido.
+        
+        Args:
+            client (httpx.AsyncClient): Cliente httpx del lote
+            torneo_id (str): ID del torneo
+            competicion_name (str): Nombre de la competición
+            referer (str): URL de referencia
             
-            print(f"🌐 API URL: {fixture_url}")
+        Returns:
+            memoryview: Bytes del JSON contenido en el callback
             
-            # Realizar petición
-            response = self.session.get(fixture_url, headers=headers)
-            response.raise_for_status()
+        Raises:
+            Exception: Si hay error en la petición o en el formato JSONP
+        """
+        fixture_url, headers = self._build_fixture_request(torneo_id, competicion_name, referer)
+        
+        self.log.debug("🌐 API URL: %s", fixture_url)
+        
+        content = await self._call_with_retries(self._fetch_fixture_body, client, fixture_url, headers)
+        try:
+            return self._jsonp_payload(content)
+        except Exception as e:
+            raise Exception(f"Error inesperado: {e}")
+    
+    async def _fetch_fixture_body(self, client: httpx.AsyncClient,
+                                  fixture_url: str, headers: Dict) -> bytes:
+        """
+        Realiza una única petición del fixture.
+        
+        Args:
+            client (httpx.AsyncClient): Cliente httpx del lote
+            fixture_url (str): URL de la API
+            headers (Dict): Headers de la petición
             
-            # Limpiar JSONP y extraer JSON puro
-            content = response.text
-            json_start = content.find('(') + 1
-            json_end = content.rfind(')')
+        Returns:
+            bytes: Cuerpo JSONP de la respuesta
             
-            if json_start <= 0 or json_end <= json_start:
-                raise Exception("No se pudo extraer JSON del response JSONP")
+        Raises:
+            RateLimited: Si la API responde 429
+            httpx.HTTPStatusError: Si la respuesta es otro error HTTP
+        """
+        if self.limiter is not None:
+            await self.limiter.acquire()
+        
+        response = await client.get(fixture_url, headers=headers)
+        if response.status_code == 429:
+            raise RateLimited(parse_retry_after(response.headers.get('Retry-After')))
+        response.raise_for_status()
+        return response.content
+    
+    async def descargar_fixture_a_archivo_async(self, client: httpx.AsyncClient, torneo_id: str,
+                                                competicion_name: str, json_path: str,
+                                                referer: str = None) -> None:
+        """
+        Descarga el fixture y lo escribe en disco por bloques, sin tener el
+        cuerpo completo en memoria.
+        
+        Args:
+            client (httpx.AsyncClient): Cliente httpx del lote
+            torneo_id (str): ID del torneo
+            competicion_name (str): Nombre de la competición
+            json_path (str): Ruta del archivo fixture.json
+            referer (str): URL de referencia
             
-            fixture_data = json.loads(content[json_start:json_end])
+        Raises:
+            Exception: Si hay error en la petición o en el formato JSONP
+        """
+        fixture_url, headers = self._build_fixture_request(torneo_id, competicion_name, referer)
+        
+        self.log.debug("🌐 API URL: %s", fixture_url)
+        
+        await self._call_with_retries(self._stream_fixture_body, client, fixture_url, headers, json_path)
+        
+        self.log.info("✅ Fixture guardado: %s", json_path)
+    
+    async def _stream_fixture_body(self, client: httpx.AsyncClient,
+                                   fixture_url: str, headers: Dict, json_path: str,
+                                   chunk_size: int = 65536, tail_size: int = 64) -> None:
+        """
+        Realiza una única petición del fixture y copia el JSON al archivo.
+        
+        Descarta el callback hasta el '(' y retiene los últimos bytes para
+        cortar en el último ')', así acepta cierres como ')' o ');' y
+        cualquier resto tras el paréntesis. Se escribe en un archivo temporal que se
+        renombra al terminar, así un fallo a mitad no deja un fixture.json
+        incompleto que luego se saltaría como existente.
+        
+        Args:
+            client (httpx.AsyncClient): Cliente httpx del lote
+            fixture_url (str): URL de la API
+            headers (Dict): Headers de la petición
+            json_path (str): Ruta del archivo fixture.json
+            chunk_size (int): Tamaño de los bloques leídos
+            tail_size (int): Bytes retenidos al final para buscar el ')'
             
-            return fixture_data
+        Raises:
+            RateLimited: Si la API responde 429
+            httpx.HTTPStatusError: Si la respuesta es otro error HTTP
+        """
+        if self.limiter is not None:
+            await self.limiter.acquire()
+        
+        async with client.stream('GET', fixture_url, headers=headers) as response:
+            if response.status_code == 429:
+                raise RateLimited(parse_retry_after(response.headers.get('Retry-After')))
+            response.raise_for_status()
             
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Error al realizar petición: {e}")
+            tmp_path = f"{json_path}.part"
+            try:
+                with open(tmp_path, 'wb') as f:
+                    head = b''
+                    pending = b''
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        # Descartar el callback hasta el '(' inicial
+                        if head is not None:
+                            head += chunk
+                            json_start = head.find(b'(')
+                            if json_start == -1:
+                                continue
+                            chunk = head[json_start + 1:]
+                            head = None
+                        # Escribir todo salvo la cola, donde puede estar el ')'
+                        pending += chunk
+                        if len(pending) > tail_size:
+                            await asyncio.to_thread(f.write, pending[:-tail_size])
+                            pending = pending[-tail_size:]
+                    
+                    json_end = pending.rfind(b')') if head is None else -1
+                    if json_end == -1:
+                        raise Exception("No se pudo extraer JSON del response JSONP")
+                    await asyncio.to_thread(f.write, pending[:json_end])
+                
+                os.replace(tmp_path, json_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+    
+    async def obtener_fixture_json_async(self, client: httpx.AsyncClient, torneo_id: str,
+                                         competicion_name: str, referer: str = None) -> Dict:
+        """
+        Versión asíncrona de obtener_fixture_json.
+        
+        Args:
+            client (httpx.AsyncClient): Cliente httpx del lote
+            torneo_id (str): ID del torneo
+            competicion_name (str): Nombre de la competición
+            referer (str): URL de referencia
+            
+        Returns:
+            Dict: Datos del fixture en formato JSON
+            
+        Raises:
+            Exception: Si hay error en la petición o parsing
+        """
+        payload = await self.obtener_fixture_bytes_async(client, torneo_id, competicion_name, referer)
+        try:
+            return json_loads(payload)
         except json.JSONDecodeError as e:
             raise Exception(f"Error al parsear JSON: {e}")
-        except Exception as e:
-            raise Exception(f"Error inesperado: {e}")
     
-    def save_fixture_json(self, season_row: pd.Series, skip_existing: bool = True) -> bool:
+    def _build_fixture_request(self, torneo_id: str, competicion_name: str,
+                               referer: Optional[str] = None) -> Tuple[str, Dict]:
+        """
+        Construye la URL de la API y los headers para pedir un fixture.
+        
+        Args:
+            torneo_id (str): ID del torneo
+            competicion_name (str): Nombre de la competición
+            referer (str): URL de referencia
+            
+        Returns:
+            Tuple[str, Dict]: URL de la API y headers con el referer
+        """
+        # Configurar referer
+        if not referer:
+            referer = self._referer_template.format(name=_quote_name(competicion_name), tid=torneo_id)
+        
+        # Construir URL de la API
+        fixture_url = self._url_template.format(tid=torneo_id)
+        
+        # Actualizar headers con referer
+        headers = self.headers.copy()
+        headers['Referer'] = referer
+        
+        return fixture_url, headers
+    
+    def _jsonp_payload(self, content: bytes) -> memoryview:
+        """
+        Quita el callback JSONP y devuelve el JSON sin copiar el cuerpo.
+        
+        Como el callback es conocido, el prefijo tiene longitud fija y basta
+        con un slice sobre un memoryview. Si la respuesta no tiene la forma
+        esperada se busca el paréntesis.
+        
+        Args:
+            content (bytes): Respuesta JSONP de la API
+            
+        Returns:
+            memoryview: Bytes del JSON contenido en el callback
+        """
+        prefix = f"{self.callback_id}(".encode()
+        if content.startswith(prefix) and content.endswith(b')'):
+            return memoryview(content)[len(prefix):-1]
+        
+        json_start = content.find(b'(') + 1
+        json_end = content.rfind(b')')
+        
+        if json_start <= 0 or json_end <= json_start:
+            raise Exception("No se pudo extraer JSON del response JSONP")
+        
+        return memoryview(content)[json_start:json_end]
+    
+    def _prepare_fixture_target(self, season_row: Union[pd.Series, Dict]) -> Optional[Tuple[str, str, str]]:
+        """
+        Resuelve el torneo y la ruta de destino del fixture de una temporada.
+        
+        Args:
+            season_row (pd.Series | Dict): Fila del DataFrame de temporadas
+            
+        Returns:
+            Optional[Tuple[str, str, str]]: (torneo_id, competicion, json_path) o None
+                                            si no se puede construir la ruta
+        """
+        # Obtener ID del torneo
+        torneo_id = get_torneo_id(season_row['url_temporada'])
+        if not torneo_id:
+            self.log.warning("⚠️  No se pudo extraer torneo_id de: %s", season_row['url_temporada'])
+            return None
+        
+        # Obtener nombre de temporada
+        season_name = get_season_name_from_url(season_row['url_resultados'])
+        if not season_name:
+            self.log.warning("⚠️  No se pudo extraer season_name de: %s", season_row['url_resultados'])
+            return None
+        
+        # Crear nombres de directorio seguros
+        continente_dir = str(season_row['continente']).replace('/', '_')
+        pais_dir = str(season_row['pais']).replace('/', '_')
+        competicion = str(season_row['competicion']).replace('/', '_')
+        competicion_dir = f"{competicion}_{season_row['id_competicion']}"
+        
+        # Ruta del archivo JSON
+        json_path = os.path.join(
+            self.data_dir,
+            continente_dir,
+            pais_dir,
+            competicion_dir,
+            season_name,
+            'fixture.json'
+        )
+        return torneo_id, competicion, json_path
+    
+    def _write_fixture(self, json_path: str, payload: Union[bytes, memoryview]) -> None:
+        """
+        Escribe el fixture en disco.
+        
+        Args:
+            json_path (str): Ruta del archivo fixture.json
+            payload (bytes | memoryview): JSON del fixture ya codificado
+        """
+        with open(json_path, 'wb') as f:
+            f.write(payload)
+        
+        self.log.info("✅ Fixture guardado: %s", json_path)
+    
+    async def _write_fixture_async(self, json_path: str, payload: Union[bytes, memoryview]) -> None:
+        """
+        Escribe el fixture en un hilo del executor por defecto para que el
+        event loop siga atendiendo otras descargas mientras se escribe.
+        
+        Args:
+            json_path (str): Ruta del archivo fixture.json
+            payload (bytes | memoryview): JSON del fixture ya codificado
+        """
+        await asyncio.to_thread(self._write_fixture, json_path, payload)
+    
+    def save_fixture_json(self, season_row: Union[pd.Series, Dict], skip_existing: bool = True,
+                          save_raw: bool = True) -> SaveOutcome:
         """
         Descarga y guarda el fixture JSON para una temporada.
         
         Args:
-            season_row (pd.Series): Fila del DataFrame de temporadas
+            season_row (pd.Series | Dict): Fila del DataFrame de temporadas
             skip_existing (bool): Si saltar archivos que ya existen
+            save_raw (bool): Si guardar el JSON tal como llega de la API (sin
+                             parsear ni indentar)
             
         Returns:
-            bool: True si se guardó exitosamente, False en caso contrario
+            SaveOutcome: 'saved', 'skipped' (ya existía) o 'error'
         """
         try:
-            # Obtener ID del torneo
-            torneo_id = get_torneo_id(season_row['url_temporada'])
-            if not torneo_id:
-                print(f"⚠️  No se pudo extraer torneo_id de: {season_row['url_temporada']}")
-                return False
-            
-            # Obtener nombre de temporada
-            season_name = get_season_name_from_url(season_row['url_resultados'])
-            if not season_name:
-                print(f"⚠️  No se pudo extraer season_name de: {season_row['url_resultados']}")
-                return False
-            
-            # Crear nombres de directorio seguros
-            continente_dir = str(season_row['continente']).replace('/', '_')
-            pais_dir = str(season_row['pais']).replace('/', '_')
-            competicion = str(season_row['competicion']).replace('/', '_')
-            competicion_dir = f"{competicion}_{season_row['id_competicion']}"
-            
-            # Construir ruta del directorio
-            dir_path = os.path.join(
-                self.data_dir,
-                continente_dir,
-                pais_dir,
-                competicion_dir,
-                season_name
-            )
-            
-            # Verificar si el directorio existe
-            if not os.path.exists(dir_path):
-                print(f"⚠️  Directorio no existe: {dir_path}")
-                return False
-            
-            # Ruta del archivo JSON
-            json_path = os.path.join(dir_path, 'fixture.json')
+            target = self._prepare_fixture_target(season_row)
+            if not target:
+                return 'error'
+            torneo_id, competicion, json_path = target
             
             # Si el archivo ya existe y skip_existing es True, saltarlo
             if skip_existing and os.path.exists(json_path):
-                print(f"⏭️  Archivo ya existe (saltando): {json_path}")
-                return True
+                self.log.info("⏭️  Archivo ya existe (saltando): %s", json_path)
+                return 'skipped'
+            
+            os.makedirs(os.path.dirname(json_path), exist_ok=True)
             
             # Obtener datos del fixture
-            fixture_data = self.obtener_fixture_json(
-                torneo_id=torneo_id,
-                competicion_name=competicion,
-                referer=season_row['url_temporada']
-            )
+            if save_raw:
+                payload = self.obtener_fixture_bytes(
+                    torneo_id=torneo_id,
+                    competicion_name=competicion,
+                    referer=season_row['url_temporada']
+                )
+            else:
+                payload = json_dumps_bytes(self.obtener_fixture_json(
+                    torneo_id=torneo_id,
+                    competicion_name=competicion,
+                    referer=season_row['url_temporada']
+                ))
             
             # Guardar el JSON
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(fixture_data, f, ensure_ascii=False, indent=2)
-            
-            print(f"✅ Fixture guardado: {json_path}")
+            self._write_fixture(json_path, payload)
             
             # Delay entre peticiones
             delay = random.uniform(self.min_delay, self.max_delay)
             time.sleep(delay)
             
-            return True
+            return 'saved'
             
         except Exception as e:
-            print(f"❌ Error al procesar {season_row.get('temporada', 'N/A')}: {str(e)}")
-            return False
+            self.log.error("❌ Error al procesar %s: %s", season_row.get('temporada', 'N/A'), e)
+            return 'error'
+    
+    async def save_fixture_json_async(self, client: httpx.AsyncClient,
+                                      season_row: Union[pd.Series, Dict], skip_existing: bool = True,
+                                      save_raw: bool = True) -> SaveOutcome:
+        """
+        Versión asíncrona de save_fixture_json para descargas concurrentes.
+        
+        El directorio de destino debe existir; process_seasons los crea todos
+        antes de lanzar las descargas.
+        
+        Args:
+            client (httpx.AsyncClient): Cliente httpx del lote
+            season_row (pd.Series | Dict): Fila del DataFrame de temporadas
+            skip_existing (bool): Si saltar archivos que ya existen
+            save_raw (bool): Si guardar el JSON tal como llega de la API
+            
+        Returns:
+            SaveOutcome: 'saved', 'skipped' (ya existía) o 'error'
+        """
+        try:
+            target = self._prepare_fixture_target(season_row)
+            if not target:
+                return 'error'
+            torneo_id, competicion, json_path = target
+            
+            # Si el archivo ya existe y skip_existing es True, saltarlo
+            if skip_existing and os.path.exists(json_path):
+                self.log.info("⏭️  Archivo ya existe (saltando): %s", json_path)
+                return 'skipped'
+            
+            # Descargar y guardar el fixture
+            if save_raw:
+                await self.descargar_fixture_a_archivo_async(
+                    client,
+                    torneo_id=torneo_id,
+                    competicion_name=competicion,
+                    json_path=json_path,
+                    referer=season_row['url_temporada']
+                )
+            else:
+                payload = json_dumps_bytes(await self.obtener_fixture_json_async(
+                    client,
+                    torneo_id=torneo_id,
+                    competicion_name=competicion,
+                    referer=season_row['url_temporada']
+                ))
+                await self._write_fixture_async(json_path, payload)
+            
+            return 'saved'
+            
+        except Exception as e:
+            self.log.error("❌ Error al procesar %s: %s", season_row.get('temporada', 'N/A'), e)
+            return 'error'
+    
+    async def _process_rows_async(self, df_to_process: pd.DataFrame,
+                                  skip_existing: bool, stats: Dict,
+                                  save_raw: bool = True,
+                                  existing: Optional[frozenset] = None) -> None:
+        """
+        Descarga los fixtures de las temporadas como un pipeline asíncrono.
+        
+        Las temporadas entran en una cola de prioridad que consumen
+        max_concurrency workers de descarga sobre un único cliente httpx
+        HTTP/2, con el ritmo global limitado por un AsyncLimiter. Una descarga
+        fallida por un error transitorio (429, 5xx, conexión) vuelve a la cola
+        con menor prioridad (hasta max_requeues veces), así no frena el resto
+        del lote; un 4xx o un JSONP inválido se cuenta como error al momento.
+        Cuando no se guarda el JSON crudo, la escritura a disco la hace una
+        tarea aparte mientras los workers siguen descargando.
+        
+        Args:
+            df_to_process (pd.DataFrame): Temporadas a procesar
+            skip_existing (bool): Si saltar archivos existentes
+            stats (Dict): Estadísticas a actualizar
+            save_raw (bool): Si guardar el JSON tal como llega de la API
+            existing (Optional[frozenset]): Fixtures ya guardados, si el llamador
+                                            ya los buscó (si no, se buscan aquí)
+        """
+        total = len(df_to_process)
+        json_paths = self.compute_all_json_paths(df_to_process).tolist()
+        
+        # Crear de una vez los directorios de destino del lote
+        for dir_path in {os.path.dirname(p) for p in json_paths if isinstance(p, str)}:
+            os.makedirs(dir_path, exist_ok=True)
+        
+        if not skip_existing:
+            existing = frozenset()
+        elif existing is None:
+            existing = self.existing_fixture_paths()
+        self.limiter = AsyncLimiter(self.max_rate, self.time_period)
+        limits = httpx.Limits(max_connections=50)
+        
+        # Cola de descargas: (intento, posición, fila, ruta); los reintentos
+        # tienen un intento mayor y se atienden después de las pendientes
+        fetch_queue = asyncio.PriorityQueue()
+        write_queue = asyncio.Queue(maxsize=self.max_concurrency)
+        
+        # Filas como dicts: evita construir una Series por fila como iterrows
+        rows = df_to_process.to_dict('records')
+        for idx, (row, json_path) in enumerate(zip(rows, json_paths)):
+            fetch_queue.put_nowait((0, idx, row, json_path))
+        
+        def finish(outcome: SaveOutcome) -> None:
+            stats[_OUTCOME_STATS[outcome]] += 1
+            stats['processed'] += 1
+            pbar.update(1)
+            pbar.set_postfix(ok=stats['success'], skip=stats['skipped'],
+                             err=stats['errors'], refresh=False)
+        
+        async def fetcher(client: httpx.AsyncClient) -> None:
+            while True:
+                attempt, idx, row, json_path = await fetch_queue.get()
+                try:
+                    if attempt == 0:
+                        self.log.info("📋 Procesando %d/%d: %s - %s", idx + 1, total,
+                                      row.get('competicion', 'N/A'), row.get('temporada', 'N/A'))
+                    
+                    if json_path in existing:
+                        self.log.info("⏭️  Archivo ya existe (saltando): %s", json_path)
+                        finish('skipped')
+                        continue
+                    
+                    target = self._prepare_fixture_target(row)
+                    if not target:
+                        finish('error')
+                        continue
+                    torneo_id, competicion, json_path = target
+                    
+                    try:
+                        if save_raw:
+                            await self.descargar_fixture_a_archivo_async(
+                                client,
+                                torneo_id=torneo_id,
+                                competicion_name=competicion,
+                                json_path=json_path,
+                                referer=row['url_temporada']
+                            )
+                            finish('saved')
+                        else:
+                            fixture_data = await self.obtener_fixture_json_async(
+                                client,
+                                torneo_id=torneo_id,
+                                competicion_name=competicion,
+                                referer=row['url_temporada']
+                            )
+                            await write_queue.put((json_path, json_dumps_bytes(fixture_data)))
+                    except Exception as e:
+                        # Solo vuelven a la cola los fallos transitorios
+                        if attempt < self.max_requeues and _is_transient(e):
+                            self.log.warning("🔁 Reintento %d más tarde para %s: %s", attempt + 1,
+                                             row.get('temporada', 'N/A'), e)
+                            fetch_queue.put_nowait((attempt + 1, idx, row, json_path))
+                        else:
+                            self.log.error("❌ Error al procesar %s: %s", row.get('temporada', 'N/A'), e)
+                            finish('error')
+                
+                except Exception as e:
+                    self.log.error("❌ Error inesperado en temporada %d: %s", idx, e)
+                    finish('error')
+                finally:
+                    fetch_queue.task_done()
+        
+        async def writer() -> None:
+            while True:
+                json_path, payload = await write_queue.get()
+                try:
+                    await self._write_fixture_async(json_path, payload)
+                    finish('saved')
+                except OSError as e:
+                    self.log.error("❌ Error al escribir %s: %s", json_path, e)
+                    finish('error')
+                finally:
+                    write_queue.task_done()
+        
+        async with httpx.AsyncClient(http2=True, limits=limits, headers=self.headers,
+                                     timeout=60) as client:
+            with tqdm(total=total, desc="Fixtures", unit="temp") as pbar:
+                tasks = [asyncio.create_task(fetcher(client))
+                         for _ in range(max(1, min(self.max_concurrency, total)))]
+                tasks.append(asyncio.create_task(writer()))
+                try:
+                    await fetch_queue.join()
+                    await write_queue.join()
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    self.limiter = None
     
     def process_seasons(self, 
                        df_seasons: pd.DataFrame,
                        filters: Optional[Dict] = None,
                        skip_existing: bool = True,
                        start_index: int = 0,
-                       limit: Optional[int] = None) -> Dict:
+                       limit: Optional[int] = None,
+                       save_raw: bool = True,
+                       existing: Optional[frozenset] = None) -> Dict:
         """
         Procesa múltiples temporadas para descargar fixtures.
         
@@ -251,6 +835,11 @@ class FixtureScraper:
             skip_existing (bool): Si saltar archivos existentes
             start_index (int): Índice de inicio
             limit (Optional[int]): Límite de temporadas a procesar
+            save_raw (bool): Si guardar el JSON tal como llega de la API (sin
+                             re-serializarlo con indentación)
+            existing (Optional[frozenset]): Fixtures ya guardados (ver
+                                            existing_fixture_paths) para no
+                                            volver a recorrer el directorio
             
         Returns:
             Dict: Estadísticas del procesamiento
@@ -283,35 +872,12 @@ class FixtureScraper:
                 'start_time': time.time()
             }
             
-            # Procesar cada temporada
-            for idx, (_, row) in enumerate(df_to_process.iterrows()):
-                try:
-                    competition_info = f"{row.get('competicion', 'N/A')} - {row.get('temporada', 'N/A')}"
-                    print(f"\n📋 Procesando {idx + 1}/{len(df_to_process)}: {competition_info}")
-                    
-                    # Intentar guardar fixture
-                    result = self.save_fixture_json(row, skip_existing)
-                    
-                    stats['processed'] += 1
-                    
-                    if result:
-                        if skip_existing and os.path.exists(self._get_json_path(row)):
-                            stats['skipped'] += 1
-                        else:
-                            stats['success'] += 1
-                    else:
-                        stats['errors'] += 1
-                    
-                    # Mostrar progreso cada 10 elementos
-                    if (idx + 1) % 10 == 0:
-                        self._print_progress(stats, idx + 1, len(df_to_process))
-                
-                except KeyboardInterrupt:
-                    print(f"\n⚠️  Procesamiento interrumpido por el usuario")
-                    break
-                except Exception as e:
-                    print(f"❌ Error inesperado en temporada {idx}: {e}")
-                    stats['errors'] += 1
+            # Procesar temporadas de forma concurrente
+            try:
+                run_async(self._process_rows_async(df_to_process, skip_existing, stats,
+                                                   save_raw, existing))
+            except KeyboardInterrupt:
+                print(f"\n⚠️  Procesamiento interrumpido por el usuario")
             
             # Calcular tiempo total
             stats['duration'] = time.time() - stats['start_time']
@@ -339,17 +905,19 @@ class FixtureScraper:
         if not filters:
             return df
         
-        df_filtered = df.copy()
+        # Combinar todos los filtros en una sola máscara y aplicarla una vez
+        mask = np.ones(len(df), dtype=bool)
         
         for column, value in filters.items():
-            if column in df_filtered.columns:
+            if column in df.columns:
+                col_values = df[column].to_numpy()
                 if isinstance(value, list):
-                    df_filtered = df_filtered[df_filtered[column].isin(value)]
+                    mask &= np.isin(col_values, value)
                 else:
-                    df_filtered = df_filtered[df_filtered[column] == value]
-                print(f"🔍 Filtro aplicado - {column}: {value} → {len(df_filtered)} temporadas")
+                    mask &= col_values == value
+                print(f"🔍 Filtro aplicado - {column}: {value} → {int(mask.sum())} temporadas")
         
-        return df_filtered
+        return df[mask]
     
     def _get_json_path(self, row: pd.Series) -> str:
         """
@@ -376,18 +944,64 @@ class FixtureScraper:
             'fixture.json'
         )
     
-    def _print_progress(self, stats: Dict, current: int, total: int) -> None:
+    def compute_all_json_paths(self, df: pd.DataFrame) -> pd.Series:
         """
-        Imprime el progreso del procesamiento.
+        Construye la ruta del fixture.json de todas las temporadas de una vez.
+        
+        Equivale a aplicar _get_json_path fila por fila, pero con operaciones
+        de strings vectorizadas de pandas. Las columnas se pasan a texto con
+        str() igual que por fila (un NaN queda como 'nan'); astype(str)
+        conserva los NaN desde pandas 3 y la ruta saldría NaN.
+        
+        Args:
+            df (pd.DataFrame): DataFrame de temporadas
+            
+        Returns:
+            pd.Series: Rutas con el mismo índice que df (NaN si no se pudo
+                       extraer el nombre de la temporada)
         """
-        elapsed = time.time() - stats['start_time']
-        rate = current / elapsed if elapsed > 0 else 0
+        def _safe(column: str) -> pd.Series:
+            return df[column].map(str).str.replace('/', '_', regex=False)
+        
+        season_names = df['url_resultados'].map(get_season_name_from_url)
         
-        print(f"\n📊 Progreso: {current}/{total} ({current/total*100:.1f}%)")
-        print(f"   ⚡ Velocidad: {rate:.2f} temporadas/min")
-        print(f"   ✅ Exitosas: {stats['success']}")
-        print(f"   ⏭️  Saltadas: {stats['skipped']}")
-        print(f"   ❌ Errores: {stats['errors']}")
+        return (
+            os.path.join(self.data_dir, '')
+            + _safe('continente') + os.sep
+            + _safe('pais') + os.sep
+            + _safe('competicion') + '_' + df['id_competicion'].map(str) + os.sep
+            + season_names + os.sep + 'fixture.json'
+        )
+    
+    def existing_fixture_paths(self) -> frozenset:
+        """
+        Recorre el árbol de datos una vez y devuelve los fixture.json existentes.
+        
+        El recorrido se limita a continente/pais/competicion/temporada, que es
+        donde _get_json_path ubica los fixtures, sin descender a los
+        subdirectorios de partidos.
+        
+        Returns:
+            frozenset: Rutas (con el mismo formato que _get_json_path) de fixture.json existentes
+        """
+        fixture_depth = 4
+        existing = set()
+        
+        def _gather(path: str, depth: int) -> None:
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if depth == fixture_depth:
+                            if entry.name == 'fixture.json' and entry.is_file():
+                                existing.add(entry.path)
+                        elif entry.is_dir():
+                            _gather(entry.path, depth + 1)
+            except OSError as e:
+                print(f"⚠️  No se pudo listar {path}: {e}")
+        
+        if os.path.isdir(self.data_dir):
+            _gather(self.data_dir, 0)
+        return frozenset(existing)
     
     def _print_final_summary(self, stats: Dict) -> None:
         """
@@ -481,38 +1095,53 @@ def download_all_fixtures(df_seasons: pd.DataFrame,
     )
 
 
-def find_fixture_resume_index(df_seasons: pd.DataFrame, filters: Optional[Dict] = None) -> int:
+def _first_missing_fixture(df_filtered: pd.DataFrame, json_paths: pd.Series, existing: frozenset) -> int:
+    """
+    Devuelve la posición del primer fixture que no está entre los existentes.
+    
+    Args:
+        df_filtered (pd.DataFrame): Subconjunto filtrado de temporadas
+        json_paths (pd.Series): Rutas de fixture.json de cada temporada
+        existing (frozenset): Fixtures ya guardados
+        
+    Returns:
+        int: Posición del primer faltante o len(df_filtered) si no falta ninguno
+    """
+    # Revisar qué fixtures ya existen (sin ruta válida cuenta como faltante)
+    missing = ~json_paths.isin(existing).to_numpy()
+    if missing.any():
+        idx = int(np.argmax(missing))
+        row = df_filtered.iloc[idx]
+        print(f"🔍 Primer fixture faltante encontrado en índice {idx}")
+        print(f"   Competición: {row.get('competicion', 'N/A')}")
+        print(f"   Temporada: {row.get('temporada', 'N/A')}")
+        print(f"   País: {row.get('pais', 'N/A')}")
+        return idx
+    
+    print("✅ Todos los fixtures ya fueron descargados")
+    return len(df_filtered)
+
+
+def find_fixture_resume_index(df_seasons: pd.DataFrame, filters: Optional[Dict] = None,
+                              **scraper_kwargs) -> int:
     """
     Encuentra el índice desde donde continuar basándose en fixtures ya descargados.
     
     Args:
         df_seasons (pd.DataFrame): DataFrame con temporadas
         filters (Dict, optional): Filtros aplicados para determinar el subconjunto
+        **scraper_kwargs: Argumentos adicionales para FixtureScraper (p. ej. data_dir)
         
     Returns:
-        int: Índice desde donde continuar
+        int: Posición (dentro del subconjunto filtrado) desde donde continuar
     """
     try:
         # Aplicar filtros si se proporcionan
-        scraper = FixtureScraper()
+        scraper = FixtureScraper(**scraper_kwargs)
         df_filtered = scraper._apply_filters(df_seasons, filters) if filters else df_seasons
         
-        # Revisar qué fixtures ya existen
-        for idx, row in df_filtered.iterrows():
-            try:
-                json_path = scraper._get_json_path(row)
-                if not os.path.exists(json_path):
-                    print(f"🔍 Primer fixture faltante encontrado en índice {idx}")
-                    print(f"   Competición: {row.get('competicion', 'N/A')}")
-                    print(f"   Temporada: {row.get('temporada', 'N/A')}")
-                    print(f"   País: {row.get('pais', 'N/A')}")
-                    return idx
-            except:
-                # Si hay error al construir la ruta, significa que falta
-                return idx
-        
-        print("✅ Todos los fixtures ya fueron descargados")
-        return len(df_filtered)
+        return _first_missing_fixture(df_filtered, scraper.compute_all_json_paths(df_filtered),
+                                      scraper.existing_fixture_paths())
         
     except Exception as e:
         print(f"⚠️  Error al buscar punto de reanudación: {e}")
@@ -566,37 +1195,28 @@ def smart_download_fixtures(df_seasons: pd.DataFrame,
     print(f"🎯 Filtros aplicados: {filters if filters else 'Ninguno'}")
     print(f"📋 Temporadas a procesar: {len(df_filtered)}")
     
+    existing = scraper.existing_fixture_paths()
+    json_paths = scraper.compute_all_json_paths(df_filtered)
+    already_saved = json_paths[json_paths.isin(existing)]
+    
     # Si restart_from_zero, borrar archivos existentes
     if restart_from_zero:
-        deleted_count = 0
         print("🔥 Modo reinicio: Borrando fixtures existentes...")
         
-        for _, row in df_filtered.iterrows():
-            try:
-                json_path = scraper._get_json_path(row)
-                if os.path.exists(json_path):
-                    os.remove(json_path)
-                    deleted_count += 1
-            except:
-                pass
+        # unlink libera el GIL, así que los borrados se solapan en hilos
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            deleted_count = sum(executor.map(_try_unlink, already_saved))
         
         print(f"🗑️  Eliminados {deleted_count} fixtures existentes")
         start_index = 0
     else:
-        # Encontrar desde dónde continuar
-        start_index = find_fixture_resume_index(df_seasons, filters)
+        # Encontrar desde dónde continuar con los fixtures ya buscados
+        start_index = _first_missing_fixture(df_filtered, json_paths, existing)
         
         if start_index >= len(df_filtered):
             print("✅ Todos los fixtures ya están descargados")
             # Calcular estadísticas de lo existente
-            existing_count = 0
-            for _, row in df_filtered.iterrows():
-                try:
-                    json_path = scraper._get_json_path(row)
-                    if os.path.exists(json_path):
-                        existing_count += 1
-                except:
-                    pass
+            existing_count = len(already_saved)
             
             return {
                 'total_seasons': len(df_filtered),
@@ -614,23 +1234,14 @@ def smart_download_fixtures(df_seasons: pd.DataFrame,
     
     print(f"🚀 Empezando descarga desde temporada {start_index + 1}/{len(df_filtered)}")
     
-    # Calcular índices relativos al DataFrame filtrado
-    start_idx_filtered = 0
-    for idx, (orig_idx, row) in enumerate(df_filtered.iterrows()):
-        if orig_idx >= df_seasons.index[start_index]:
-            start_idx_filtered = idx
-            break
-    
-    # Procesar fixtures
-    stats = download_fixtures_by_filters(
+    # Procesar fixtures reutilizando el scraper y los fixtures ya buscados
+    stats = scraper.process_seasons(
         df_seasons,
-        continente=continente,
-        pais=pais,
-        competicion=competicion,
+        filters=filters,
         skip_existing=not restart_from_zero,  # Si restart, no skip
         start_index=start_index,
         limit=batch_size,
-        **scraper_kwargs
+        existing=existing
     )
     
     # Agregar información de progreso
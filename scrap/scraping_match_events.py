@@ -11,17 +11,35 @@ Fecha: Julio 2025
 """
 
 import os
+import re
 import json
+import operator
 import time
+import random
+import asyncio
+import httpx
 import requests
+import numpy as np
 import pandas as pd
 from urllib.parse import quote
-from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, reduce
 from requests.adapters import HTTPAdapter
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 # Importar funciones comunes
-from utils_common import sanitize_dir_name
+from utils_common import (TokenBucket, json_dumps_bytes, json_loads, parse_retry_after,
+                          run_async, sanitize_dir_name)
+
+
+# Apertura de un JSONP con callback desconocido: sólo recorre hasta el primer "("
+_JSONP_OPEN = re.compile(rb'^[^(]*\(')
+
+
+@lru_cache(maxsize=1024)
+def _quote_name(name: str) -> str:
+    """Codifica un nombre de competición o temporada para la URL (memorizado)."""
+    return quote(name)
 
 
 class MatchEventScraper:
@@ -29,11 +47,36 @@ class MatchEventScraper:
     Clase para hacer scraping de eventos de partidos desde la API de ScoresWay.
     """
     
+    # Respuestas que se reintentan (incluye 429 Too Many Requests)
+    RETRY_STATUSES = (500, 502, 503, 504, 429)
+    
+    # Variantes de nombre de columna admitidas para cada dato del partido
+    MATCH_COLUMNS = {
+        'partido_id': ('Partido_ID', 'Partido ID'),
+        'continente': ('Continente', 'continente'),
+        'pais': ('Pais', 'pais'),
+        'competicion': ('Competicion', 'competicion'),
+        'id_competicion': ('ID_Competicion', 'id_competicion'),
+        'torneo_id': ('Torneo_ID', 'torneo_id'),
+        'temporada': ('Temporada', 'temporada'),
+        'equipo_local': ('Equipo_Local', 'Equipo Local'),
+        'equipo_visitante': ('Equipo_Visitante', 'Equipo Visitante'),
+        'fecha': ('Fecha',),
+    }
+    
+    # Datos sin los cuales no se puede ubicar el archivo del partido
+    ESSENTIAL_FIELDS = ('partido_id', 'continente', 'pais', 'competicion', 'id_competicion', 'torneo_id')
+    
+    # Datos con pocos valores distintos que se guardan como category
+    CATEGORY_FIELDS = ('continente', 'pais', 'competicion', 'id_competicion', 'torneo_id')
+    
     def __init__(self, 
                  sdapi_outlet_key: str = 'ft1tiv1inq7v1sk3y9tv12yh5',
                  callback_id: str = 'W308c28470cb75c54dfa5b4fdc707239ca49953812',
                  base_url: str = "https://www.scoresway.com",
-                 data_dir: str = 'data'):
+                 data_dir: str = 'data',
+                 max_concurrency: int = 6,
+                 indent_json: bool = True):
         """
         Inicializa el scraper de eventos de partidos.
         
@@ -42,12 +85,17 @@ class MatchEventScraper:
             callback_id (str): ID del callback para JSONP
             base_url (str): URL base del sitio web
             data_dir (str): Directorio base de datos
+            max_concurrency (int): Descargas simultáneas en descargar_eventos_masivo
+            indent_json (bool): Si guardar los eventos indentados; con False se
+                                escriben compactos (más pequeños y rápidos de escribir)
         """
         self.sdapi_outlet_key = sdapi_outlet_key
         self.callback_id = callback_id
+        self._jsonp_prefix = f"{callback_id}(".encode()
         self.base_url = base_url
         self.api_base_url = "https://api.performfeeds.com/soccerdata/matchevent"
         self.data_dir = data_dir
+        self.indent_json = indent_json
         
         # Configurar headers
         # self.headers = {
@@ -93,6 +141,9 @@ class MatchEventScraper:
             "user-agent": "Mozilla/5.0 (Linux; Android 6.0; Nexus 5 Build/MRA58N) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Mobile Safari/537.36"
         }
         
+        # Configuración de descargas concurrentes
+        self.max_concurrency = max_concurrency
+        
         # Configurar sesión con reintentos
         self.session = self._create_session_with_retries()
         
@@ -100,24 +151,51 @@ class MatchEventScraper:
         self.sleep_time = 1.0
         self.max_retries = 3
         
+        # Backoff exponencial con "full jitter" (segundos)
+        self.retry_base = 1.0
+        self.retry_cap = 30.0
+        
+        # Ritmo de peticiones adaptativo (se guarda entre ejecuciones)
+        self.rate_state_path = os.path.join(self.data_dir, '_events_rate.json')
+        self.bucket = self._create_bucket()
+        
+        # Directorios de partidos ya creados y referers ya construidos,
+        # por (continente, pais, competicion, id_competicion, torneo_id)
+        # y (competicion, temporada, torneo_id) respectivamente
+        self._dir_cache: Dict[tuple, str] = {}
+        self._referer_cache: Dict[tuple, str] = {}
+        
+        # Directorios ya creados en esta sesión
+        self._created_dirs = set()
+        
+        # Manifiesto de eventos descargados (se carga al primer uso)
+        self.manifest_path = os.path.join(self.data_dir, '_downloaded_events.log')
+        self._downloaded: Optional[set] = None
+        
         # Contadores para estadísticas
         self.reset_stats()
     
     def _create_session_with_retries(self) -> requests.Session:
         """
-        Crea una sesión de requests con estrategia de reintentos.
+        Crea una sesión de requests con el pool de conexiones dimensionado.
+        
+        Todas las peticiones van al mismo host, así que el pool de ese host
+        se dimensiona según max_concurrency para reutilizar conexiones en vez
+        de descartarlas cuando varias peticiones coinciden. Los reintentos
+        los gestiona _get_with_retries (con jitter y Retry-After), no urllib3.
+        Los headers base quedan en la sesión; cada petición sólo aporta su referer.
         
         Returns:
             requests.Session: Sesión configurada
         """
         session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[500, 502, 503, 504, 429],
-            allowed_methods=["GET"]
+        session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            max_retries=0,
+            pool_connections=4,
+            pool_maxsize=max(10, self.max_concurrency),
+            pool_block=False
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         return session
@@ -139,17 +217,61 @@ class MatchEventScraper:
         """
         self.sdapi_outlet_key = sdapi_outlet_key
         self.callback_id = callback_id
+        self._jsonp_prefix = f"{callback_id}(".encode()
         print(f"✅ Credenciales de API actualizadas")
     
     def set_delay(self, sleep_time: float) -> None:
         """
         Configura el tiempo de espera entre peticiones.
         
+        Define el ritmo máximo del token bucket (1/sleep_time peticiones por
+        segundo); si hay un ritmo guardado de una ejecución anterior por debajo
+        de ese máximo se parte de él, ya que refleja el cupo real de la API.
+        
         Args:
             sleep_time (float): Tiempo en segundos
         """
         self.sleep_time = sleep_time
-        print(f"⏱️  Delay configurado a {sleep_time} segundos")
+        self.bucket = self._create_bucket()
+        print(f"⏱️  Delay configurado a {sleep_time} segundos (ritmo inicial: {self.bucket.rate:.2f} peticiones/segundo)")
+    
+    def _create_bucket(self) -> TokenBucket:
+        """
+        Crea el token bucket con 1/sleep_time como ritmo máximo.
+        
+        Parte del ritmo guardado si lo hay (recortado a ese máximo); el bucket
+        lo sube con cada respuesta correcta sin pasar nunca de 1/sleep_time.
+        
+        Returns:
+            TokenBucket: Limitador de ritmo de peticiones
+        """
+        max_rate = 1.0 / self.sleep_time if self.sleep_time > 0 else float('inf')
+        rate = self._load_saved_rate()
+        if rate is None or rate > max_rate:
+            rate = max_rate
+        return TokenBucket(rate=rate, max_rate=max_rate)
+    
+    def _load_saved_rate(self) -> Optional[float]:
+        """
+        Lee el ritmo de peticiones guardado en la última ejecución.
+        
+        Returns:
+            Optional[float]: Peticiones por segundo o None si no hay uno válido
+        """
+        try:
+            with open(self.rate_state_path, 'r', encoding='utf-8') as f:
+                return float(json.load(f)['rate'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _save_rate(self) -> None:
+        """Guarda el ritmo actual del token bucket para la próxima ejecución."""
+        try:
+            os.makedirs(os.path.dirname(self.rate_state_path) or '.', exist_ok=True)
+            with open(self.rate_state_path, 'w', encoding='utf-8') as f:
+                json.dump({'rate': self.bucket.rate}, f)
+        except OSError as e:
+            print(f"⚠️  No se pudo guardar el ritmo de peticiones: {e}")
     
     def descargar_evento_partido(self, match_row: pd.Series, skip_existing: bool = True) -> bool:
         """
@@ -162,69 +284,107 @@ class MatchEventScraper:
         Returns:
             bool: True si se descargó exitosamente, False en caso contrario
         """
+        partido_id = None
         try:
             # Extraer datos del partido
-            partido_id = match_row.get('Partido_ID') or match_row.get('Partido ID')
-            continente = match_row.get('Continente') or match_row.get('continente')
-            pais = match_row.get('Pais') or match_row.get('pais')
-            competicion = match_row.get('Competicion') or match_row.get('competicion')
-            id_competicion = match_row.get('ID_Competicion') or match_row.get('id_competicion')
-            torneo_id = match_row.get('Torneo_ID') or match_row.get('torneo_id')
-            temporada = match_row.get('Temporada') or match_row.get('temporada')
-            equipo_local = match_row.get('Equipo_Local') or match_row.get('Equipo Local')
-            equipo_visitante = match_row.get('Equipo_Visitante') or match_row.get('Equipo Visitante')
-            fecha = match_row.get('Fecha')
-            
-            # Validar datos esenciales
-            if not all([partido_id, continente, pais, competicion, id_competicion, torneo_id]):
-                print(f"⚠️  Datos insuficientes para partido {partido_id}")
-                return False
+            datos = self._extract_match_fields(match_row)
+            partido_id = datos['partido_id']
             
-            # Crear estructura de directorios
-            dir_path = self._create_match_directory(
-                continente, pais, competicion, id_competicion, torneo_id
-            )
-            
-            # Construir nombre del archivo
-            filename = self._build_filename(
-                partido_id, fecha, equipo_local, equipo_visitante
-            )
-            json_path = os.path.join(dir_path, filename)
+            # Resolver ruta de destino
+            json_path = self._prepare_event_target(datos)
+            if json_path is None:
+                return False
+            filename = os.path.basename(json_path)
             
             # Si el archivo ya existe y skip_existing es True, saltarlo
-            if skip_existing and os.path.exists(json_path):
+            if skip_existing and self._already_downloaded(json_path):
                 print(f"⏭️  Archivo ya existe (saltando): {filename}")
                 self.saltados += 1
                 return True
             
-            # Construir URL de la API
-            url_eventos = self._build_api_url(partido_id)
-            
-            # Construir URL de referencia
-            referer = self._build_referer_url(competicion, temporada, torneo_id)
-            
-            # Actualizar headers con referer
-            headers = self.headers.copy()
-            headers['Referer'] = referer
+            # Construir URL de la API y headers con referer
+            url_eventos, headers = self._build_event_request(datos)
             
             # Realizar petición
-            print(f"🌐 Descargando eventos: {equipo_local} vs {equipo_visitante}")
-            response = self.session.get(url_eventos, headers=headers)
-            response.raise_for_status()
+            print(f"🌐 Descargando eventos: {datos['equipo_local']} vs {datos['equipo_visitante']}")
+            response = self._get_with_retries(url_eventos, headers)
             
             # Extraer JSON de la respuesta JSONP
-            json_data = self._extract_json_from_jsonp(response.text)
+            json_data = self._extract_json_from_jsonp(response.content)
             
             # Guardar archivo
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, ensure_ascii=False, indent=2)
+            self._save_event(json_path, json_data)
             
             print(f"✅ Guardado: {filename}")
             self.exitos += 1
             
-            # Delay entre peticiones
-            time.sleep(self.sleep_time)
+            return True
             
+        except Exception as e:
+            print(f"❌ Error al procesar partido {partido_id}: {str(e)}")
+            self.fallos += 1
+            return False
+    
+    async def descargar_evento_partido_async(self, client: httpx.AsyncClient,
+                                             semaphore: asyncio.Semaphore,
+                                             datos: Dict,
+                                             skip_existing: bool = True,
+                                             write_queue: Optional[asyncio.Queue] = None) -> bool:
+        """
+        Versión asíncrona de descargar_evento_partido sobre un cliente httpx compartido.
+        
+        El semáforo limita las peticiones en vuelo y el token bucket compartido
+        marca el ritmo para no saturar la API. Si se pasa write_queue, el JSON
+        se encola como (ruta, bytes) para el escritor del lote y la corrutina
+        sigue sin esperar al disco.
+        
+        Args:
+            client (httpx.AsyncClient): Cliente httpx del lote
+            semaphore (asyncio.Semaphore): Semáforo que limita la concurrencia
+            datos (Dict): Datos del partido (ver _extract_match_fields)
+            skip_existing (bool): Si saltar archivos que ya existen
+            write_queue (asyncio.Queue, optional): Cola de escritura del lote
+            
+        Returns:
+            bool: True si se descargó exitosamente, False en caso contrario
+        """
+        partido_id = datos['partido_id']
+        try:
+            
+            # Resolver ruta de destino
+            json_path = self._prepare_event_target(datos)
+            if json_path is None:
+                return False
+            filename = os.path.basename(json_path)
+            
+            # Si el archivo ya existe y skip_existing es True, saltarlo
+            if skip_existing and self._already_downloaded(json_path):
+                print(f"⏭️  Archivo ya existe (saltando): {filename}")
+                self.saltados += 1
+                return True
+            
+            # Construir URL de la API y headers con referer
+            url_eventos, headers = self._build_event_request(datos)
+            
+            async with semaphore:
+                # Realizar petición
+                print(f"🌐 Descargando eventos: {datos['equipo_local']} vs {datos['equipo_visitante']}")
+                content = await self._fetch_event_bytes_async(client, url_eventos, headers)
+                
+                # Extraer JSON de la respuesta JSONP
+                json_data = self._extract_json_from_jsonp(content)
+            
+            if write_queue is not None:
+                # El escritor del lote guarda el archivo y cuenta el éxito
+                payload = json_dumps_bytes(json_data, indent=self.indent_json)
+                await write_queue.put((json_path, payload))
+                return True
+            
+            # Guardar archivo sin bloquear el event loop
+            await asyncio.to_thread(self._save_event, json_path, json_data)
+            
+            print(f"✅ Guardado: {filename}")
+            self.exitos += 1
             return True
             
         except Exception as e:
@@ -232,14 +392,407 @@ class MatchEventScraper:
             self.fallos += 1
             return False
     
-    def _create_match_directory(self, continente: str, pais: str, competicion: str, 
-                               id_competicion: str, torneo_id: str) -> str:
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Calcula la espera antes de reintentar una petición.
+        
+        Si el servidor envía Retry-After se respeta; si no, se usa backoff
+        exponencial con "full jitter" (espera aleatoria entre 0 y el tope del
+        intento) para que los clientes concurrentes no reintenten a la vez.
+        
+        Args:
+            attempt (int): Número de intento fallido (empezando en 0)
+            retry_after (str, optional): Valor de la cabecera Retry-After
+            
+        Returns:
+            float: Segundos a esperar
+        """
+        if retry_after:
+            return parse_retry_after(retry_after)
+        return random.uniform(0, min(self.retry_cap, self.retry_base * 2 ** attempt))
+    
+    def _get_with_retries(self, url: str, headers: Dict) -> requests.Response:
+        """
+        Realiza un GET reintentando ante 429, errores 5xx y fallos de conexión.
+        
+        Args:
+            url (str): URL de la API
+            headers (Dict): Headers con el referer
+            
+        Returns:
+            requests.Response: Respuesta exitosa
+            
+        Raises:
+            requests.exceptions.RequestException: Si se agotan los reintentos
+        """
+        for attempt in range(self.max_retries + 1):
+            self.bucket.acquire_sync()
+            try:
+                response = self.session.get(url, headers=headers)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(self._retry_delay(attempt))
+                continue
+            
+            if response.status_code == 429:
+                self.bucket.decrease_rate()
+            
+            if response.status_code in self.RETRY_STATUSES and attempt < self.max_retries:
+                retry_after = response.headers.get('Retry-After') if response.status_code == 429 else None
+                time.sleep(self._retry_delay(attempt, retry_after))
+                continue
+            
+            response.raise_for_status()
+            self.bucket.increase_rate()
+            return response
+    
+    async def _fetch_event_bytes_async(self, client: httpx.AsyncClient,
+                                       url: str, headers: Dict) -> bytes:
+        """
+        Pide la respuesta JSONP de un partido reintentando ante 429, errores 5xx
+        y fallos de conexión, con las mismas esperas que _get_with_retries.
+        
+        Args:
+            client (httpx.AsyncClient): Cliente httpx del lote
+            url (str): URL de la API
+            headers (Dict): Headers con el referer
+            
+        Returns:
+            bytes: Contenido JSONP de la respuesta
+            
+        Raises:
+            httpx.HTTPError: Si se agotan los reintentos
+        """
+        for attempt in range(self.max_retries + 1):
+            await self.bucket.acquire()
+            try:
+                response = await client.get(url, headers=headers)
+            except httpx.TransportError:
+                if attempt >= self.max_retries:
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt))
+                continue
+            
+            if response.status_code == 429:
+                self.bucket.decrease_rate()
+            
+            if response.status_code in self.RETRY_STATUSES and attempt < self.max_retries:
+                retry_after = response.headers.get('Retry-After') if response.status_code == 429 else None
+                await asyncio.sleep(self._retry_delay(attempt, retry_after))
+                continue
+            
+            response.raise_for_status()
+            self.bucket.increase_rate()
+            return response.content
+    
+    def _extract_match_fields(self, match_row: pd.Series) -> Dict:
+        """
+        Extrae los datos del partido admitiendo las distintas variantes de columnas.
+        
+        Args:
+            match_row (pd.Series): Fila del DataFrame con información del partido
+            
+        Returns:
+            Dict: Datos del partido
+        """
+        datos = {}
+        for campo, variantes in self.MATCH_COLUMNS.items():
+            valor = None
+            for columna in variantes:
+                valor = match_row.get(columna)
+                if valor:
+                    break
+            datos[campo] = valor
+        return datos
+    
+    def _resolve_match_columns(self, df: pd.DataFrame) -> Dict[str, Optional[str]]:
+        """
+        Resuelve una sola vez qué variante de cada columna tiene el DataFrame.
+        
+        Args:
+            df (pd.DataFrame): DataFrame de partidos
+            
+        Returns:
+            Dict[str, Optional[str]]: Columna real para cada dato (None si no está)
+        """
+        return {
+            campo: next((col for col in variantes if col in df.columns), None)
+            for campo, variantes in self.MATCH_COLUMNS.items()
+        }
+    
+    def _iter_match_fields(self, df: pd.DataFrame) -> Iterator[Dict]:
+        """
+        Recorre los partidos de un DataFrame devolviendo sus datos como diccionarios.
+        
+        Usa itertuples sobre las columnas ya resueltas en lugar de iterrows,
+        evitando construir una Series por fila.
+        
+        Args:
+            df (pd.DataFrame): DataFrame de partidos
+            
+        Yields:
+            Dict: Datos del partido (mismas claves que _extract_match_fields)
+        """
+        columnas = self._resolve_match_columns(df)
+        campos = [campo for campo, col in columnas.items() if col is not None]
+        faltantes = {campo: None for campo, col in columnas.items() if col is None}
+        
+        for valores in df[[columnas[campo] for campo in campos]].itertuples(index=False, name=None):
+            datos = dict(zip(campos, valores))
+            datos.update(faltantes)
+            yield datos
+    
+    def _event_json_path(self, datos: Dict) -> Optional[str]:
+        """
+        Construye la ruta del archivo de eventos (sin crear su directorio).
+        
+        Args:
+            datos (Dict): Datos del partido (ver _extract_match_fields)
+            
+        Returns:
+            Optional[str]: Ruta del archivo JSON o None si faltan datos esenciales
+        """
+        # Validar datos esenciales (vacíos o NaN)
+        if not all(pd.notna(datos[campo]) and datos[campo] for campo in self.ESSENTIAL_FIELDS):
+            return None
+        
+        # Crear estructura de directorios
+        dir_path = self._match_directory_path(
+            datos['continente'], datos['pais'], datos['competicion'],
+            datos['id_competicion'], datos['torneo_id']
+        )
+        
+        # Construir nombre del archivo
+        filename = self._build_filename(
+            datos['partido_id'], datos['fecha'], datos['equipo_local'], datos['equipo_visitante']
+        )
+        return os.path.join(dir_path, filename)
+    
+    def _prepare_event_target(self, datos: Dict) -> Optional[str]:
+        """
+        Resuelve la ruta del archivo de eventos avisando si faltan datos.
+        
+        Args:
+            datos (Dict): Datos del partido (ver _extract_match_fields)
+            
+        Returns:
+            Optional[str]: Ruta del archivo JSON o None si faltan datos esenciales
+        """
+        json_path = self._event_json_path(datos)
+        if json_path is None:
+            print(f"⚠️  Datos insuficientes para partido {datos['partido_id']}")
+        return json_path
+    
+    def _build_event_request(self, datos: Dict) -> Tuple[str, Dict]:
+        """
+        Construye la URL de la API y los headers para pedir los eventos de un partido.
+        
+        Los headers base ya están en la sesión (requests o httpx), que los
+        combina con los de cada petición; aquí sólo se añade el referer.
+        
+        Args:
+            datos (Dict): Datos del partido (ver _extract_match_fields)
+            
+        Returns:
+            Tuple[str, Dict]: URL de la API y headers con el referer
+        """
+        url_eventos = self._build_api_url(datos['partido_id'])
+        referer = self._build_referer_url(datos['competicion'], datos['temporada'], datos['torneo_id'])
+        
+        return url_eventos, {'Referer': referer}
+    
+    def _save_event(self, json_path: str, json_data: Dict) -> None:
+        """
+        Guarda los eventos de un partido y lo anota en el manifiesto.
+        
+        Args:
+            json_path (str): Ruta del archivo JSON
+            json_data (Dict): Eventos del partido
+        """
+        self._ensure_directories([os.path.dirname(json_path)])
+        self._write_event_json(json_path, json_data)
+        self._record_download(json_path)
+    
+    def _save_event_batch(self, batch: List[Tuple[str, bytes]]) -> List[Optional[str]]:
+        """
+        Guarda un lote de eventos ya serializados y los anota en el manifiesto
+        con una sola escritura.
+        
+        Args:
+            batch (List[Tuple[str, bytes]]): Pares (ruta del JSON, contenido)
+            
+        Returns:
+            List[Optional[str]]: Por cada archivo, None si se guardó o el
+            mensaje de error en caso contrario
+        """
+        self._ensure_directories({os.path.dirname(json_path) for json_path, _ in batch})
+        
+        errors = []
+        saved = []
+        for json_path, payload in batch:
+            try:
+                with open(json_path, 'wb') as f:
+                    f.write(payload)
+                saved.append(json_path)
+                errors.append(None)
+            except OSError as e:
+                errors.append(str(e))
+        
+        self._record_downloads(saved)
+        return errors
+    
+    async def _event_writer(self, write_queue: asyncio.Queue, batch_size: int = 50) -> None:
         """
-        Crea la estructura de directorios para los eventos de partidos.
+        Escritor del lote: vacía la cola de escritura en grupos de hasta
+        batch_size archivos, cada grupo en un único salto a un hilo.
+        
+        No espera a llenar el grupo: toma lo que haya en la cola en ese momento,
+        así que un archivo nunca se queda esperando a que lleguen otros.
+        
+        Args:
+            write_queue (asyncio.Queue): Cola de pares (ruta, bytes)
+            batch_size (int): Máximo de archivos por grupo
+        """
+        while True:
+            batch = [await write_queue.get()]
+            while len(batch) < batch_size and not write_queue.empty():
+                batch.append(write_queue.get_nowait())
+            
+            try:
+                errors = await asyncio.to_thread(self._save_event_batch, batch)
+            except Exception as e:
+                errors = [str(e)] * len(batch)
+            
+            for (json_path, _), error in zip(batch, errors):
+                filename = os.path.basename(json_path)
+                if error is None:
+                    print(f"✅ Guardado: {filename}")
+                    self.exitos += 1
+                else:
+                    print(f"❌ Error al escribir {filename}: {error}")
+                    self.fallos += 1
+                write_queue.task_done()
+    
+    def _already_downloaded(self, json_path: str) -> bool:
+        """
+        Indica si los eventos de un partido ya están en disco.
+        
+        Primero consulta el manifiesto; si no figura ahí se comprueba el
+        archivo y, si existe, se añade al manifiesto.
+        
+        Args:
+            json_path (str): Ruta del archivo JSON
+            
+        Returns:
+            bool: True si el archivo ya fue descargado
+        """
+        if json_path in self.downloaded_event_paths():
+            return True
+        if os.path.exists(json_path):
+            self._record_download(json_path)
+            return True
+        return False
+    
+    def downloaded_event_paths(self) -> set:
+        """
+        Devuelve los archivos de eventos descargados según el manifiesto.
+        
+        El manifiesto (data_dir/_downloaded_events.log) tiene una ruta relativa
+        a data_dir por línea y se amplía con cada descarga, así que las
+        siguientes ejecuciones no necesitan recorrer el disco. Si no existe,
+        se reconstruye una vez con existing_event_paths. Si se borran eventos
+        a mano hay que llamar a reset_manifest.
         
         Returns:
-            str: Ruta del directorio creado
+            set: Rutas (con el mismo formato que _event_json_path) ya descargadas
+        """
+        if self._downloaded is None:
+            try:
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    self._downloaded = {
+                        os.path.join(self.data_dir, line) for line in f.read().splitlines() if line
+                    }
+            except FileNotFoundError:
+                self._downloaded = set(self.existing_event_paths())
+                self._write_manifest()
+        return self._downloaded
+    
+    def _write_manifest(self) -> None:
+        """Reescribe el manifiesto con las rutas conocidas."""
+        try:
+            os.makedirs(os.path.dirname(self.manifest_path) or '.', exist_ok=True)
+            with open(self.manifest_path, 'w', encoding='utf-8') as f:
+                f.writelines(f"{os.path.relpath(path, self.data_dir)}\n" for path in sorted(self._downloaded))
+        except OSError as e:
+            print(f"⚠️  No se pudo guardar el manifiesto de eventos: {e}")
+    
+    def _record_download(self, json_path: str) -> None:
         """
+        Añade un archivo descargado al manifiesto.
+        
+        Args:
+            json_path (str): Ruta del archivo JSON
+        """
+        self._record_downloads([json_path])
+    
+    def _record_downloads(self, json_paths: List[str]) -> None:
+        """
+        Añade varios archivos descargados al manifiesto con una sola escritura.
+        
+        Args:
+            json_paths (List[str]): Rutas de los archivos JSON
+        """
+        downloaded = self.downloaded_event_paths()
+        new_paths = [p for p in dict.fromkeys(json_paths) if p not in downloaded]
+        if not new_paths:
+            return
+        downloaded.update(new_paths)
+        try:
+            with open(self.manifest_path, 'a', encoding='utf-8') as f:
+                f.writelines(f"{os.path.relpath(p, self.data_dir)}\n" for p in new_paths)
+        except OSError as e:
+            print(f"⚠️  No se pudo actualizar el manifiesto de eventos: {e}")
+    
+    def reset_manifest(self) -> None:
+        """Borra el manifiesto para que se reconstruya desde el disco en el próximo uso."""
+        self._downloaded = None
+        try:
+            os.remove(self.manifest_path)
+        except FileNotFoundError:
+            pass
+    
+    def _write_event_json(self, json_path: str, json_data: Dict) -> None:
+        """
+        Escribe los eventos de un partido en disco.
+        
+        Se serializa con orjson (si está instalado) a bytes UTF-8, indentados
+        o compactos según indent_json, y se escribe en una sola llamada.
+        
+        Args:
+            json_path (str): Ruta del archivo JSON
+            json_data (Dict): Eventos del partido
+        """
+        with open(json_path, 'wb') as f:
+            f.write(json_dumps_bytes(json_data, indent=self.indent_json))
+    
+    def _match_directory_path(self, continente: str, pais: str, competicion: str, 
+                              id_competicion: str, torneo_id: str) -> str:
+        """
+        Construye la ruta del directorio de eventos de un torneo.
+        
+        Sólo arma la ruta (los directorios se crean con _ensure_directories).
+        Se memoiza por torneo: los partidos de un mismo torneo no vuelven a
+        limpiar nombres.
+        
+        Returns:
+            str: Ruta del directorio
+        """
+        key = (continente, pais, competicion, id_competicion, torneo_id)
+        dir_path = self._dir_cache.get(key)
+        if dir_path is not None:
+            return dir_path
+        
         # Limpiar nombres para directorios
         continente_clean = sanitize_dir_name(continente)
         pais_clean = sanitize_dir_name(pais)
@@ -254,9 +807,30 @@ class MatchEventScraper:
             'matches'
         )
         
-        os.makedirs(dir_path, exist_ok=True)
+        self._dir_cache[key] = dir_path
         return dir_path
     
+    def _ensure_directories(self, dir_paths) -> None:
+        """
+        Crea los directorios indicados que aún no se hayan creado en esta sesión.
+        
+        Con varios directorios pendientes, os.makedirs se reparte en un
+        ThreadPoolExecutor.
+        
+        Args:
+            dir_paths (Iterable[str]): Directorios a crear
+        """
+        pending = [d for d in set(dir_paths) if d not in self._created_dirs]
+        if not pending:
+            return
+        
+        if len(pending) == 1:
+            os.makedirs(pending[0], exist_ok=True)
+        else:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(lambda d: os.makedirs(d, exist_ok=True), pending))
+        self._created_dirs.update(pending)
+    
     def _build_filename(self, partido_id: str, fecha: str, equipo_local: str, 
                        equipo_visitante: str) -> str:
         """
@@ -286,21 +860,32 @@ class MatchEventScraper:
     
     def _build_referer_url(self, competicion: str, temporada: str, torneo_id: str) -> str:
         """
-        Construye la URL de referencia para la petición.
+        Construye la URL de referencia para la petición (memoizada por torneo).
         
         Returns:
             str: URL de referencia
         """
-        url_base = f'{self.base_url}/en_GB/soccer/'
-        url_competicion = f"{quote(competicion)}-{quote(temporada)}/{torneo_id}"
-        return f"{url_base}{url_competicion}/fixtures"
+        key = (competicion, temporada, torneo_id)
+        referer = self._referer_cache.get(key)
+        if referer is None:
+            url_base = f'{self.base_url}/en_GB/soccer/'
+            url_competicion = f"{_quote_name(competicion)}-{_quote_name(temporada)}/{torneo_id}"
+            referer = self._referer_cache[key] = f"{url_base}{url_competicion}/fixtures"
+        return referer
     
-    def _extract_json_from_jsonp(self, content: str) -> Dict:
+    def _extract_json_from_jsonp(self, content: Union[bytes, str]) -> Dict:
         """
         Extrae JSON puro de una respuesta JSONP.
         
+        Trabaja sobre los bytes de la respuesta y parsea el tramo entre
+        paréntesis con orjson (si está instalado) sin copiarlo. Como el
+        callback es conocido, el prefijo (precalculado) tiene longitud fija y
+        el cierre es ")" o ");", así que los límites salen sin recorrer la
+        respuesta. Si el callback no coincide, la apertura se localiza con
+        una regex anclada que sólo llega hasta el primer paréntesis.
+        
         Args:
-            content (str): Contenido de la respuesta JSONP
+            content (Union[bytes, str]): Contenido de la respuesta JSONP
             
         Returns:
             Dict: Datos JSON extraídos
@@ -308,13 +893,28 @@ class MatchEventScraper:
         Raises:
             Exception: Si no se puede extraer el JSON
         """
-        inicio_json = content.find('(') + 1
-        final_json = content.rfind(')')
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        
+        if content.startswith(self._jsonp_prefix):
+            inicio_json = len(self._jsonp_prefix)
+        else:
+            match = _JSONP_OPEN.match(content)
+            if match is None:
+                raise Exception("Formato de respuesta JSONP inesperado")
+            inicio_json = match.end()
+        
+        if content.endswith(b');'):
+            final_json = len(content) - 2
+        elif content.endswith(b')'):
+            final_json = len(content) - 1
+        else:
+            final_json = content.rfind(b')')
         
-        if inicio_json <= 0 or final_json <= 0 or inicio_json >= final_json:
+        if final_json < inicio_json:
             raise Exception("Formato de respuesta JSONP inesperado")
         
-        return json.loads(content[inicio_json:final_json])
+        return json_loads(memoryview(content)[inicio_json:final_json])
     
     def descargar_eventos_masivo(self, 
                                 df_partidos: pd.DataFrame,
@@ -335,9 +935,40 @@ class MatchEventScraper:
         Returns:
             Dict: Estadísticas del procesamiento
         """
+        start_time = time.time()
+        df_to_process, df_pending = self._select_batch(df_partidos, filters, skip_existing,
+                                                       start_index, limit)
+        
+        # Procesar partidos de forma concurrente
+        try:
+            run_async(self.descargar_eventos_masivo_async(df_pending, skip_existing, start_time))
+        except KeyboardInterrupt:
+            print(f"\n⚠️  Descarga interrumpida por el usuario")
+        
+        return self._finish_batch(df_to_process, start_time)
+    
+    def _select_batch(self,
+                      df_partidos: pd.DataFrame,
+                      filters: Optional[Dict],
+                      skip_existing: bool,
+                      start_index: int,
+                      limit: Optional[int]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Prepara un lote de descargar_eventos_masivo: reinicia las estadísticas,
+        filtra, recorta el rango y descarta los partidos ya descargados.
+        
+        Args:
+            df_partidos (pd.DataFrame): DataFrame con partidos
+            filters (Dict, optional): Filtros para aplicar
+            skip_existing (bool): Si saltar archivos existentes
+            start_index (int): Índice de inicio
+            limit (Optional[int]): Límite de partidos a procesar
+            
+        Returns:
+            Tuple[pd.DataFrame, pd.DataFrame]: Partidos del lote y partidos pendientes de descargar
+        """
         # Reiniciar estadísticas
         self.reset_stats()
-        start_time = time.time()
         
         # Aplicar filtros si se proporcionan
         df_filtered = self._apply_filters(df_partidos, filters)
@@ -347,7 +978,7 @@ class MatchEventScraper:
         if limit:
             end_index = min(start_index + limit, end_index)
         
-        df_to_process = df_filtered.iloc[start_index:end_index]
+        df_to_process = self._as_categories(df_filtered.iloc[start_index:end_index])
         
         print(f"🚀 Iniciando descarga de eventos de partidos...")
         print(f"   - Partidos originales: {len(df_partidos)}")
@@ -355,31 +986,44 @@ class MatchEventScraper:
             print(f"   - Partidos después de filtros: {len(df_filtered)}")
         print(f"   - Partidos a procesar: {len(df_to_process)}")
         print(f"   - Rango: {start_index} a {end_index-1}")
-        print(f"   - Delay entre peticiones: {self.sleep_time} segundos")
+        print(f"   - Ritmo inicial: {self.bucket.rate:.2f} peticiones/segundo")
+        print(f"   - Descargas simultáneas: {self.max_concurrency}")
         
-        # Procesar cada partido
-        for idx, (_, row) in enumerate(df_to_process.iterrows()):
-            try:
-                equipo_local = row.get('Equipo_Local') or row.get('Equipo Local', 'N/A')
-                equipo_visitante = row.get('Equipo_Visitante') or row.get('Equipo Visitante', 'N/A')
-                
-                print(f"\n📋 [{self.procesados + 1}/{len(df_to_process)}] Procesando: {equipo_local} vs {equipo_visitante}")
-                
-                # Intentar descargar eventos
-                self.descargar_evento_partido(row, skip_existing)
-                self.procesados += 1
-                
-                # Mostrar progreso cada 20 elementos
-                if (idx + 1) % 20 == 0:
-                    self._print_progress(idx + 1, len(df_to_process), start_time)
-                
-            except KeyboardInterrupt:
-                print(f"\n⚠️  Descarga interrumpida por el usuario")
-                break
-            except Exception as e:
-                print(f"❌ Error inesperado en partido {idx}: {e}")
-                self.fallos += 1
-                self.procesados += 1
+        # Cargar el manifiesto antes de que las escrituras en hilos lo amplíen
+        downloaded = self.downloaded_event_paths()
+        
+        # Descartar de una vez los partidos cuyo archivo ya existe
+        paths = self.compute_all_event_paths(df_to_process)
+        df_pending = df_to_process
+        if skip_existing:
+            already_saved = paths.isin(downloaded).to_numpy()
+            n_saved = int(already_saved.sum())
+            if n_saved:
+                print(f"⏭️  {n_saved} partidos ya descargados (saltando)")
+                self.saltados += n_saved
+                self.procesados += n_saved
+                df_pending = df_to_process[~already_saved]
+                paths = paths[~already_saved]
+        
+        # Crear en paralelo los directorios de los partidos pendientes
+        self._ensure_directories(paths.dropna().map(os.path.dirname).unique())
+        
+        return df_to_process, df_pending
+    
+    def _finish_batch(self, df_to_process: pd.DataFrame, start_time: float) -> Dict:
+        """
+        Cierra un lote de descargar_eventos_masivo: guarda el ritmo alcanzado
+        e imprime el resumen.
+        
+        Args:
+            df_to_process (pd.DataFrame): Partidos del lote
+            start_time (float): Inicio del lote
+            
+        Returns:
+            Dict: Estadísticas del procesamiento
+        """
+        # Recordar el ritmo alcanzado para la próxima ejecución
+        self._save_rate()
         
         # Calcular tiempo total
         duration = time.time() - start_time
@@ -400,6 +1044,156 @@ class MatchEventScraper:
         
         return stats
     
+    async def descargar_eventos_masivo_async(self,
+                                             df_to_process: pd.DataFrame,
+                                             skip_existing: bool = True,
+                                             start_time: Optional[float] = None,
+                                             client: Optional[httpx.AsyncClient] = None) -> None:
+        """
+        Descarga de forma concurrente los eventos de los partidos ya seleccionados.
+        
+        Abre un único cliente httpx con HTTP/2 para todo el lote (todas las
+        peticiones van al mismo host y se multiplexan sobre una conexión) y
+        lanza una corrutina por partido con asyncio.gather; las estadísticas
+        se acumulan en el scraper. Los JSON descargados pasan por una cola
+        acotada a un único escritor, que los guarda por grupos.
+        
+        Args:
+            df_to_process (pd.DataFrame): Partidos a descargar
+            skip_existing (bool): Si saltar archivos existentes
+            start_time (float, optional): Inicio del lote para calcular el progreso
+            client (httpx.AsyncClient, optional): Cliente a reutilizar (p. ej.
+                                                  compartido con las estadísticas);
+                                                  debe llevar self.headers
+        """
+        if client is None:
+            limits = httpx.Limits(max_connections=max(20, self.max_concurrency),
+                                  max_keepalive_connections=10)
+            async with httpx.AsyncClient(http2=True, limits=limits, headers=self.headers,
+                                         timeout=30) as client:
+                await self.descargar_eventos_masivo_async(df_to_process, skip_existing,
+                                                          start_time, client)
+            return
+        
+        start_time = start_time or time.time()
+        # Los partidos ya contados (saltados antes del lote) suman al total
+        total = self.procesados + len(df_to_process)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        write_queue = asyncio.Queue(maxsize=self.max_concurrency * 8)
+        
+        async def _fetch_one(datos: Dict) -> None:
+            await self.descargar_evento_partido_async(client, semaphore, datos, skip_existing,
+                                                      write_queue)
+            self.procesados += 1
+            
+            # Mostrar progreso cada 20 elementos
+            if self.procesados % 20 == 0:
+                self._print_progress(self.procesados, total, start_time)
+        
+        writer = asyncio.create_task(self._event_writer(write_queue))
+        try:
+            await asyncio.gather(*(
+                _fetch_one(datos) for datos in self._iter_match_fields(df_to_process)
+            ))
+            await write_queue.join()
+        finally:
+            writer.cancel()
+            await asyncio.gather(writer, return_exceptions=True)
+    
+    def _as_categories(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convierte a category las columnas de texto de continente, país,
+        competición y torneo.
+        
+        Tienen unos pocos cientos de valores distintos en miles de partidos,
+        así que como category ocupan menos y los filtros y el mapeo de nombres
+        trabajan sobre las categorías. Devuelve un DataFrame nuevo; el
+        original no se modifica.
+        
+        Args:
+            df (pd.DataFrame): DataFrame de partidos
+            
+        Returns:
+            pd.DataFrame: DataFrame con esas columnas como category
+        """
+        columnas = self._resolve_match_columns(df)
+        to_convert = {}
+        for campo in self.CATEGORY_FIELDS:
+            col = columnas[campo]
+            if col is not None and (df[col].dtype == object or pd.api.types.is_string_dtype(df[col].dtype)):
+                to_convert[col] = 'category'
+        return df.astype(to_convert) if to_convert else df
+    
+    def compute_all_event_paths(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Construye la ruta del archivo de eventos de todos los partidos de una vez.
+        
+        Equivale a aplicar _event_json_path fila por fila (sin crear
+        directorios), pero con operaciones de strings vectorizadas de pandas.
+        Si las columnas de directorio son category (ver _as_categories), los
+        nombres se limpian una vez por categoría y no por fila.
+        
+        Args:
+            df (pd.DataFrame): DataFrame de partidos
+            
+        Returns:
+            pd.Series: Rutas con el mismo índice que df (NaN si faltan datos esenciales)
+        """
+        columnas = self._resolve_match_columns(df)
+        
+        def _col(campo: str) -> pd.Series:
+            if columnas[campo] is None:
+                return pd.Series(None, index=df.index, dtype=object)
+            return df[columnas[campo]]
+        
+        def _clean(campo: str) -> pd.Series:
+            return _col(campo).map(lambda v: sanitize_dir_name(str(v))).astype(str)
+        
+        validos = pd.concat(
+            [_col(c).notna() & _col(c).astype(object).astype(bool) for c in self.ESSENTIAL_FIELDS], axis=1
+        ).all(axis=1)
+        fechas = _col('fecha').map(lambda f: sanitize_dir_name(str(f)) if f else "sin_fecha")
+        
+        paths = (
+            os.path.join(self.data_dir, '')
+            + _clean('continente') + os.sep
+            + _clean('pais') + os.sep
+            + _clean('competicion') + '_' + _col('id_competicion').astype(str) + os.sep
+            + _col('torneo_id').astype(str) + os.sep + 'matches' + os.sep
+            + _col('partido_id').astype(str) + '_' + fechas + '_'
+            + _clean('equipo_local') + '_' + _clean('equipo_visitante') + '.json'
+        )
+        return paths.where(validos)
+    
+    def existing_event_paths(self) -> frozenset:
+        """
+        Recorre el árbol de datos una vez y devuelve los archivos de eventos existentes.
+        
+        Sólo se listan los directorios continente/pais/competicion/torneo/matches,
+        que es donde _event_json_path ubica los eventos.
+        
+        Returns:
+            frozenset: Rutas (con el mismo formato que _event_json_path) de archivos existentes
+        """
+        matches_depth = 5
+        existing = set()
+        
+        def _gather(path: str, depth: int) -> None:
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if depth == matches_depth:
+                            if entry.name.endswith('.json') and entry.is_file():
+                                existing.add(entry.path)
+                        elif entry.is_dir() and (depth < matches_depth - 1 or entry.name == 'matches'):
+                            _gather(entry.path, depth + 1)
+            except OSError as e:
+                print(f"⚠️  No se pudo listar {path}: {e}")
+        
+        if os.path.isdir(self.data_dir):
+            _gather(self.data_dir, 0)
+        return frozenset(existing)
+    
     def _apply_filters(self, df: pd.DataFrame, filters: Optional[Dict]) -> pd.DataFrame:
         """
         Aplica filtros al DataFrame de partidos.
@@ -414,33 +1208,30 @@ class MatchEventScraper:
         if not filters:
             return df
         
-        df_filtered = df.copy()
+        # Resolver nombres de columna sin importar mayúsculas ni espacios/guiones bajos
+        normalized = {str(col).lower().replace(' ', '_'): col for col in df.columns}
+        
+        # Reunir un predicado por filtro y combinarlos al final en una sola máscara
+        predicates = []
         
         for column, value in filters.items():
-            # Manejar nombres de columnas con diferentes formatos
-            column_variants = [
-                column,
-                column.replace('_', ' ').title(),
-                column.replace(' ', '_').lower(),
-                column.replace('_', ' ').title().replace(' ', '_')
-            ]
-            
-            found_column = None
-            for variant in column_variants:
-                if variant in df_filtered.columns:
-                    found_column = variant
-                    break
+            found_column = column if column in df.columns else normalized.get(column.lower().replace(' ', '_'))
             
             if found_column:
                 if isinstance(value, list):
-                    df_filtered = df_filtered[df_filtered[found_column].isin(value)]
+                    predicates.append(df[found_column].isin(value))
                 else:
-                    df_filtered = df_filtered[df_filtered[found_column] == value]
-                print(f"🔍 Filtro aplicado - {found_column}: {value} → {len(df_filtered)} partidos")
+                    predicates.append(df[found_column].eq(value))
+                print(f"🔍 Filtro aplicado - {found_column}: {value}")
             else:
-                print(f"⚠️  Columna '{column}' no encontrada. Columnas disponibles: {list(df_filtered.columns)}")
+                print(f"⚠️  Columna '{column}' no encontrada. Columnas disponibles: {list(df.columns)}")
         
-        return df_filtered
+        if not predicates:
+            return df
+        
+        mask = reduce(operator.and_, predicates)
+        print(f"   → {int(mask.sum())} partidos")
+        return df.loc[mask]
     
     def _print_progress(self, current: int, total: int, start_time: float) -> None:
         """
@@ -478,59 +1269,36 @@ class MatchEventScraper:
             print(f"📈 Tasa de éxito: {success_rate:.1f}%")
 
 
-def find_event_resume_index(df_partidos: pd.DataFrame, filters: Optional[Dict] = None) -> int:
+def find_event_resume_index(df_partidos: pd.DataFrame, filters: Optional[Dict] = None,
+                            **scraper_kwargs) -> int:
     """
     Encuentra el índice desde donde continuar basándose en eventos ya descargados.
     
     Args:
         df_partidos (pd.DataFrame): DataFrame con partidos
         filters (Dict, optional): Filtros aplicados
+        **scraper_kwargs: Argumentos adicionales para MatchEventScraper (p. ej. data_dir)
         
     Returns:
-        int: Índice desde donde continuar
+        int: Posición (dentro del subconjunto filtrado) desde donde continuar
     """
     try:
-        scraper = MatchEventScraper()
+        scraper = MatchEventScraper(**scraper_kwargs)
         
         # Aplicar filtros si se proporcionan
         df_filtered = scraper._apply_filters(df_partidos, filters) if filters else df_partidos
+        existing = scraper.downloaded_event_paths()
         
-        # Revisar qué eventos ya existen
-        for idx, row in df_filtered.iterrows():
-            try:
-                # Construir ruta esperada del archivo
-                partido_id = row.get('Partido_ID') or row.get('Partido ID')
-                continente = row.get('Continente') or row.get('continente')
-                pais = row.get('Pais') or row.get('pais')
-                competicion = row.get('Competicion') or row.get('competicion')
-                id_competicion = row.get('ID_Competicion') or row.get('id_competicion')
-                torneo_id = row.get('Torneo_ID') or row.get('torneo_id')
-                equipo_local = row.get('Equipo_Local') or row.get('Equipo Local')
-                equipo_visitante = row.get('Equipo_Visitante') or row.get('Equipo Visitante')
-                fecha = row.get('Fecha')
-                
-                if not all([partido_id, continente, pais, competicion, id_competicion, torneo_id]):
-                    continue
-                
-                # Construir ruta del archivo
-                dir_path = scraper._create_match_directory(
-                    continente, pais, competicion, id_competicion, torneo_id
-                )
-                filename = scraper._build_filename(
-                    partido_id, fecha, equipo_local, equipo_visitante
-                )
-                json_path = os.path.join(dir_path, filename)
-                
-                if not os.path.exists(json_path):
-                    print(f"🔍 Primer evento faltante encontrado en índice {idx}")
-                    print(f"   Partido: {equipo_local} vs {equipo_visitante}")
-                    print(f"   Competición: {competicion}")
-                    return idx
-                    
-            except Exception as e:
-                # Si hay error al construir la ruta, significa que falta
-                print(f"⚠️  Error procesando partido {idx}: {e}")
-                return idx
+        # Revisar qué eventos ya existen (los partidos sin datos suficientes se ignoran)
+        paths = scraper.compute_all_event_paths(scraper._as_categories(df_filtered))
+        missing = (paths.notna() & ~paths.isin(existing)).to_numpy()
+        if missing.any():
+            idx = int(np.argmax(missing))
+            datos = next(scraper._iter_match_fields(df_filtered.iloc[idx:idx + 1]))
+            print(f"🔍 Primer evento faltante encontrado en índice {idx}")
+            print(f"   Partido: {datos['equipo_local']} vs {datos['equipo_visitante']}")
+            print(f"   Competición: {datos['competicion']}")
+            return idx
         
         print("✅ Todos los eventos ya fueron descargados")
         return len(df_filtered)
@@ -649,30 +1417,13 @@ def smart_download_events(df_partidos: pd.DataFrame,
         deleted_count = 0
         print("🔥 Modo reinicio: Borrando eventos existentes...")
         
-        for _, row in df_filtered.iterrows():
+        for datos in scraper._iter_match_fields(df_filtered):
             try:
                 # Construir ruta del archivo
-                partido_id = row.get('Partido_ID') or row.get('Partido ID')
-                continente_val = row.get('Continente') or row.get('continente')
-                pais_val = row.get('Pais') or row.get('pais')
-                competicion_val = row.get('Competicion') or row.get('competicion')
-                id_competicion = row.get('ID_Competicion') or row.get('id_competicion')
-                torneo_id = row.get('Torneo_ID') or row.get('torneo_id')
-                equipo_local = row.get('Equipo_Local') or row.get('Equipo Local')
-                equipo_visitante = row.get('Equipo_Visitante') or row.get('Equipo Visitante')
-                fecha = row.get('Fecha')
-                
-                if not all([partido_id, continente_val, pais_val, competicion_val, id_competicion, torneo_id]):
+                json_path = scraper._event_json_path(datos)
+                if json_path is None:
                     continue
                 
-                dir_path = scraper._create_match_directory(
-                    continente_val, pais_val, competicion_val, id_competicion, torneo_id
-                )
-                filename = scraper._build_filename(
-                    partido_id, fecha, equipo_local, equipo_visitante
-                )
-                json_path = os.path.join(dir_path, filename)
-                
                 if os.path.exists(json_path):
                     os.remove(json_path)
                     deleted_count += 1
@@ -681,10 +1432,13 @@ def smart_download_events(df_partidos: pd.DataFrame,
                 print(f"⚠️  Error borrando archivo: {e}")
         
         print(f"🗑️  Eliminados {deleted_count} eventos existentes")
+        
+        # El manifiesto ya no refleja el disco: se reconstruirá al descargar
+        scraper.reset_manifest()
         start_index = 0
     else:
         # Encontrar desde dónde continuar
-        start_index = find_event_resume_index(df_partidos, filters)
+        start_index = find_event_resume_index(df_partidos, filters, **scraper_kwargs)
         
         if start_index >= len(df_filtered):
             print("✅ Todos los eventos ya están descargados")
@@ -11,17 +11,71 @@ Fecha: Julio 2025
 """
 
 import os
-import json
+import logging
 import time
+import operator
+import random
+import re
+import asyncio
+import threading
+import httpx
 import requests
+import numpy as np
 import pandas as pd
 from urllib.parse import quote
-from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
 from requests.adapters import HTTPAdapter
-from typing import Dict, List, Optional, Tuple, Union
+from aiolimiter import AsyncLimiter
+from tqdm.auto import tqdm
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 # Importar funciones comunes
-from utils_common import sanitize_dir_name
+from utils_common import (json_dumps_bytes, json_loads, parse_retry_after, run_async,
+                          sanitize_dir_name)
+
+
+# Apertura de una respuesta JSONP: nombre del callback hasta el primer "("
+_JSONP_OPEN = re.compile(rb'^[^(]*\(')
+
+
+# Sesión de requests compartida por todos los scrapers del módulo (ver get_session)
+_SESSION: Optional[requests.Session] = None
+
+
+def _create_session() -> requests.Session:
+    """
+    Crea una sesión de requests con pool de conexiones.
+    
+    Los reintentos no se delegan en urllib3: los gestiona el scraper
+    (_get_with_retries) para no sumar esperas a las del limitador.
+    
+    Returns:
+        requests.Session: Sesión configurada
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(max_retries=0, pool_connections=4, pool_maxsize=32)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Devuelve la sesión de requests compartida, creándola en el primer uso.
+    
+    Todos los MatchStatsScraper que no reciben una sesión propia usan esta,
+    así que las conexiones abiertas por uno las reutilizan los demás (por
+    ejemplo los scrapers auxiliares de find_stats_resume_index y
+    smart_download_stats).
+    
+    Returns:
+        requests.Session: Sesión compartida
+    """
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = _create_session()
+    return _SESSION
 
 
 class MatchStatsScraper:
@@ -29,11 +83,35 @@ class MatchStatsScraper:
     Clase para hacer scraping de estadísticas de partidos desde la API de ScoresWay.
     """
     
+    # Respuestas que se reintentan (incluye 429 Too Many Requests)
+    RETRY_STATUSES = (500, 502, 503, 504, 429)
+    
+    # Variantes de nombre de columna admitidas para cada dato del partido
+    MATCH_COLUMNS = {
+        'partido_id': ('Partido_ID', 'Partido ID'),
+        'continente': ('Continente', 'continente'),
+        'pais': ('Pais', 'pais'),
+        'competicion': ('Competicion', 'competicion'),
+        'id_competicion': ('ID_Competicion', 'id_competicion'),
+        'torneo_id': ('Torneo_ID', 'torneo_id'),
+        'temporada': ('Temporada', 'temporada'),
+        'equipo_local': ('Equipo_Local', 'Equipo Local'),
+        'equipo_visitante': ('Equipo_Visitante', 'Equipo Visitante'),
+        'fecha': ('Fecha',),
+    }
+    
+    # Datos sin los cuales no se puede ubicar el archivo del partido
+    ESSENTIAL_FIELDS = ('partido_id', 'continente', 'pais', 'competicion', 'id_competicion', 'torneo_id')
+    
     def __init__(self, 
                  sdapi_outlet_key: str = 'ft1tiv1inq7v1sk3y9tv12yh5',
                  callback_id: str = 'W3e14cbc3e4b2577e854bf210e5a3c7028c7409678',
                  base_url: str = "https://www.scoresway.com",
-                 data_dir: str = 'data'):
+                 data_dir: str = 'data',
+                 max_concurrency: int = 16,
+                 session: Optional[requests.Session] = None,
+                 save_raw: bool = True,
+                 verbose: bool = False):
         """
         Inicializa el scraper de estadísticas de partidos.
         
@@ -42,12 +120,36 @@ class MatchStatsScraper:
             callback_id (str): ID del callback para JSONP
             base_url (str): URL base del sitio web
             data_dir (str): Directorio base de datos
+            max_concurrency (int): Descargas simultáneas en descargar_stats_masivo
+            session (requests.Session, optional): Sesión propia; por defecto se
+                                                  usa la compartida (get_session)
+            save_raw (bool): Si guardar el JSON tal como llega de la API (sin
+                             parsear ni indentar)
+            verbose (bool): Si mostrar el detalle de cada partido (por defecto
+                            solo la barra de progreso, advertencias y errores)
         """
         self.sdapi_outlet_key = sdapi_outlet_key
         self.callback_id = callback_id
+        self._jsonp_prefix = f"{callback_id}(".encode()
         self.base_url = base_url
         self.api_base_url = "https://api.performfeeds.com/soccerdata/matchstats"
         self.data_dir = data_dir
+        self.save_raw = save_raw
+        
+        # Logger para el detalle por partido; sin verbose solo salen
+        # advertencias y errores. El logger es del módulo, así que el nivel se
+        # fija en cada instancia para no heredar el de un scraper anterior
+        self.log = logging.getLogger(__name__)
+        self.log.setLevel(logging.INFO if verbose else logging.WARNING)
+        if verbose and not self.log.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            self.log.addHandler(handler)
+            # Evitar que el logger raíz vuelva a imprimir cada mensaje
+            self.log.propagate = False
+        
+        # Se pide JSON sin envoltorio; None = aún no se sabe si la API lo acepta
+        self._jsonp_required: Optional[bool] = None
         
         # Configurar headers
         self.headers = {
@@ -55,35 +157,41 @@ class MatchStatsScraper:
             'User-Agent': 'Mozilla/5.0 (Linux; Android 6.0; Nexus 5 Build/MRA58N) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Mobile Safari/537.36'
         }
         
-        # Configurar sesión con reintentos
-        self.session = self._create_session_with_retries()
+        # Sesión HTTP, compartida entre scrapers salvo que se pase una
+        self.session = session if session is not None else get_session()
         
         # Configuración de delays
         self.sleep_time = 1.0
         self.max_retries = 3
+        self.retry_base = 1.0
+        self.retry_cap = 30.0
+        
+        # Configuración de descargas concurrentes; el limitador y el hilo de
+        # escritura se crean por lote
+        self.max_concurrency = max_concurrency
+        self.limiter = None
+        self._io_pool = None
+        
+        # Ritmo de las descargas síncronas: instante de la última petición
+        self._rate_lock = threading.Lock()
+        self._last_req_mono = 0.0
+        
+        # Directorios de torneo ya resueltos (y creados) en esta sesión
+        self._dir_cache: Dict[Tuple, str] = {}
+        
+        # Headers (con su referer) ya construidos por torneo
+        self._headers_by_torneo: Dict[Tuple, Dict] = {}
+        
+        # Nombres de archivo existentes por directorio (un listado por directorio)
+        self._existing_by_dir: Dict[str, set] = {}
+        
+        # Manifiesto de estadísticas descargadas (se carga al primer uso)
+        self.manifest_path = os.path.join(self.data_dir, '_downloaded_stats.log')
+        self._downloaded: Optional[set] = None
         
         # Contadores para estadísticas
         self.reset_stats()
     
-    def _create_session_with_retries(self) -> requests.Session:
-        """
-        Crea una sesión de requests con estrategia de reintentos.
-        
-        Returns:
-            requests.Session: Sesión configurada
-        """
-        session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[500, 502, 503, 504, 429],
-            allowed_methods=["GET"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        return session
-    
     def reset_stats(self) -> None:
         """Reinicia las estadísticas de descarga."""
         self.exitos = 0
@@ -101,18 +209,50 @@ class MatchStatsScraper:
         """
         self.sdapi_outlet_key = sdapi_outlet_key
         self.callback_id = callback_id
+        self._jsonp_prefix = f"{callback_id}(".encode()
         print(f"✅ Credenciales de API actualizadas")
     
     def set_delay(self, sleep_time: float) -> None:
         """
         Configura el tiempo de espera entre peticiones.
         
+        En descargar_stats_masivo se traduce en un limitador de una petición
+        cada sleep_time segundos compartido por todas las descargas simultáneas.
+        
         Args:
             sleep_time (float): Tiempo en segundos
         """
         self.sleep_time = sleep_time
         print(f"⏱️  Delay configurado a {sleep_time} segundos")
     
+    def set_rate(self, per_minute: float) -> None:
+        """
+        Configura el ritmo máximo de peticiones por minuto.
+        
+        Equivale a set_delay(60 / per_minute).
+        
+        Args:
+            per_minute (float): Peticiones por minuto
+        """
+        if per_minute <= 0:
+            raise ValueError("per_minute debe ser mayor que 0")
+        self.sleep_time = 60.0 / per_minute
+        print(f"⏱️  Ritmo configurado a {per_minute:g} peticiones/minuto")
+    
+    def _wait_for_slot(self) -> None:
+        """
+        Espera, antes de una petición síncrona, lo que falte para cumplir sleep_time.
+        
+        Sólo se descuenta el tiempo ya transcurrido desde la petición anterior,
+        así que una respuesta lenta no suma además la espera completa. Es
+        seguro llamarlo desde varios hilos.
+        """
+        with self._rate_lock:
+            wait = self.sleep_time - (time.monotonic() - self._last_req_mono)
+            if wait > 0:
+                time.sleep(wait)
+            self._last_req_mono = time.monotonic()
+    
     def descargar_stats_partido(self, match_row: pd.Series, skip_existing: bool = True) -> bool:
         """
         Descarga las estadísticas de un partido individual.
@@ -124,84 +264,490 @@ class MatchStatsScraper:
         Returns:
             bool: True si se descargó exitosamente, False en caso contrario
         """
+        partido_id = None
         try:
             # Extraer datos del partido
-            partido_id = match_row.get('Partido_ID') or match_row.get('Partido ID')
-            continente = match_row.get('Continente') or match_row.get('continente')
-            pais = match_row.get('Pais') or match_row.get('pais')
-            competicion = match_row.get('Competicion') or match_row.get('competicion')
-            id_competicion = match_row.get('ID_Competicion') or match_row.get('id_competicion')
-            torneo_id = match_row.get('Torneo_ID') or match_row.get('torneo_id')
-            temporada = match_row.get('Temporada') or match_row.get('temporada')
-            equipo_local = match_row.get('Equipo_Local') or match_row.get('Equipo Local')
-            equipo_visitante = match_row.get('Equipo_Visitante') or match_row.get('Equipo Visitante')
-            fecha = match_row.get('Fecha')
-            
-            # Validar datos esenciales
-            if not all([partido_id, continente, pais, competicion, id_competicion, torneo_id]):
-                print(f"⚠️  Datos insuficientes para partido {partido_id}")
-                return False
-            
-            # Crear estructura de directorios
-            dir_path = self._create_stats_directory(
-                continente, pais, competicion, id_competicion, torneo_id
-            )
+            datos = self._extract_match_fields(match_row)
+            partido_id = datos['partido_id']
             
-            # Construir nombre del archivo
-            filename = self._build_filename(
-                partido_id, fecha, equipo_local, equipo_visitante
-            )
-            json_path = os.path.join(dir_path, filename)
+            # Resolver ruta de destino
+            json_path = self._prepare_stats_target(datos)
+            if json_path is None:
+                return False
+            filename = os.path.basename(json_path)
             
             # Si el archivo ya existe y skip_existing es True, saltarlo
-            if skip_existing and os.path.exists(json_path):
-                print(f"⏭️  Archivo ya existe (saltando): {filename}")
+            if skip_existing and self._already_downloaded(json_path):
+                self.log.info("⏭️  Archivo ya existe (saltando): %s", filename)
                 self.saltados += 1
                 return True
             
-            # Construir URL de la API
-            url_stats = self._build_api_url(partido_id)
-            
-            # Construir URL de referencia
-            referer = self._build_referer_url(competicion, temporada, torneo_id)
-            
-            # Actualizar headers con referer
-            headers = self.headers.copy()
-            headers['Referer'] = referer
+            # Construir URL de la API y headers con referer
+            url_stats, headers = self._build_stats_request(datos)
             
             # Realizar petición
-            print(f"📊 Descargando stats: {equipo_local} vs {equipo_visitante}")
-            response = self.session.get(url_stats, headers=headers)
-            response.raise_for_status()
+            self.log.info("📊 Descargando stats: %s vs %s", datos['equipo_local'], datos['equipo_visitante'])
+            try:
+                response = self._get_with_retries(url_stats, headers)
+            except requests.exceptions.HTTPError as e:
+                if not self._json_refused(e.response.status_code, url_stats):
+                    raise
+                url_stats = self._build_api_url(partido_id, jsonp=True)
+                response = self._get_with_retries(url_stats, headers)
+                self._confirm_jsonp(e.response.status_code)
             
-            # Extraer JSON de la respuesta JSONP
-            json_data = self._extract_json_from_jsonp(response.text)
+            # Extraer JSON de la respuesta (JSON o JSONP)
+            payload = self._stats_file_payload(response.content)
             
             # Guardar archivo
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, ensure_ascii=False, indent=2)
+            self._write_stats_json(json_path, payload)
+            self._mark_downloaded(json_path)
             
-            print(f"✅ Guardado: {filename}")
+            self.log.info("✅ Guardado: %s", filename)
             self.exitos += 1
             
-            # Delay entre peticiones
-            time.sleep(self.sleep_time)
+            return True
+            
+        except Exception as e:
+            self.log.error("❌ Error al procesar partido %s: %s", partido_id, e)
+            self.fallos += 1
+            return False
+    
+    async def descargar_stats_partido_async(self, client: httpx.AsyncClient,
+                                            semaphore: asyncio.Semaphore,
+                                            datos: Dict,
+                                            skip_existing: bool = True) -> bool:
+        """
+        Versión asíncrona de descargar_stats_partido sobre un cliente httpx compartido.
+        
+        El semáforo limita las peticiones en vuelo y el limitador del lote
+        marca el ritmo de peticiones para no saturar la API.
+        
+        Args:
+            client (httpx.AsyncClient): Cliente httpx del lote
+            semaphore (asyncio.Semaphore): Semáforo que limita la concurrencia
+            datos (Dict): Datos del partido (ver _extract_match_fields), ya
+                          validados por descargar_stats_masivo
+            skip_existing (bool): Si saltar archivos que ya existen
+            
+        Returns:
+            bool: True si se descargó exitosamente, False en caso contrario
+        """
+        partido_id = datos['partido_id']
+        try:
+            # Resolver ruta de destino
+            json_path = self._stats_json_path(datos)
+            filename = os.path.basename(json_path)
+            
+            # Si el archivo ya existe y skip_existing es True, saltarlo
+            if skip_existing and self._already_downloaded(json_path):
+                self.log.info("⏭️  Archivo ya existe (saltando): %s", filename)
+                self.saltados += 1
+                return True
+            
+            # Construir URL de la API y headers con referer
+            url_stats, headers = self._build_stats_request(datos)
             
+            async with semaphore:
+                # Realizar petición
+                self.log.info("📊 Descargando stats: %s vs %s", datos['equipo_local'], datos['equipo_visitante'])
+                try:
+                    content = await self._fetch_stats_bytes_async(client, url_stats, headers)
+                except httpx.HTTPStatusError as e:
+                    if not self._json_refused(e.response.status_code, url_stats):
+                        raise
+                    url_stats = self._build_api_url(partido_id, jsonp=True)
+                    content = await self._fetch_stats_bytes_async(client, url_stats, headers)
+                    self._confirm_jsonp(e.response.status_code)
+            
+            # Extraer JSON de la respuesta (JSON o JSONP)
+            payload = self._stats_file_payload(content)
+            
+            # Guardar archivo sin bloquear el event loop (en el hilo de escritura del lote)
+            await asyncio.get_running_loop().run_in_executor(
+                self._io_pool, self._write_stats_json, json_path, payload
+            )
+            self._mark_downloaded(json_path)
+            
+            self.log.info("✅ Guardado: %s", filename)
+            self.exitos += 1
             return True
             
         except Exception as e:
-            print(f"❌ Error al procesar partido {partido_id}: {str(e)}")
+            self.log.error("❌ Error al procesar partido %s: %s", partido_id, e)
             self.fallos += 1
             return False
     
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Calcula la espera antes de reintentar una petición.
+        
+        Si el servidor envía Retry-After se respeta; si no, se usa backoff
+        exponencial con "full jitter" (espera aleatoria entre 0 y el tope del
+        intento) para que las descargas concurrentes no reintenten a la vez.
+        
+        Args:
+            attempt (int): Número de intento fallido (empezando en 0)
+            retry_after (str, optional): Valor de la cabecera Retry-After
+            
+        Returns:
+            float: Segundos a esperar
+        """
+        if retry_after:
+            return parse_retry_after(retry_after)
+        return random.uniform(0, min(self.retry_cap, self.retry_base * 2 ** attempt))
+    
+    def _get_with_retries(self, url: str, headers: Dict) -> requests.Response:
+        """
+        Realiza un GET reintentando ante 429, errores 5xx y fallos de conexión.
+        
+        Cada intento respeta antes el ritmo configurado (_wait_for_slot); el
+        resto de errores HTTP se propagan sin reintentar.
+        
+        Args:
+            url (str): URL de la API
+            headers (Dict): Headers con el referer
+            
+        Returns:
+            requests.Response: Respuesta exitosa
+            
+        Raises:
+            requests.exceptions.RequestException: Si se agotan los reintentos
+        """
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_slot()
+            try:
+                response = self.session.get(url, headers=headers)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(self._retry_delay(attempt))
+                continue
+            
+            if response.status_code in self.RETRY_STATUSES and attempt < self.max_retries:
+                time.sleep(self._retry_delay(attempt, response.headers.get('Retry-After')))
+                continue
+            
+            response.raise_for_status()
+            return response
+    
+    async def _fetch_stats_bytes_async(self, client: httpx.AsyncClient,
+                                       url: str, headers: Dict) -> bytes:
+        """
+        Pide las estadísticas de un partido reintentando ante 429, errores 5xx
+        y fallos de conexión, con las mismas esperas que _get_with_retries.
+        
+        Cada intento pasa antes por el limitador del lote, si lo hay.
+        
+        Args:
+            client (httpx.AsyncClient): Cliente httpx del lote
+            url (str): URL de la API
+            headers (Dict): Headers con el referer
+            
+        Returns:
+            bytes: Contenido de la respuesta
+            
+        Raises:
+            httpx.HTTPError: Si se agotan los reintentos
+        """
+        for attempt in range(self.max_retries + 1):
+            if self.limiter is not None:
+                await self.limiter.acquire()
+            try:
+                response = await client.get(url, headers=headers)
+            except httpx.TransportError:
+                if attempt >= self.max_retries:
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt))
+                continue
+            
+            if response.status_code in self.RETRY_STATUSES and attempt < self.max_retries:
+                await asyncio.sleep(self._retry_delay(attempt, response.headers.get('Retry-After')))
+                continue
+            
+            response.raise_for_status()
+            return response.content
+    
+    def _extract_match_fields(self, match_row: pd.Series) -> Dict:
+        """
+        Extrae los datos del partido admitiendo las distintas variantes de columnas.
+        
+        Args:
+            match_row (pd.Series): Fila del DataFrame con información del partido
+            
+        Returns:
+            Dict: Datos del partido
+        """
+        datos = {}
+        for campo, variantes in self.MATCH_COLUMNS.items():
+            valor = None
+            for columna in variantes:
+                valor = match_row.get(columna)
+                if valor:
+                    break
+            datos[campo] = valor
+        return datos
+    
+    def _resolve_match_columns(self, df: pd.DataFrame) -> Dict[str, Optional[str]]:
+        """
+        Resuelve una sola vez qué variante de cada columna tiene el DataFrame.
+        
+        Args:
+            df (pd.DataFrame): DataFrame de partidos
+            
+        Returns:
+            Dict[str, Optional[str]]: Columna real para cada dato (None si no está)
+        """
+        return {
+            campo: next((col for col in variantes if col in df.columns), None)
+            for campo, variantes in self.MATCH_COLUMNS.items()
+        }
+    
+    def _iter_match_fields(self, df: pd.DataFrame) -> Iterator[Dict]:
+        """
+        Recorre los partidos de un DataFrame devolviendo sus datos como diccionarios.
+        
+        Usa itertuples(name=None) sobre las columnas ya resueltas en lugar de
+        iterrows, evitando construir una Series por fila; cada dato sale de
+        una posición fija de la tupla.
+        
+        Args:
+            df (pd.DataFrame): DataFrame de partidos
+            
+        Yields:
+            Dict: Datos del partido (mismas claves que _extract_match_fields)
+        """
+        columnas = self._resolve_match_columns(df)
+        campos = [campo for campo, col in columnas.items() if col is not None]
+        faltantes = [campo for campo, col in columnas.items() if col is None]
+        
+        # Los datos sin columna se añaden al final de cada tupla como None
+        claves = tuple(campos + faltantes)
+        relleno = (None,) * len(faltantes)
+        
+        for valores in df[[columnas[campo] for campo in campos]].itertuples(index=False, name=None):
+            yield dict(zip(claves, valores + relleno))
+    
+    def _prepare_stats_target(self, datos: Dict) -> Optional[str]:
+        """
+        Crea el directorio del partido y devuelve la ruta del archivo de estadísticas.
+        
+        Args:
+            datos (Dict): Datos del partido (ver _extract_match_fields)
+            
+        Returns:
+            Optional[str]: Ruta del archivo JSON o None si faltan datos esenciales
+        """
+        # Validar datos esenciales
+        if not all(datos[campo] for campo in self.ESSENTIAL_FIELDS):
+            self.log.warning("⚠️  Datos insuficientes para partido %s", datos['partido_id'])
+            return None
+        return self._stats_json_path(datos)
+    
+    def _stats_json_path(self, datos: Dict) -> str:
+        """
+        Crea el directorio del partido y devuelve la ruta del archivo de estadísticas,
+        sin validar los datos (ver _prepare_stats_target).
+        
+        Args:
+            datos (Dict): Datos del partido (ver _extract_match_fields)
+            
+        Returns:
+            str: Ruta del archivo JSON
+        """
+        # Crear estructura de directorios
+        dir_path = self._create_stats_directory(
+            datos['continente'], datos['pais'], datos['competicion'],
+            datos['id_competicion'], datos['torneo_id']
+        )
+        
+        # Construir nombre del archivo
+        filename = self._build_filename(
+            datos['partido_id'], datos['fecha'], datos['equipo_local'], datos['equipo_visitante']
+        )
+        return os.path.join(dir_path, filename)
+    
+    def _build_stats_request(self, datos: Dict) -> Tuple[str, Dict]:
+        """
+        Construye la URL de la API y los headers para pedir las estadísticas de un partido.
+        
+        El referer sólo depende del torneo, así que los headers se construyen
+        una vez por torneo y se reutiliza el mismo diccionario (no se modifica
+        al hacer la petición).
+        
+        Args:
+            datos (Dict): Datos del partido (ver _extract_match_fields)
+            
+        Returns:
+            Tuple[str, Dict]: URL de la API y headers con el referer
+        """
+        url_stats = self._build_api_url(datos['partido_id'])
+        
+        key = (datos['competicion'], datos['temporada'], datos['torneo_id'])
+        headers = self._headers_by_torneo.get(key)
+        if headers is None:
+            # Headers base con el referer del torneo
+            headers = self._headers_by_torneo[key] = {
+                **self.headers,
+                'Referer': self._build_referer_url(*key),
+            }
+        
+        return url_stats, headers
+    
+    def _stats_file_payload(self, content: bytes) -> Union[bytes, memoryview]:
+        """
+        Prepara el contenido del archivo de estadísticas a partir de la respuesta.
+        
+        Con save_raw se guarda el JSON tal como llega (sin parsear ni volver a
+        codificar); si no, se parsea y se escribe indentado.
+        
+        Args:
+            content (bytes): Contenido de la respuesta
+            
+        Returns:
+            Union[bytes, memoryview]: JSON a escribir
+        """
+        if self.save_raw:
+            return self._stats_payload(content)
+        json_data = self._parse_stats_payload(content)
+        return json_dumps_bytes(json_data)
+    
+    def _write_stats_json(self, json_path: str, payload: Union[bytes, memoryview]) -> None:
+        """
+        Escribe las estadísticas de un partido en disco.
+        
+        Se escribe en un archivo temporal que luego reemplaza al definitivo,
+        así una descarga interrumpida nunca deja un JSON a medias.
+        
+        Args:
+            json_path (str): Ruta del archivo JSON
+            payload (bytes | memoryview): JSON del partido ya codificado
+        """
+        tmp_path = f"{json_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, json_path)
+    
+    def _already_downloaded(self, json_path: str) -> bool:
+        """
+        Indica si el archivo de estadísticas ya existe.
+        
+        Primero consulta el manifiesto. Si no figura ahí se mira el listado
+        de su directorio (cada directorio se lista una sola vez, en lugar de
+        un stat por archivo) y, si existe, se añade al manifiesto.
+        
+        Args:
+            json_path (str): Ruta del archivo JSON
+            
+        Returns:
+            bool: True si el archivo ya existe
+        """
+        if json_path in self.downloaded_stats_paths():
+            return True
+        
+        dir_path, filename = os.path.split(json_path)
+        names = self._existing_by_dir.get(dir_path)
+        if names is None:
+            try:
+                with os.scandir(dir_path) as it:
+                    names = {entry.name for entry in it}
+            except FileNotFoundError:
+                names = set()
+            self._existing_by_dir[dir_path] = names
+        
+        if filename in names:
+            self._record_download(json_path)
+            return True
+        return False
+    
+    def _mark_downloaded(self, json_path: str) -> None:
+        """
+        Añade un archivo recién guardado al listado de su directorio y al manifiesto.
+        
+        Args:
+            json_path (str): Ruta del archivo JSON
+        """
+        dir_path, filename = os.path.split(json_path)
+        names = self._existing_by_dir.get(dir_path)
+        if names is not None:
+            names.add(filename)
+        self._record_download(json_path)
+    
+    def downloaded_stats_paths(self) -> set:
+        """
+        Devuelve los archivos de estadísticas descargados según el manifiesto.
+        
+        El manifiesto (data_dir/_downloaded_stats.log) tiene una ruta relativa
+        a data_dir por línea y se amplía con cada descarga, así que las
+        siguientes ejecuciones no necesitan recorrer el disco. Si no existe,
+        se reconstruye una vez con existing_stats_paths. Si se borran
+        estadísticas a mano hay que llamar a reset_manifest.
+        
+        Returns:
+            set: Rutas (con el mismo formato que compute_all_stats_paths) ya descargadas
+        """
+        if self._downloaded is None:
+            try:
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    self._downloaded = {
+                        os.path.join(self.data_dir, line) for line in f.read().splitlines() if line
+                    }
+            except FileNotFoundError:
+                self._downloaded = set(self.existing_stats_paths())
+                self._write_manifest()
+        return self._downloaded
+    
+    def _write_manifest(self) -> None:
+        """Reescribe el manifiesto con las rutas conocidas."""
+        try:
+            os.makedirs(os.path.dirname(self.manifest_path) or '.', exist_ok=True)
+            with open(self.manifest_path, 'w', encoding='utf-8') as f:
+                f.writelines(f"{os.path.relpath(path, self.data_dir)}\n" for path in sorted(self._downloaded))
+        except OSError as e:
+            self.log.warning("⚠️  No se pudo guardar el manifiesto de estadísticas: %s", e)
+    
+    def _record_download(self, json_path: str) -> None:
+        """
+        Añade un archivo descargado al manifiesto.
+        
+        Args:
+            json_path (str): Ruta del archivo JSON
+        """
+        downloaded = self.downloaded_stats_paths()
+        if json_path in downloaded:
+            return
+        downloaded.add(json_path)
+        try:
+            with open(self.manifest_path, 'a', encoding='utf-8') as f:
+                f.write(f"{os.path.relpath(json_path, self.data_dir)}\n")
+        except OSError as e:
+            self.log.warning("⚠️  No se pudo actualizar el manifiesto de estadísticas: %s", e)
+    
+    def reset_manifest(self) -> None:
+        """Borra el manifiesto para que se reconstruya desde el disco en el próximo uso."""
+        self._downloaded = None
+        self._existing_by_dir.clear()
+        try:
+            os.remove(self.manifest_path)
+        except FileNotFoundError:
+            pass
+    
     def _create_stats_directory(self, continente: str, pais: str, competicion: str, 
                                id_competicion: str, torneo_id: str) -> str:
         """
         Crea la estructura de directorios para las estadísticas de partidos.
         
+        Todos los partidos de un torneo comparten directorio, así que la ruta
+        se memoriza por torneo y os.makedirs sólo se llama la primera vez.
+        
         Returns:
             str: Ruta del directorio creado
         """
+        key = (continente, pais, competicion, id_competicion, torneo_id)
+        dir_path = self._dir_cache.get(key)
+        if dir_path is not None:
+            return dir_path
+        
         # Limpiar nombres para directorios
         continente_clean = sanitize_dir_name(continente)
         pais_clean = sanitize_dir_name(pais)
@@ -217,6 +763,7 @@ class MatchStatsScraper:
         )
         
         os.makedirs(dir_path, exist_ok=True)
+        self._dir_cache[key] = dir_path
         return dir_path
     
     def _build_filename(self, partido_id: str, fecha: str, equipo_local: str, 
@@ -234,18 +781,142 @@ class MatchStatsScraper:
         
         return f"{partido_id}_{safe_fecha}_{safe_local}_{safe_visitante}.json"
     
-    def _build_api_url(self, partido_id: str) -> str:
+    def _build_api_url(self, partido_id: str, jsonp: Optional[bool] = None) -> str:
         """
         Construye la URL de la API para obtener estadísticas del partido.
         
+        Pide JSON sin envoltorio salvo que la API ya lo haya rechazado, en cuyo
+        caso se vuelve al formato JSONP con callback.
+        
+        Args:
+            partido_id (str): ID del partido
+            jsonp (Optional[bool]): Forzar el formato JSONP; por defecto según
+                                    _jsonp_required
+        
         Returns:
             str: URL de la API
         """
+        if jsonp is None:
+            jsonp = self._jsonp_required
+        if jsonp:
+            return (
+                f"{self.api_base_url}/{self.sdapi_outlet_key}/"
+                f"{partido_id}?_rt=c&_lcl=en&_fmt=jsonp&sps=widgets&_clbk={self.callback_id}"
+            )
         return (
             f"{self.api_base_url}/{self.sdapi_outlet_key}/"
-            f"{partido_id}?_rt=c&_lcl=en&_fmt=jsonp&sps=widgets&_clbk={self.callback_id}"
+            f"{partido_id}?_rt=c&_lcl=en&_fmt=json&sps=widgets"
         )
     
+    def _json_refused(self, status: int, url: str) -> bool:
+        """
+        Indica si una respuesta de error se debe a que la API no acepta _fmt=json.
+        
+        Un 4xx (salvo 429) a una petición en formato JSON antes de haber
+        recibido ningún JSON válido puede ser un rechazo del formato, así que
+        se repite en JSONP. No cambia el modo: un 404 de un partido sin stats
+        también llega aquí; _jsonp_required se marca en _confirm_jsonp, solo
+        si la petición JSONP funciona donde la JSON falló.
+        
+        Args:
+            status (int): Código HTTP de la respuesta
+            url (str): URL pedida
+            
+        Returns:
+            bool: True si hay que repetir la petición en formato JSONP
+        """
+        if self._jsonp_required is False or '_fmt=json&' not in url:
+            return False
+        return 400 <= status < 500 and status != 429
+    
+    def _confirm_jsonp(self, status: int) -> None:
+        """
+        Pasa a JSONP tras una petición JSONP exitosa donde la JSON falló.
+        
+        Args:
+            status (int): Código HTTP con el que falló la petición JSON
+        """
+        if self._jsonp_required is None:
+            self.log.warning("⚠️  La API no acepta _fmt=json (HTTP %s); se usará JSONP", status)
+            self._jsonp_required = True
+    
+    def _stats_payload(self, content: Union[bytes, str]) -> Union[bytes, memoryview]:
+        """
+        Devuelve el JSON de la respuesta sin parsearlo, sea JSON directo o JSONP.
+        
+        Para JSONP se devuelve una vista (sin copia) del tramo entre paréntesis
+        (ver _jsonp_bounds).
+        
+        Args:
+            content (Union[bytes, str]): Contenido de la respuesta
+            
+        Returns:
+            Union[bytes, memoryview]: JSON de la respuesta
+            
+        Raises:
+            Exception: Si la respuesta JSONP no tiene el formato esperado
+        """
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        
+        if content.lstrip()[:1] in (b'{', b'['):
+            if self._jsonp_required is None:
+                self._jsonp_required = False
+            return content
+        
+        inicio_json, final_json = self._jsonp_bounds(content)
+        return memoryview(content)[inicio_json:final_json]
+    
+    def _jsonp_bounds(self, content: bytes) -> Tuple[int, int]:
+        """
+        Localiza el tramo JSON dentro de una respuesta JSONP.
+        
+        Como el callback es conocido, el prefijo (precalculado) tiene longitud
+        fija y el cierre es ")" o ");", así que los límites salen sin recorrer
+        la respuesta. Si el callback no coincide, la apertura se localiza con
+        una regex anclada que sólo llega hasta el primer paréntesis.
+        
+        Args:
+            content (bytes): Contenido de la respuesta JSONP
+            
+        Returns:
+            Tuple[int, int]: Inicio y fin (exclusivo) del JSON
+            
+        Raises:
+            Exception: Si la respuesta JSONP no tiene el formato esperado
+        """
+        if content.startswith(self._jsonp_prefix):
+            inicio_json = len(self._jsonp_prefix)
+        else:
+            match = _JSONP_OPEN.match(content)
+            if match is None:
+                raise Exception("Formato de respuesta JSONP inesperado")
+            inicio_json = match.end()
+        
+        if content.endswith(b');'):
+            final_json = len(content) - 2
+        elif content.endswith(b')'):
+            final_json = len(content) - 1
+        else:
+            final_json = content.rfind(b')')
+        
+        if final_json < inicio_json:
+            raise Exception("Formato de respuesta JSONP inesperado")
+        
+        return inicio_json, final_json
+    
+    def _parse_stats_payload(self, content: Union[bytes, str]) -> Dict:
+        """
+        Parsea la respuesta de la API, sea JSON directo o JSONP.
+        
+        Args:
+            content (Union[bytes, str]): Contenido de la respuesta
+            
+        Returns:
+            Dict: Datos JSON extraídos
+        """
+        return json_loads(self._stats_payload(content))
+    
     def _build_referer_url(self, competicion: str, temporada: str, torneo_id: str) -> str:
         """
         Construye la URL de referencia para la petición.
@@ -257,12 +928,12 @@ class MatchStatsScraper:
         url_competicion = f"{quote(competicion)}-{quote(temporada)}/{torneo_id}"
         return f"{url_base}{url_competicion}/fixtures"
     
-    def _extract_json_from_jsonp(self, content: str) -> Dict:
+    def _extract_json_from_jsonp(self, content: Union[bytes, str]) -> Dict:
         """
         Extrae JSON puro de una respuesta JSONP.
         
         Args:
-            content (str): Contenido de la respuesta JSONP
+            content (Union[bytes, str]): Contenido de la respuesta JSONP
             
         Returns:
             Dict: Datos JSON extraídos
@@ -270,13 +941,11 @@ class MatchStatsScraper:
         Raises:
             Exception: Si no se puede extraer el JSON
         """
-        inicio_json = content.find('(') + 1
-        final_json = content.rfind(')')
-        
-        if inicio_json <= 0 or final_json <= 0 or inicio_json >= final_json:
-            raise Exception("Formato de respuesta JSONP inesperado")
+        if isinstance(content, str):
+            content = content.encode('utf-8')
         
-        return json.loads(content[inicio_json:final_json])
+        inicio_json, final_json = self._jsonp_bounds(content)
+        return json_loads(memoryview(content)[inicio_json:final_json])
     
     def descargar_stats_masivo(self, 
                               df_partidos: pd.DataFrame,
@@ -297,9 +966,41 @@ class MatchStatsScraper:
         Returns:
             Dict: Estadísticas del procesamiento
         """
+        start_time = time.time()
+        df_to_process, df_pending = self._select_batch(df_partidos, filters, skip_existing,
+                                                       start_index, limit)
+        
+        # Procesar partidos de forma concurrente
+        try:
+            run_async(self.descargar_stats_masivo_async(df_pending, skip_existing))
+        except KeyboardInterrupt:
+            print(f"\n⚠️  Descarga interrumpida por el usuario")
+        
+        return self._finish_batch(df_to_process, start_time)
+    
+    def _select_batch(self,
+                      df_partidos: pd.DataFrame,
+                      filters: Optional[Dict],
+                      skip_existing: bool,
+                      start_index: int,
+                      limit: Optional[int]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Prepara un lote de descargar_stats_masivo: reinicia las estadísticas,
+        filtra, recorta el rango y descarta los partidos sin datos suficientes
+        o ya descargados.
+        
+        Args:
+            df_partidos (pd.DataFrame): DataFrame con partidos
+            filters (Dict, optional): Filtros para aplicar
+            skip_existing (bool): Si saltar archivos existentes
+            start_index (int): Índice de inicio
+            limit (Optional[int]): Límite de partidos a procesar
+            
+        Returns:
+            Tuple[pd.DataFrame, pd.DataFrame]: Partidos del lote y partidos pendientes de descargar
+        """
         # Reiniciar estadísticas
         self.reset_stats()
-        start_time = time.time()
         
         # Aplicar filtros si se proporcionan
         df_filtered = self._apply_filters(df_partidos, filters)
@@ -318,31 +1019,43 @@ class MatchStatsScraper:
         print(f"   - Partidos a procesar: {len(df_to_process)}")
         print(f"   - Rango: {start_index} a {end_index-1}")
         print(f"   - Delay entre peticiones: {self.sleep_time} segundos")
+        print(f"   - Descargas simultáneas: {self.max_concurrency}")
         
-        # Procesar cada partido
-        for idx, (_, row) in enumerate(df_to_process.iterrows()):
-            try:
-                equipo_local = row.get('Equipo_Local') or row.get('Equipo Local', 'N/A')
-                equipo_visitante = row.get('Equipo_Visitante') or row.get('Equipo Visitante', 'N/A')
-                
-                print(f"\n📋 [{self.procesados + 1}/{len(df_to_process)}] Procesando: {equipo_local} vs {equipo_visitante}")
-                
-                # Intentar descargar estadísticas
-                self.descargar_stats_partido(row, skip_existing)
-                self.procesados += 1
-                
-                # Mostrar progreso cada 20 elementos
-                if (idx + 1) % 20 == 0:
-                    self._print_progress(idx + 1, len(df_to_process), start_time)
-                
-            except KeyboardInterrupt:
-                print(f"\n⚠️  Descarga interrumpida por el usuario")
-                break
-            except Exception as e:
-                print(f"❌ Error inesperado en partido {idx}: {e}")
-                self.fallos += 1
-                self.procesados += 1
+        # El manifiesto se carga aquí, antes de que escriban los hilos del lote
+        downloaded = self.downloaded_stats_paths()
+        
+        # Validar de una vez los datos esenciales (sin ruta = datos insuficientes)
+        paths = self.compute_all_stats_paths(df_to_process)
+        pending = paths.notna().to_numpy()
+        n_invalid = len(pending) - int(pending.sum())
+        if n_invalid:
+            print(f"⚠️  {n_invalid} partidos con datos insuficientes (descartados)")
+            self.procesados += n_invalid
+        
+        # Descartar de una vez los partidos que ya figuran en el manifiesto
+        if skip_existing:
+            already_saved = paths.isin(downloaded).to_numpy()
+            n_saved = int(already_saved.sum())
+            if n_saved:
+                print(f"⏭️  {n_saved} partidos ya descargados (saltando)")
+                self.saltados += n_saved
+                self.procesados += n_saved
+                pending = pending & ~already_saved
         
+        df_pending = df_to_process[pending] if not pending.all() else df_to_process
+        return df_to_process, df_pending
+    
+    def _finish_batch(self, df_to_process: pd.DataFrame, start_time: float) -> Dict:
+        """
+        Cierra un lote de descargar_stats_masivo imprimiendo el resumen.
+        
+        Args:
+            df_to_process (pd.DataFrame): Partidos del lote
+            start_time (float): Inicio del lote
+            
+        Returns:
+            Dict: Estadísticas del procesamiento
+        """
         # Calcular tiempo total
         duration = time.time() - start_time
         
@@ -362,6 +1075,157 @@ class MatchStatsScraper:
         
         return stats
     
+    async def descargar_stats_masivo_async(self,
+                                           df_to_process: pd.DataFrame,
+                                           skip_existing: bool = True,
+                                           client: Optional[httpx.AsyncClient] = None) -> None:
+        """
+        Descarga de forma concurrente las estadísticas de los partidos ya seleccionados.
+        
+        Abre un único cliente httpx con HTTP/2 para todo el lote (todas las
+        peticiones van al mismo host y se multiplexan sobre una conexión) y
+        lanza una corrutina por partido con asyncio.gather; un AsyncLimiter
+        de una petición cada sleep_time segundos sustituye a la espera fija
+        entre partidos. Los archivos se escriben en un único hilo dedicado
+        del lote. Las estadísticas se acumulan en el scraper y el progreso se
+        muestra en una barra de tqdm.
+        
+        Args:
+            df_to_process (pd.DataFrame): Partidos a descargar
+            skip_existing (bool): Si saltar archivos existentes
+            client (httpx.AsyncClient, optional): Cliente a reutilizar (p. ej.
+                                                  compartido con los eventos);
+                                                  cada petición lleva sus headers
+        """
+        if client is None:
+            limits = httpx.Limits(max_connections=max(20, self.max_concurrency),
+                                  max_keepalive_connections=10, keepalive_expiry=75)
+            async with httpx.AsyncClient(http2=True, limits=limits, headers=self.headers,
+                                         timeout=60) as client:
+                await self.descargar_stats_masivo_async(df_to_process, skip_existing, client)
+            return
+        
+        # Los partidos ya contados (saltados antes del lote) suman al total
+        total = self.procesados + len(df_to_process)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def _fetch_one(datos: Dict) -> None:
+            await self.descargar_stats_partido_async(client, semaphore, datos, skip_existing)
+            self.procesados += 1
+            pbar.update(1)
+            pbar.set_postfix(ok=self.exitos, skip=self.saltados, err=self.fallos, refresh=False)
+        
+        self.limiter = AsyncLimiter(1, self.sleep_time) if self.sleep_time > 0 else None
+        # Un único hilo de escritura: las descargas siguen mientras se escribe
+        # y los archivos se guardan en orden
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='matchstats-io')
+        try:
+            with tqdm(total=total, initial=self.procesados, desc="Match stats", unit="partido") as pbar:
+                await asyncio.gather(*(
+                    _fetch_one(datos) for datos in self._iter_match_fields(df_to_process)
+                ))
+        finally:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
+            self.limiter = None
+    
+    def compute_all_stats_paths(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Construye la ruta del archivo de estadísticas de todos los partidos de una vez.
+        
+        Equivale a combinar _create_stats_directory y _build_filename fila por
+        fila (sin crear directorios), pero con operaciones de strings
+        vectorizadas de pandas.
+        
+        Args:
+            df (pd.DataFrame): DataFrame de partidos
+            
+        Returns:
+            pd.Series: Rutas con el mismo índice que df (NaN si faltan datos esenciales)
+        """
+        columnas = self._resolve_match_columns(df)
+        
+        def _col(campo: str) -> pd.Series:
+            if columnas[campo] is None:
+                return pd.Series(None, index=df.index, dtype=object)
+            return df[columnas[campo]]
+        
+        def _clean(campo: str) -> pd.Series:
+            return _col(campo).map(lambda v: sanitize_dir_name(str(v))).astype(str)
+        
+        validos = pd.concat(
+            [_col(c).notna() & _col(c).astype(object).astype(bool) for c in self.ESSENTIAL_FIELDS],
+            axis=1
+        ).all(axis=1)
+        fechas = _col('fecha').map(lambda f: sanitize_dir_name(str(f)) if f else "sin_fecha").astype(str)
+        
+        paths = (
+            os.path.join(self.data_dir, '')
+            + _clean('continente') + os.sep
+            + _clean('pais') + os.sep
+            + _clean('competicion') + '_' + _col('id_competicion').astype(str) + os.sep
+            + _col('torneo_id').astype(str) + os.sep + 'matchstats' + os.sep
+            + _col('partido_id').astype(str) + '_' + fechas + '_'
+            + _clean('equipo_local') + '_' + _clean('equipo_visitante') + '.json'
+        )
+        return paths.where(validos)
+    
+    def existing_stats_paths(self, dir_paths=None) -> frozenset:
+        """
+        Lista una sola vez cada directorio de estadísticas y devuelve los archivos existentes.
+        
+        Args:
+            dir_paths (optional): Directorios matchstats a revisar; por defecto
+                                  todos los de data_dir (ver _find_stats_dirs)
+            
+        Returns:
+            frozenset: Rutas (con el mismo formato que compute_all_stats_paths) de archivos existentes
+        """
+        if dir_paths is None:
+            dir_paths = self._find_stats_dirs()
+        
+        existing = set()
+        for dir_path in dir_paths:
+            try:
+                with os.scandir(dir_path) as it:
+                    existing.update(entry.path for entry in it if entry.name.endswith('.json'))
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                print(f"⚠️  No se pudo listar {dir_path}: {e}")
+        return frozenset(existing)
+    
+    def _find_stats_dirs(self) -> List[str]:
+        """
+        Recorre el árbol de datos y devuelve los directorios matchstats.
+        
+        Sólo se baja por continente/pais/competicion/torneo, que es donde
+        _create_stats_directory ubica las estadísticas.
+        
+        Returns:
+            List[str]: Directorios matchstats existentes
+        """
+        stats_depth = 4
+        dirs = []
+        
+        def _gather(path: str, depth: int) -> None:
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if not entry.is_dir():
+                            continue
+                        if depth == stats_depth:
+                            if entry.name == 'matchstats':
+                                dirs.append(entry.path)
+                        else:
+                            _gather(entry.path, depth + 1)
+            except OSError as e:
+                print(f"⚠️  No se pudo listar {path}: {e}")
+        
+        if os.path.isdir(self.data_dir):
+            _gather(self.data_dir, 0)
+        return dirs
+    
     def _apply_filters(self, df: pd.DataFrame, filters: Optional[Dict]) -> pd.DataFrame:
         """
         Aplica filtros al DataFrame de partidos.
@@ -376,50 +1240,30 @@ class MatchStatsScraper:
         if not filters:
             return df
         
-        df_filtered = df.copy()
+        # Resolver nombres de columna sin importar mayúsculas ni espacios/guiones bajos
+        normalized = {str(col).lower().replace(' ', '_'): col for col in df.columns}
+        
+        # Reunir un predicado por filtro y combinarlos al final en una sola máscara
+        predicates = []
         
         for column, value in filters.items():
-            # Manejar nombres de columnas con diferentes formatos
-            column_variants = [
-                column,
-                column.replace('_', ' ').title(),
-                column.replace(' ', '_').lower(),
-                column.replace('_', ' ').title().replace(' ', '_')
-            ]
-            
-            found_column = None
-            for variant in column_variants:
-                if variant in df_filtered.columns:
-                    found_column = variant
-                    break
+            found_column = column if column in df.columns else normalized.get(column.lower().replace(' ', '_'))
             
             if found_column:
                 if isinstance(value, list):
-                    df_filtered = df_filtered[df_filtered[found_column].isin(value)]
+                    predicates.append(df[found_column].isin(value))
                 else:
-                    df_filtered = df_filtered[df_filtered[found_column] == value]
-                print(f"🔍 Filtro aplicado - {found_column}: {value} → {len(df_filtered)} partidos")
+                    predicates.append(df[found_column].eq(value))
+                print(f"🔍 Filtro aplicado - {found_column}: {value}")
             else:
-                print(f"⚠️  Columna '{column}' no encontrada. Columnas disponibles: {list(df_filtered.columns)}")
-        
-        return df_filtered
-    
-    def _print_progress(self, current: int, total: int, start_time: float) -> None:
-        """
-        Imprime el progreso del procesamiento.
-        """
-        elapsed = time.time() - start_time
-        rate = self.procesados / (elapsed / 60) if elapsed > 0 else 0
+                print(f"⚠️  Columna '{column}' no encontrada. Columnas disponibles: {list(df.columns)}")
         
-        print(f"\n📊 Progreso: {current}/{total} ({current/total*100:.1f}%)")
-        print(f"   ⚡ Velocidad: {rate:.2f} partidos/minuto")
-        print(f"   ✅ Exitosos: {self.exitos}")
-        print(f"   ⏭️  Saltados: {self.saltados}")
-        print(f"   ❌ Fallos: {self.fallos}")
+        if not predicates:
+            return df
         
-        if elapsed > 0:
-            remaining = (total - current) * (elapsed / current)
-            print(f"   ⏰ Tiempo estimado restante: {remaining/60:.1f} minutos")
+        mask = reduce(operator.and_, predicates)
+        print(f"   → {int(mask.sum())} partidos")
+        return df.loc[mask]
     
     def _print_final_summary(self, stats: Dict) -> None:
         """
@@ -440,59 +1284,38 @@ class MatchStatsScraper:
             print(f"📈 Tasa de éxito: {success_rate:.1f}%")
 
 
-def find_stats_resume_index(df_partidos: pd.DataFrame, filters: Optional[Dict] = None) -> int:
+def find_stats_resume_index(df_partidos: pd.DataFrame, filters: Optional[Dict] = None,
+                            **scraper_kwargs) -> int:
     """
     Encuentra el índice desde donde continuar basándose en estadísticas ya descargadas.
     
     Args:
         df_partidos (pd.DataFrame): DataFrame con partidos
         filters (Dict, optional): Filtros aplicados
+        **scraper_kwargs: Argumentos adicionales para MatchStatsScraper (p. ej. data_dir)
         
     Returns:
-        int: Índice desde donde continuar
+        int: Posición (dentro del subconjunto filtrado) desde donde continuar
     """
     try:
-        scraper = MatchStatsScraper()
+        scraper = MatchStatsScraper(**scraper_kwargs)
         
         # Aplicar filtros si se proporcionan
         df_filtered = scraper._apply_filters(df_partidos, filters) if filters else df_partidos
         
-        # Revisar qué estadísticas ya existen
-        for idx, row in df_filtered.iterrows():
-            try:
-                # Construir ruta esperada del archivo
-                partido_id = row.get('Partido_ID') or row.get('Partido ID')
-                continente = row.get('Continente') or row.get('continente')
-                pais = row.get('Pais') or row.get('pais')
-                competicion = row.get('Competicion') or row.get('competicion')
-                id_competicion = row.get('ID_Competicion') or row.get('id_competicion')
-                torneo_id = row.get('Torneo_ID') or row.get('torneo_id')
-                equipo_local = row.get('Equipo_Local') or row.get('Equipo Local')
-                equipo_visitante = row.get('Equipo_Visitante') or row.get('Equipo Visitante')
-                fecha = row.get('Fecha')
-                
-                if not all([partido_id, continente, pais, competicion, id_competicion, torneo_id]):
-                    continue
-                
-                # Construir ruta del archivo
-                dir_path = scraper._create_stats_directory(
-                    continente, pais, competicion, id_competicion, torneo_id
-                )
-                filename = scraper._build_filename(
-                    partido_id, fecha, equipo_local, equipo_visitante
-                )
-                json_path = os.path.join(dir_path, filename)
-                
-                if not os.path.exists(json_path):
-                    print(f"🔍 Primera estadística faltante encontrada en índice {idx}")
-                    print(f"   Partido: {equipo_local} vs {equipo_visitante}")
-                    print(f"   Competición: {competicion}")
-                    return idx
-                    
-            except Exception as e:
-                # Si hay error al construir la ruta, significa que falta
-                print(f"⚠️  Error procesando partido {idx}: {e}")
-                return idx
+        # Rutas esperadas contra el manifiesto de descargas (sin tocar el disco)
+        paths = scraper.compute_all_stats_paths(df_filtered)
+        downloaded = scraper.downloaded_stats_paths()
+        
+        # Revisar qué estadísticas ya existen (los partidos sin datos suficientes se ignoran)
+        missing = (paths.notna() & ~paths.isin(downloaded)).to_numpy()
+        if missing.any():
+            idx = int(np.argmax(missing))
+            datos = next(scraper._iter_match_fields(df_filtered.iloc[idx:idx + 1]))
+            print(f"🔍 Primera estadística faltante encontrada en índice {idx}")
+            print(f"   Partido: {datos['equipo_local']} vs {datos['equipo_visitante']}")
+            print(f"   Competición: {datos['competicion']}")
+            return idx
         
         print("✅ Todas las estadísticas ya fueron descargadas")
         return len(df_filtered)
@@ -556,6 +1379,95 @@ def download_match_stats(df_partidos: pd.DataFrame,
     )
 
 
+def download_match_stats_and_events(df_partidos: pd.DataFrame,
+                                    continente: Optional[str] = None,
+                                    pais: Optional[str] = None,
+                                    competicion: Optional[str] = None,
+                                    skip_existing: bool = True,
+                                    start_index: int = 0,
+                                    limit: Optional[int] = None,
+                                    sleep_time: float = 1.0,
+                                    stats_kwargs: Optional[Dict] = None,
+                                    events_kwargs: Optional[Dict] = None) -> Dict[str, Dict]:
+    """
+    Descarga estadísticas y eventos de los mismos partidos en un único lote.
+    
+    Ambos endpoints están en el mismo host, así que los dos scrapers
+    comparten un cliente httpx con HTTP/2 y sus peticiones se multiplexan
+    sobre la misma conexión. Cada scraper mantiene su propio ritmo,
+    concurrencia, manifiesto y resumen.
+    
+    Args:
+        df_partidos (pd.DataFrame): DataFrame con partidos
+        continente (str, optional): Filtrar por continente
+        pais (str, optional): Filtrar por país
+        competicion (str, optional): Filtrar por competición
+        skip_existing (bool): Si saltar archivos existentes
+        start_index (int): Índice de inicio
+        limit (Optional[int]): Límite de partidos a procesar
+        sleep_time (float): Tiempo de espera entre peticiones de cada scraper
+        stats_kwargs (Dict, optional): Argumentos adicionales para MatchStatsScraper
+        events_kwargs (Dict, optional): Argumentos adicionales para MatchEventScraper
+        
+    Returns:
+        Dict[str, Dict]: Estadísticas del procesamiento en 'stats' y 'events'
+        
+    Example:
+        # Descargar estadísticas y eventos solo de Argentina
+        result = download_match_stats_and_events(df_partidos, pais='Argentina')
+    """
+    from scraping_match_events import MatchEventScraper
+    
+    # Crear filtros
+    filters = {}
+    if continente:
+        filters['continente'] = continente
+    if pais:
+        filters['pais'] = pais
+    if competicion:
+        filters['competicion'] = competicion
+    
+    # Crear scrapers
+    stats_scraper = MatchStatsScraper(**(stats_kwargs or {}))
+    stats_scraper.set_delay(sleep_time)
+    events_scraper = MatchEventScraper(**(events_kwargs or {}))
+    events_scraper.set_delay(sleep_time)
+    
+    start_time = time.time()
+    stats_batch, stats_pending = stats_scraper._select_batch(
+        df_partidos, filters, skip_existing, start_index, limit
+    )
+    events_batch, events_pending = events_scraper._select_batch(
+        df_partidos, filters, skip_existing, start_index, limit
+    )
+    
+    async def _download_both() -> None:
+        # Las peticiones de estadísticas llevan todos sus headers; el cliente
+        # usa los de eventos, que sólo añaden el referer
+        limits = httpx.Limits(
+            max_connections=max(20, stats_scraper.max_concurrency + events_scraper.max_concurrency),
+            max_keepalive_connections=10
+        )
+        async with httpx.AsyncClient(http2=True, limits=limits, headers=events_scraper.headers,
+                                     timeout=60) as client:
+            await asyncio.gather(
+                stats_scraper.descargar_stats_masivo_async(stats_pending, skip_existing, client),
+                events_scraper.descargar_eventos_masivo_async(events_pending, skip_existing,
+                                                              start_time, client)
+            )
+    
+    # Procesar ambos endpoints de forma concurrente
+    try:
+        run_async(_download_both())
+    except KeyboardInterrupt:
+        print(f"\n⚠️  Descarga interrumpida por el usuario")
+    
+    return {
+        'stats': stats_scraper._finish_batch(stats_batch, start_time),
+        'events': events_scraper._finish_batch(events_batch, start_time),
+    }
+
+
 def smart_download_stats(df_partidos: pd.DataFrame,
                         continente: Optional[str] = None,
                         pais: Optional[str] = None,
@@ -611,42 +1523,25 @@ def smart_download_stats(df_partidos: pd.DataFrame,
         deleted_count = 0
         print("🔥 Modo reinicio: Borrando estadísticas existentes...")
         
-        for _, row in df_filtered.iterrows():
+        # Rutas esperadas y un único listado por directorio: sólo se borra lo que existe
+        paths = scraper.compute_all_stats_paths(df_filtered).dropna()
+        existing = scraper.existing_stats_paths(paths.map(os.path.dirname).unique())
+        
+        for json_path in existing.intersection(paths):
             try:
-                # Construir ruta del archivo
-                partido_id = row.get('Partido_ID') or row.get('Partido ID')
-                continente_val = row.get('Continente') or row.get('continente')
-                pais_val = row.get('Pais') or row.get('pais')
-                competicion_val = row.get('Competicion') or row.get('competicion')
-                id_competicion = row.get('ID_Competicion') or row.get('id_competicion')
-                torneo_id = row.get('Torneo_ID') or row.get('torneo_id')
-                equipo_local = row.get('Equipo_Local') or row.get('Equipo Local')
-                equipo_visitante = row.get('Equipo_Visitante') or row.get('Equipo Visitante')
-                fecha = row.get('Fecha')
-                
-                if not all([partido_id, continente_val, pais_val, competicion_val, id_competicion, torneo_id]):
-                    continue
-                
-                dir_path = scraper._create_stats_directory(
-                    continente_val, pais_val, competicion_val, id_competicion, torneo_id
-                )
-                filename = scraper._build_filename(
-                    partido_id, fecha, equipo_local, equipo_visitante
-                )
-                json_path = os.path.join(dir_path, filename)
-                
-                if os.path.exists(json_path):
-                    os.remove(json_path)
-                    deleted_count += 1
-                    
-            except Exception as e:
+                os.remove(json_path)
+                deleted_count += 1
+            except OSError as e:
                 print(f"⚠️  Error borrando archivo: {e}")
         
         print(f"🗑️  Eliminadas {deleted_count} estadísticas existentes")
+        
+        # El manifiesto ya no refleja el disco: se reconstruirá al descargar
+        scraper.reset_manifest()
         start_index = 0
     else:
         # Encontrar desde dónde continuar
-        start_index = find_stats_resume_index(df_partidos, filters)
+        start_index = find_stats_resume_index(df_partidos, filters, **scraper_kwargs)
         
         if start_index >= len(df_filtered):
             print("✅ Todas las estadísticas ya están descargadas")
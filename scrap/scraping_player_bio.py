@@ -16,16 +16,44 @@ Fecha: Julio 2025
 import os
 import json
 import time
-import random
-import requests
+import shutil
+import asyncio
+import httpx
+import http.client
 import pandas as pd
-from urllib.parse import quote
-from urllib3.util.retry import Retry
-from requests.adapters import HTTPAdapter
-from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import quote, urlsplit
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 # Importar funciones comunes
-from utils_common import get_season_name_from_url, get_torneo_id, sanitize_dir_name
+from utils_common import (TokenBucket, get_season_name_from_url, get_torneo_id, json_dumps_bytes,
+                          json_loads, parse_retry_after, run_async, sanitize_dir_name)
+
+
+# Campos del jugador que forman el nombre del archivo de su biografía
+_NAME_FIELDS = ("id", "firstName", "lastName")
+
+
+def _filename_part(player: Dict, campo: str, campos: set) -> str:
+    """
+    Devuelve un campo del jugador tal como aparecía en el nombre del archivo.
+    
+    Mantiene el formato de cuando los jugadores pasaban por pd.json_normalize,
+    para que skip_existing siga encontrando las biografías ya guardadas: un
+    campo ausente o nulo se escribía como 'nan' y, si ningún jugador de la
+    temporada lo tenía, como 'Unknown'.
+    
+    Args:
+        player (Dict): Datos del jugador
+        campo (str): Campo a leer
+        campos (set): Campos presentes en algún jugador de la temporada
+        
+    Returns:
+        str: Valor del campo como texto
+    """
+    if campo not in campos:
+        return "Unknown"
+    valor = player.get(campo)
+    return "nan" if valor is None else str(valor)
 
 
 class PlayerBioScraper:
@@ -33,11 +61,15 @@ class PlayerBioScraper:
     Clase para hacer scraping de biografías de jugadores desde la API de ScoresWay.
     """
     
+    # Estados HTTP que se reintentan (límite de peticiones y errores del servidor)
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    
     def __init__(self, 
                  sdapi_outlet_key: str = 'ft1tiv1inq7v1sk3y9tv12yh5',
                  callback_id: str = 'W3e14cbc3e4b2577e854bf210e5a3c7028c7409678',
                  base_url: str = "https://www.scoresway.com",
-                 data_dir: str = 'data'):
+                 data_dir: str = 'data',
+                 max_concurrency: int = 16):
         """
         Inicializa el scraper de biografías de jugadores.
         
@@ -46,6 +78,7 @@ class PlayerBioScraper:
             callback_id (str): ID del callback para JSONP
             base_url (str): URL base del sitio web
             data_dir (str): Directorio base de datos
+            max_concurrency (int): Biografías descargadas a la vez dentro de una temporada
         """
         self.sdapi_outlet_key = sdapi_outlet_key
         self.callback_id = callback_id
@@ -59,34 +92,91 @@ class PlayerBioScraper:
             'User-Agent': 'Mozilla/5.0 (Linux; Android 6.0; Nexus 5 Build/MRA58N) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Mobile Safari/537.36'
         }
         
-        # Configurar sesión con reintentos
-        self.session = self._create_session_with_retries()
-        
         # Configuración de delays (más conservadores por el volumen de peticiones)
         self.min_delay = 1.0
         self.max_delay = 2.0
         
+        # Ritmo de peticiones: un token bucket con el ritmo medio de los delays
+        self.bucket = self._create_bucket(2.0 / (self.min_delay + self.max_delay))
+        
+        # Descargas concurrentes y reintentos
+        self.max_concurrency = max_concurrency
+        self.max_retries = 3
+        self.backoff_factor = 1.0
+        
+        # Conexiones persistentes por (esquema, host) de obtener_playerbio_json
+        self._conns: Dict[Tuple[str, str], http.client.HTTPConnection] = {}
+        
+        # Biografía ya guardada de cada jugador (player_id -> archivo) en esta
+        # ejecución; la API devuelve lo mismo sea cual sea la temporada
+        self._bio_paths: Dict[str, str] = {}
+        
         # Contadores para estadísticas
         self.reset_stats()
     
-    def _create_session_with_retries(self) -> requests.Session:
+    def _get_persistent(self, url: str, headers: Dict) -> bytes:
         """
-        Crea una sesión de requests con estrategia de reintentos.
+        Realiza un GET sobre una conexión persistente al host de la API.
+        
+        Todas las peticiones van al mismo host, así que se mantiene abierta
+        una única conexión (http.client) y se reutiliza en cada jugador, sin
+        el coste por petición de requests/urllib3. Si la conexión se cae
+        (p. ej. el servidor la cerró por inactividad) se reabre y se
+        reintenta; los 429 y errores 5xx se reintentan (ver _retry_delay).
+        Cada intento espera su turno en el token bucket. No es seguro usarla
+        desde varios hilos a la vez.
         
+        Args:
+            url (str): URL de la API
+            headers (Dict): Headers con el referer
+            
         Returns:
-            requests.Session: Sesión configurada
-        """
-        session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[500, 502, 503, 504, 429],
-            allowed_methods=["GET"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        return session
+            bytes: Contenido de la respuesta
+            
+        Raises:
+            http.client.HTTPException: Si la respuesta es un error HTTP o se agotan los reintentos
+            OSError: Si no se puede conectar tras los reintentos
+        """
+        partes = urlsplit(url)
+        key = (partes.scheme, partes.netloc)
+        path = f"{partes.path}?{partes.query}" if partes.query else partes.path
+        
+        for attempt in range(self.max_retries + 1):
+            self.bucket.acquire_sync()
+            conn = self._conns.get(key)
+            if conn is None:
+                conn_class = http.client.HTTPSConnection if partes.scheme == 'https' else http.client.HTTPConnection
+                conn = self._conns[key] = conn_class(partes.netloc, timeout=30)
+            
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError):
+                # Conexión caída: se descarta y se abre otra en el siguiente intento
+                conn.close()
+                del self._conns[key]
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(self._retry_delay(attempt))
+                continue
+            
+            if response.will_close:
+                conn.close()
+                del self._conns[key]
+            
+            retry_after = None
+            if response.status == 429:
+                retry_after = self._on_rate_limited(response.getheader('Retry-After'))
+            
+            if response.status in self.RETRY_STATUSES and attempt < self.max_retries:
+                time.sleep(self._retry_delay(attempt, retry_after))
+                continue
+            
+            if response.status >= 400:
+                raise http.client.HTTPException(f"HTTP {response.status} {response.reason} para {url}")
+            self.bucket.increase_rate()
+            return body
     
     def reset_stats(self) -> None:
         """Reinicia las estadísticas de descarga."""
@@ -121,8 +211,37 @@ class PlayerBioScraper:
         """
         self.min_delay = min_delay
         self.max_delay = max_delay
+        mean_delay = (min_delay + max_delay) / 2
+        self.bucket = self._create_bucket(1.0 / mean_delay if mean_delay > 0 else float('inf'))
         print(f"⏱️  Delays configurados: {min_delay}-{max_delay} segundos")
     
+    def set_rate(self, rate: float, burst: float = 1.0) -> None:
+        """
+        Configura directamente el ritmo máximo de peticiones.
+        
+        Args:
+            rate (float): Peticiones por segundo
+            burst (float): Peticiones que se pueden hacer seguidas tras un tiempo sin pedir
+        """
+        self.bucket = self._create_bucket(rate, burst)
+        print(f"⏱️  Ritmo configurado: {rate:g} peticiones/segundo (ráfaga de {burst:g})")
+    
+    def _create_bucket(self, rate: float, burst: float = 1.0) -> TokenBucket:
+        """
+        Crea el token bucket que reparte el ritmo de peticiones.
+        
+        El ritmo configurado es el máximo: ante un 429 se reduce a la mitad y
+        con cada respuesta correcta vuelve a subir poco a poco hasta él.
+        
+        Args:
+            rate (float): Peticiones por segundo
+            burst (float): Tokens acumulables
+            
+        Returns:
+            TokenBucket: Limitador de ritmo de peticiones
+        """
+        return TokenBucket(rate=rate, capacity=burst, max_rate=rate)
+    
     def obtener_playerbio_json(self, torneo_id: str, player_id: str, competicion_name: str, referer: str = None) -> Dict:
         """
         Obtiene la biografía de un jugador desde la API.
@@ -142,16 +261,10 @@ class PlayerBioScraper:
         try:
             # Configurar referer
             if not referer:
-                referer_base = f'{self.base_url}/en_GB/soccer/'
-                safe_competition_name = quote(competicion_name)
-                referer = f"{referer_base}{safe_competition_name}/{torneo_id}/fixtures"
+                referer = self._build_referer_url(torneo_id, competicion_name)
             
             # Construir URL de la API
-            playerbio_url = (
-                f"{self.api_base_url}/{self.sdapi_outlet_key}/"
-                f"?prsn={player_id}"
-                f"&_rt=c&_fmt=jsonp&_lcl=en-gb&_clbk={self.callback_id}"
-            )
+            playerbio_url = self._build_playerbio_url(player_id)
             
             # Actualizar headers con referer
             headers = self.headers.copy()
@@ -160,32 +273,197 @@ class PlayerBioScraper:
             print(f"👤 API URL: {playerbio_url}")
             
             # Realizar petición
-            response = self.session.get(playerbio_url, headers=headers)
-            response.raise_for_status()
+            content = self._get_persistent(playerbio_url, headers)
             
             # Limpiar JSONP y extraer JSON puro
-            content = response.text
-            json_start = content.find('(') + 1
-            json_end = content.rfind(')')
+            return self._extract_json_from_jsonp(content)
             
-            if json_start <= 0 or json_end <= json_start:
-                raise Exception("No se pudo extraer JSON del response JSONP")
+        except (http.client.HTTPException, OSError) as e:
+            raise Exception(f"Error al realizar petición: {e}")
+        except json.JSONDecodeError as e:
+            raise Exception(f"Error al parsear JSON: {e}")
+        except Exception as e:
+            raise Exception(f"Error inesperado: {e}")
+    
+    async def _fetch_playerbio(self, client: httpx.AsyncClient, url: str) -> Dict:
+        """
+        Versión asíncrona de obtener_playerbio_json sobre un cliente httpx compartido.
+        
+        Reintenta ante 429, errores 5xx y fallos de conexión con las mismas
+        esperas que _get_persistent (ver _retry_delay); cada intento espera
+        su turno en el token bucket, que baja el ritmo ante un 429.
+        
+        Args:
+            client (httpx.AsyncClient): Cliente httpx de la temporada (con el referer)
+            url (str): URL de la API
             
-            playerbio_data = json.loads(content[json_start:json_end])
+        Returns:
+            Dict: Datos de biografía del jugador en formato JSON
             
-            return playerbio_data
+        Raises:
+            Exception: Si hay error en la petición o parsing
+        """
+        try:
+            for attempt in range(self.max_retries + 1):
+                await self.bucket.acquire()
+                try:
+                    response = await client.get(url)
+                except httpx.TransportError:
+                    if attempt >= self.max_retries:
+                        raise
+                    await asyncio.sleep(self._retry_delay(attempt))
+                    continue
+                
+                retry_after = None
+                if response.status_code == 429:
+                    retry_after = self._on_rate_limited(response.headers.get('Retry-After'))
+                
+                if response.status_code in self.RETRY_STATUSES and attempt < self.max_retries:
+                    await asyncio.sleep(self._retry_delay(attempt, retry_after))
+                    continue
+                
+                response.raise_for_status()
+                self.bucket.increase_rate()
+                return self._extract_json_from_jsonp(response.content)
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             raise Exception(f"Error al realizar petición: {e}")
         except json.JSONDecodeError as e:
             raise Exception(f"Error al parsear JSON: {e}")
-        except Exception as e:
-            raise Exception(f"Error inesperado: {e}")
+    
+    def _retry_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Calcula la espera antes de reintentar una petición.
+        
+        Si el servidor indicó Retry-After se espera exactamente eso (también
+        si es 0); si no, backoff exponencial (backoff_factor * 2^intento).
+        
+        Args:
+            attempt (int): Número de intento fallido (empezando en 0)
+            retry_after (float, optional): Segundos indicados por Retry-After
+            
+        Returns:
+            float: Segundos a esperar
+        """
+        if retry_after is not None:
+            return retry_after
+        return self.backoff_factor * 2 ** attempt
+    
+    def _on_rate_limited(self, retry_after: Optional[str]) -> Optional[float]:
+        """
+        Ajusta el token bucket tras un 429.
+        
+        Baja el ritmo y, si el servidor envía Retry-After, no entrega tokens
+        hasta que pase ese tiempo, así que el resto de descargas también
+        esperan.
+        
+        Args:
+            retry_after (str, optional): Valor de la cabecera Retry-After
+            
+        Returns:
+            Optional[float]: Segundos indicados por Retry-After (None si no hay)
+        """
+        self.bucket.decrease_rate()
+        if not retry_after:
+            return None
+        delay = parse_retry_after(retry_after)
+        if delay:
+            self.bucket.pause(delay)
+        return delay
+    
+    def _build_playerbio_url(self, player_id: str) -> str:
+        """
+        Construye la URL de la API para la biografía de un jugador.
+        
+        Args:
+            player_id (str): ID del jugador
+            
+        Returns:
+            str: URL de la API
+        """
+        return (
+            f"{self.api_base_url}/{self.sdapi_outlet_key}/"
+            f"?prsn={player_id}"
+            f"&_rt=c&_fmt=jsonp&_lcl=en-gb&_clbk={self.callback_id}"
+        )
+    
+    def _build_referer_url(self, torneo_id: str, competicion_name: str) -> str:
+        """
+        Construye la URL de referencia cuando no se indica una.
+        
+        Returns:
+            str: URL de referencia
+        """
+        referer_base = f'{self.base_url}/en_GB/soccer/'
+        safe_competition_name = quote(competicion_name)
+        return f"{referer_base}{safe_competition_name}/{torneo_id}/fixtures"
+    
+    def _extract_json_from_jsonp(self, content: Union[bytes, str]) -> Dict:
+        """
+        Extrae JSON puro de una respuesta JSONP.
+        
+        Trabaja sobre los bytes de la respuesta (sin decodificarlos) y parsea
+        el tramo entre paréntesis con orjson, si está instalado, sin copiarlo.
+        
+        Args:
+            content (Union[bytes, str]): Contenido de la respuesta JSONP
+            
+        Returns:
+            Dict: Datos JSON extraídos
+            
+        Raises:
+            Exception: Si no se puede extraer el JSON
+        """
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        
+        json_start = content.find(b'(') + 1
+        json_end = content.rfind(b')')
+        
+        if json_start <= 0 or json_end <= json_start:
+            raise Exception("No se pudo extraer JSON del response JSONP")
+        
+        return json_loads(memoryview(content)[json_start:json_end])
+    
+    def iter_squad_players(self, squads_json_path: str) -> Iterator[Tuple[Dict, str, str]]:
+        """
+        Recorre los jugadores del archivo squads.json sin pasar por pandas.
+        
+        Args:
+            squads_json_path (str): Ruta al archivo squads.json
+            
+        Yields:
+            Tuple[Dict, str, str]: Datos del jugador, nombre y id de su club
+            
+        Raises:
+            Exception: Si no se puede leer o procesar el archivo
+        """
+        try:
+            # Leer archivo squads.json
+            with open(squads_json_path, "rb") as f:
+                raw = json_loads(f.read())
+        except FileNotFoundError:
+            raise Exception(f"Archivo squads.json no encontrado: {squads_json_path}")
+        except json.JSONDecodeError as e:
+            raise Exception(f"Error al parsear squads.json: {e}")
+        
+        # Extraer jugadores de todos los equipos
+        if 'squad' not in raw:
+            raise Exception("No se encontró la clave 'squad' en el archivo")
+        
+        for club in raw["squad"]:
+            team_name = club.get("contestantClubName", "Unknown")
+            team_id = club.get("contestantId")
+            for player in club.get("person") or []:
+                yield player, team_name, team_id
     
     def extract_players_from_squads(self, squads_json_path: str) -> pd.DataFrame:
         """
         Extrae información de jugadores del archivo squads.json.
         
+        Se mantiene por compatibilidad; la descarga de biografías usa
+        directamente iter_squad_players.
+        
         Args:
             squads_json_path (str): Ruta al archivo squads.json
             
@@ -196,24 +474,10 @@ class PlayerBioScraper:
             Exception: Si no se puede leer o procesar el archivo
         """
         try:
-            # Leer archivo squads.json
-            with open(squads_json_path, "r", encoding="utf-8") as f:
-                raw = json.load(f)
-            
-            # Extraer jugadores de todos los equipos
-            if 'squad' not in raw:
-                raise Exception("No se encontró la clave 'squad' en el archivo")
-            
-            # Aplanar la lista de jugadores y traer info del club
-            players = pd.json_normalize(
-                raw["squad"],                      # lista de clubes
-                record_path=["person"],            # lista de jugadores dentro de cada club
-                meta=["contestantId",              # columnas que «suben» desde el club
-                      "contestantClubName"],       # nombre del club
-                errors='ignore'                    # ignorar si falta alguna clave
-            )
-
-            players = players.rename(columns={"contestantClubName": "Team", "contestantId": "TeamId"})
+            players = pd.DataFrame([
+                {**player, "TeamId": team_id, "Team": team_name}
+                for player, team_name, team_id in self.iter_squad_players(squads_json_path)
+            ])
             
             print(f"✅ Extraídos {len(players)} jugadores del archivo squads.json")
             
@@ -225,14 +489,10 @@ class PlayerBioScraper:
                 print(f"⚠️  Advertencia: Faltan columnas {missing_columns} en algunos jugadores")
                 # Rellenar con valores por defecto
                 for col in missing_columns:
-                    players[col] = players.get(col, 'Unknown')
+                    players[col] = 'Unknown'
             
             return players
             
-        except FileNotFoundError:
-            raise Exception(f"Archivo squads.json no encontrado: {squads_json_path}")
-        except json.JSONDecodeError as e:
-            raise Exception(f"Error al parsear squads.json: {e}")
         except Exception as e:
             raise Exception(f"Error procesando squads.json: {e}")
     
@@ -291,74 +551,30 @@ class PlayerBioScraper:
                 return False
             
             # Extraer jugadores del archivo squads.json
-            players = self.extract_players_from_squads(squads_json_path)
+            players = list(self.iter_squad_players(squads_json_path))
+            print(f"✅ Extraídos {len(players)} jugadores del archivo squads.json")
             
-            if players.empty:
+            if not players:
                 print(f"⚠️  No se encontraron jugadores en {squads_json_path}")
                 return False
             
             # Aplicar límite si se especifica (útil para testing)
             if limit_players and limit_players < len(players):
-                players = players.head(limit_players)
+                players = players[:limit_players]
                 print(f"🔒 Limitando a {limit_players} jugadores para testing")
             
             # Crear directorio para biografías de jugadores
             playersbio_dir = os.path.join(base_dir_path, 'playersbio')
             os.makedirs(playersbio_dir, exist_ok=True)
             
-            # Procesar cada jugador
-            players_exitosos = 0
-            players_saltados = 0
-            players_fallidos = 0
-            
+            # Procesar los jugadores de forma concurrente
             print(f"👤 Procesando biografías para {len(players)} jugadores...")
             
-            for idx, player_row in players.iterrows():
-                try:
-                    # Obtener información del jugador
-                    player_id = str(player_row.get("id", "unknown"))
-                    first_name = sanitize_dir_name(str(player_row.get("firstName", "Unknown")))
-                    last_name = sanitize_dir_name(str(player_row.get("lastName", "Unknown")))
-                    team_name = player_row.get("Team", "Unknown")
-                    
-                    # Construir nombre del archivo
-                    filename = f"{last_name}_{first_name}_{player_id}.json"
-                    player_json_path = os.path.join(playersbio_dir, filename)
-                    
-                    # Si el archivo ya existe y skip_existing es True, saltarlo
-                    if skip_existing and os.path.exists(player_json_path):
-                        print(f"  ⏭️  Jugador ya existe (saltando): {first_name} {last_name}")
-                        players_saltados += 1
-                        self.jugadores_saltados += 1
-                        continue
-                    
-                    # Obtener biografía del jugador
-                    print(f"  📖 Descargando bio ({idx+1}/{len(players)}): {first_name} {last_name} ({team_name})")
-                    playerbio_data = self.obtener_playerbio_json(
-                        torneo_id=torneo_id,
-                        player_id=player_id,
-                        competicion_name=competicion,
-                        referer=season_row['url_temporada']
-                    )
-                    
-                    # Guardar el JSON
-                    with open(player_json_path, 'w', encoding='utf-8') as f:
-                        json.dump(playerbio_data, f, ensure_ascii=False, indent=2)
-                    
-                    print(f"  ✅ Guardado: {filename}")
-                    players_exitosos += 1
-                    self.jugadores_exitosos += 1
-                    
-                    # Delay entre peticiones de jugadores
-                    delay = random.uniform(self.min_delay, self.max_delay)
-                    time.sleep(delay)
-                    
-                except Exception as e:
-                    print(f"  ❌ Error con jugador {player_row.get('firstName', 'N/A')} {player_row.get('lastName', 'N/A')}: {e}")
-                    players_fallidos += 1
-                    self.jugadores_fallidos += 1
-                
-                self.jugadores_procesados += 1
+            players_exitosos, players_saltados, players_fallidos = run_async(
+                self._save_playerbio_json_async(
+                    players, playersbio_dir, season_row['url_temporada'], skip_existing
+                )
+            )
             
             # Resumen de la temporada
             print(f"👤 Temporada completada: {players_exitosos} exitosos, {players_saltados} saltados, {players_fallidos} fallidos")
@@ -375,6 +591,146 @@ class PlayerBioScraper:
             self.fallos += 1
             return False
     
+    async def _save_playerbio_json_async(self,
+                                         players: List[Tuple[Dict, str, str]],
+                                         playersbio_dir: str,
+                                         referer: str,
+                                         skip_existing: bool = True) -> Tuple[int, int, int]:
+        """
+        Descarga de forma concurrente las biografías de los jugadores de una temporada.
+        
+        Los jugadores ya descargados se descartan antes de lanzar las
+        peticiones, y los que ya se guardaron en otra temporada durante esta
+        ejecución se copian de ese archivo en lugar de pedirlos de nuevo. El
+        resto comparte un cliente httpx con HTTP/2 (todas las peticiones van
+        al mismo host y llevan el mismo referer) y un semáforo limita las
+        descargas en vuelo; el ritmo lo marca el token bucket del scraper en
+        lugar de una espera fija por jugador. Los JSON se guardan a medida
+        que llegan.
+        
+        Args:
+            players (List[Tuple[Dict, str, str]]): Jugadores de la temporada con su club (ver iter_squad_players)
+            playersbio_dir (str): Directorio donde guardar las biografías
+            referer (str): URL de referencia de la temporada
+            skip_existing (bool): Si saltar archivos que ya existen
+            
+        Returns:
+            Tuple[int, int, int]: Jugadores exitosos, saltados y fallidos
+        """
+        players_exitosos = 0
+        players_saltados = 0
+        players_fallidos = 0
+        total = len(players)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        # Resolver el archivo de cada jugador y descartar los ya descargados
+        pendientes = []
+        vistos = set()
+        campos = {campo for player, _, _ in players for campo in _NAME_FIELDS if campo in player}
+        for idx, (player, team_name, _team_id) in enumerate(players):
+            # Obtener información del jugador
+            player_id, first_name, last_name = (
+                _filename_part(player, campo, campos) for campo in _NAME_FIELDS
+            )
+            first_name = sanitize_dir_name(first_name)
+            last_name = sanitize_dir_name(last_name)
+            
+            # Construir nombre del archivo
+            filename = f"{last_name}_{first_name}_{player_id}.json"
+            player_json_path = os.path.join(playersbio_dir, filename)
+            
+            # Un jugador que pasó por dos clubes aparece dos veces en squads.json
+            if player_json_path in vistos:
+                print(f"  ⏭️  Jugador repetido en otro club (saltando): {first_name} {last_name}")
+                players_saltados += 1
+                self.jugadores_saltados += 1
+                continue
+            vistos.add(player_json_path)
+            
+            # Si el archivo ya existe y skip_existing es True, saltarlo
+            if skip_existing and os.path.exists(player_json_path):
+                print(f"  ⏭️  Jugador ya existe (saltando): {first_name} {last_name}")
+                self._bio_paths.setdefault(player_id, player_json_path)
+                players_saltados += 1
+                self.jugadores_saltados += 1
+                continue
+            
+            # Si ya se descargó en otra temporada, copiar ese archivo
+            if self._reuse_playerbio(player_id, player_json_path):
+                print(f"  📋 Bio reutilizada de otra temporada: {first_name} {last_name}")
+                players_exitosos += 1
+                self.jugadores_exitosos += 1
+                self.jugadores_procesados += 1
+                continue
+            
+            pendientes.append((idx, player, team_name, player_id, first_name, last_name, player_json_path))
+        
+        async def _download(client: httpx.AsyncClient, idx: int, player: Dict, team_name: str,
+                            player_id: str, first_name: str, last_name: str,
+                            player_json_path: str) -> Tuple:
+            try:
+                async with semaphore:
+                    print(f"  📖 Descargando bio ({idx+1}/{total}): {first_name} {last_name} ({team_name})")
+                    playerbio_data = await self._fetch_playerbio(client, self._build_playerbio_url(player_id))
+                return player, player_id, player_json_path, playerbio_data, None
+            except Exception as e:
+                return player, player_id, player_json_path, None, e
+        
+        if pendientes:
+            limits = httpx.Limits(max_connections=max(20, self.max_concurrency),
+                                  max_keepalive_connections=10)
+            
+            async with httpx.AsyncClient(http2=True, limits=limits, timeout=30,
+                                         headers={**self.headers, 'Referer': referer}) as client:
+                tareas = [_download(client, *pendiente) for pendiente in pendientes]
+                
+                # Guardar cada biografía en cuanto llega
+                for tarea in asyncio.as_completed(tareas):
+                    player, player_id, player_json_path, playerbio_data, error = await tarea
+                    try:
+                        if error is not None:
+                            raise error
+                        
+                        # Guardar el JSON
+                        with open(player_json_path, 'wb') as f:
+                            f.write(json_dumps_bytes(playerbio_data))
+                        
+                        self._bio_paths[player_id] = player_json_path
+                        print(f"  ✅ Guardado: {os.path.basename(player_json_path)}")
+                        players_exitosos += 1
+                        self.jugadores_exitosos += 1
+                        
+                    except Exception as e:
+                        print(f"  ❌ Error con jugador {player.get('firstName', 'N/A')} {player.get('lastName', 'N/A')}: {e}")
+                        players_fallidos += 1
+                        self.jugadores_fallidos += 1
+                    
+                    self.jugadores_procesados += 1
+        
+        return players_exitosos, players_saltados, players_fallidos
+    
+    def _reuse_playerbio(self, player_id: str, player_json_path: str) -> bool:
+        """
+        Copia la biografía de un jugador ya guardada en otra temporada.
+        
+        Args:
+            player_id (str): ID del jugador
+            player_json_path (str): Ruta donde guardar la biografía
+            
+        Returns:
+            bool: True si se copió, False si hay que descargarla
+        """
+        origen = self._bio_paths.get(player_id)
+        if origen is None or origen == player_json_path:
+            return False
+        try:
+            shutil.copyfile(origen, player_json_path)
+        except OSError:
+            # El archivo de origen ya no está: se olvida y se descarga
+            del self._bio_paths[player_id]
+            return False
+        return True
+    
     def process_seasons(self, 
                        df_seasons: pd.DataFrame,
                        filters: Optional[Dict] = None,
@@ -417,7 +773,7 @@ class PlayerBioScraper:
                 print(f"   - Temporadas después de filtros: {len(df_filtered)}")
             print(f"   - Temporadas a procesar: {len(df_to_process)}")
             print(f"   - Rango: {start_index} a {end_index-1}")
-            print(f"   - Delay entre jugadores: {self.min_delay}-{self.max_delay} segundos")
+            print(f"   - Ritmo máximo: {self.bucket.max_rate:.2f} peticiones/segundo")
             if limit_players_per_season:
                 print(f"   - Límite jugadores por temporada: {limit_players_per_season}")
             print(f"   ⚠️  Requiere archivos squads.json previos")
@@ -714,8 +1070,6 @@ def smart_download_player_bio(df_seasons: pd.DataFrame,
         ⚠️ CUIDADO: Sin límites, este proceso puede tomar HORAS o DÍAS.
         Requiere que los archivos squads.json hayan sido descargados previamente.
     """
-    import shutil
-    
     # Crear filtros
     filters = {}
     if continente:
@@ -10,12 +10,27 @@ Autor: Tu nombre
 Fecha: Julio 2025
 """
 
+import asyncio
+import json
 import random
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse, unquote
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Patrón del ID del torneo en URLs de fixtures
+_TORNEO_ID_RE = re.compile(r'soccer/[^/]+/([^/]+)/fixtures')
+
 def random_sleep_time():
     """
     Genera un tiempo de espera aleatorio para simular comportamiento humano.
@@ -29,6 +44,214 @@ def random_sleep_time():
     """
     return random.uniform(3, 6)
 
+def run_async(coro):
+    """
+    Ejecuta una corrutina desde código síncrono y devuelve su resultado.
+    
+    En un notebook de Jupyter ya hay un event loop corriendo y asyncio.run()
+    falla; en ese caso la corrutina se ejecuta en un hilo aparte con su
+    propio event loop.
+    
+    Args:
+        coro (Coroutine): Corrutina a ejecutar
+        
+    Returns:
+        Any: Resultado de la corrutina
+        
+    Example:
+        >>> stats = run_async(scraper._process_rows_async(rows, stats))
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+class RateLimited(Exception):
+    """
+    La API respondió 429 (Too Many Requests).
+    
+    Attributes:
+        retry_after (float): Segundos de espera indicados por el servidor
+    """
+    
+    def __init__(self, retry_after=0.0):
+        super().__init__(f"Límite de peticiones alcanzado (Retry-After: {retry_after:.0f}s)")
+        self.retry_after = retry_after
+
+def parse_retry_after(value):
+    """
+    Convierte la cabecera Retry-After a segundos.
+    
+    Acepta tanto un número de segundos como una fecha HTTP.
+    
+    Args:
+        value (str or None): Valor de la cabecera
+        
+    Returns:
+        float: Segundos a esperar (0 si no se puede interpretar)
+    """
+    if not value:
+        return 0.0
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+def retry_after_wait(backoff):
+    """
+    Crea una estrategia de espera para tenacity que respeta Retry-After.
+    
+    Ante un RateLimited espera el mayor entre el Retry-After y el backoff,
+    más un jitter de hasta medio segundo; en otro caso usa el backoff.
+    
+    Args:
+        backoff (Callable): Estrategia de espera base (p. ej. wait_random_exponential)
+        
+    Returns:
+        Callable: Estrategia de espera para AsyncRetrying/Retrying
+    """
+    def wait(retry_state):
+        delay = backoff(retry_state)
+        exc = retry_state.outcome.exception()
+        if isinstance(exc, RateLimited):
+            delay = max(exc.retry_after, delay) + random.random() * 0.5
+        return delay
+    return wait
+
+class TokenBucket:
+    """
+    Token bucket adaptativo para limitar el ritmo de peticiones.
+    
+    Sube el ritmo poco a poco mientras las respuestas son exitosas y lo
+    reduce a la mitad ante un 429, de modo que converge al cupo real del
+    servidor sin ajustar delays a mano. Se usa desde un único hilo/event loop.
+    
+    Attributes:
+        rate (float): Peticiones por segundo actuales
+        tokens (float): Tokens disponibles
+        capacity (float): Ráfaga máxima de tokens acumulables
+        last_refill (float): Instante (monotonic) de la última recarga
+    """
+    
+    def __init__(self, rate=1.0, capacity=1.0, min_rate=0.1, max_rate=20.0):
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate = min(max(rate, min_rate), max_rate)
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+    
+    def _take(self):
+        """
+        Intenta consumir un token.
+        
+        Returns:
+            float: 0 si se consumió, o los segundos a esperar hasta el próximo token
+        """
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+    
+    async def acquire(self):
+        """Espera (sin bloquear el event loop) hasta obtener un token."""
+        while (wait := self._take()) > 0:
+            await asyncio.sleep(wait)
+    
+    def acquire_sync(self):
+        """Versión bloqueante de acquire para código síncrono."""
+        while (wait := self._take()) > 0:
+            time.sleep(wait)
+    
+    def increase_rate(self, alpha=1.1, delta=0.1):
+        """
+        Sube el ritmo tras una respuesta exitosa.
+        
+        Crece de forma multiplicativa con ritmos bajos y aditiva con ritmos
+        altos (el menor de rate*alpha y rate+delta), sin pasar de max_rate.
+        
+        Args:
+            alpha (float): Factor de crecimiento
+            delta (float): Incremento máximo en peticiones por segundo
+        """
+        self.rate = min(self.max_rate, min(self.rate * alpha, self.rate + delta))
+    
+    def decrease_rate(self, beta=0.5):
+        """
+        Reduce el ritmo tras un 429 y vacía el bucket.
+        
+        Args:
+            beta (float): Factor de reducción
+        """
+        self.rate = max(self.min_rate, self.rate * beta)
+        self.tokens = 0.0
+        self.last_refill = time.monotonic()
+    
+    def pause(self, seconds):
+        """
+        Retrasa el próximo token los segundos indicados (p. ej. un Retry-After).
+        
+        Args:
+            seconds (float): Segundos sin entregar tokens
+        """
+        self._refill()
+        self.tokens = min(self.tokens, 0.0) - seconds * self.rate
+
+def json_loads(data):
+    """
+    Parsea un documento JSON usando orjson si está instalado.
+    
+    orjson acepta tanto str como bytes y es bastante más rápido que el
+    módulo json estándar, que se usa como alternativa.
+    
+    Args:
+        data (str | bytes | memoryview): Documento JSON
+        
+    Returns:
+        Any: Objeto Python resultante
+        
+    Raises:
+        json.JSONDecodeError: Si el documento no es JSON válido
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+def json_dumps_bytes(obj, indent=True):
+    """
+    Serializa un objeto a JSON en UTF-8 usando orjson si está instalado.
+    
+    Args:
+        obj (Any): Objeto a serializar
+        indent (bool): Si indentar con 2 espacios
+        
+    Returns:
+        bytes: Documento JSON codificado en UTF-8
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+@lru_cache(maxsize=2048)
 def sanitize_dir_name(name):
     """
     Limpia un nombre para que sea válido como nombre de directorio.
@@ -36,6 +259,9 @@ def sanitize_dir_name(name):
     Reemplaza caracteres problemáticos que no son permitidos en nombres
     de archivos o directorios en diferentes sistemas operativos.
     
+    El resultado se memoiza: continentes, países y competiciones se repiten
+    en miles de filas.
+    
     Args:
         name (str): Nombre a limpiar
         
@@ -65,12 +291,14 @@ def sanitize_dir_name(name):
     return clean_name
 
 
+@lru_cache(maxsize=8192)
 def get_torneo_id(url):
     """
     Extrae el ID del torneo de una URL de temporada.
     
     Modifica la URL cambiando 'results' por 'fixtures' y extrae
-    el identificador del torneo usando expresiones regulares.
+    el identificador del torneo usando expresiones regulares. El resultado
+    se memoriza porque la misma URL se consulta en varias pasadas.
     
     Args:
         url (str): URL de la página de resultados del torneo
@@ -88,7 +316,7 @@ def get_torneo_id(url):
         url = url.replace('results', 'fixtures')
         
         # Buscar el patrón del ID del torneo
-        fixture_url = re.search(r'soccer/[^/]+/([^/]+)/fixtures', url)
+        fixture_url = _TORNEO_ID_RE.search(url)
         
         if fixture_url:
             torneo_id = fixture_url.group(1)
@@ -100,12 +328,14 @@ def get_torneo_id(url):
     return None
 
 
+@lru_cache(maxsize=8192)
 def get_season_name_from_url(url):
     """
     Extrae el nombre de la temporada de una URL de resultados.
     
     Analiza la estructura de la URL y extrae el nombre de la temporada,
-    decodificando caracteres especiales si es necesario.
+    decodificando caracteres especiales si es necesario. El resultado se
+    memoriza porque la misma URL se consulta en varias pasadas.
     
     Args:
         url (str): URL de la página de resultados